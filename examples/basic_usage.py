@@ -2,23 +2,35 @@
 """Basic usage example for Maestrai."""
 
 import sys
+import argparse
 from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add parent directory to path when run as a file from a source checkout
+# (not needed with `python -m` or when the package is installed)
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.transcription_engine import TranscriptionEngine
+from src.utils.config import Config
 
 
 def main():
     """Demonstrate basic transcription usage."""
+    parser = argparse.ArgumentParser(description="Maestrai basic usage example")
+    parser.add_argument(
+        "--compute-type",
+        default=Config.COMPUTE_TYPE,
+        choices=Config.AVAILABLE_COMPUTE_TYPES,
+        help="Model weight precision (default: auto)",
+    )
+    args = parser.parse_args()
 
     print("Maestrai - Basic Usage Example")
     print("=" * 60)
 
     # Initialize the transcription engine with base model
     print("\n1. Initializing transcription engine...")
-    engine = TranscriptionEngine(model_name="base")
+    engine = TranscriptionEngine(model_name="base", compute_type=args.compute_type)
     print("   Engine initialized successfully!")
 
     # Check model info
@@ -26,6 +38,7 @@ def main():
     info = engine.get_model_info()
     print(f"   Model: {info['model_name']}")
     print(f"   Device: {info['device']}")
+    print(f"   Compute Type: {info['compute_type']}")
     print(f"   CUDA Available: {info['cuda_available']}")
     print(f"   Supported Languages: {info['supported_languages']}")
 
@@ -40,7 +53,7 @@ def main():
         result = engine.transcribe(
             audio_file,
             language=None,  # Auto-detect language
-            word_timestamps=True,
+            word_timestamps=False,  # Segment times are enough; word alignment is slower
         )
 
         print("\n4. Transcription Results:")
@@ -1,46 +1,126 @@
 #!/usr/bin/env python3
 """Batch processing example for Maestrai."""
 
+import os
 import sys
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Iterator, List, Tuple
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import numpy as np
+import torch
 
-from src.transcription_engine import TranscriptionEngine
+# Add parent directory to path when run as a file from a source checkout
+# (not needed with `python -m` or when the package is installed)
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.audio_processor import AudioProcessor
+from src.transcription_engine import TranscriptionEngine, TranscriptionResult
+from src.utils.config import Config
+from src.utils.file_writer import write_many_checked
+
+
+def _iter_audio_files(root: str | Path, extensions: set[str]) -> Iterator[Tuple[str, int, float]]:
+    """Recursively yield (path, size, mtime) for files with matching extensions.
+
+    os.scandir returns the file type with each entry, and DirEntry.stat() caches
+    its result, so each file costs at most one stat call.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_audio_files(entry.path, extensions)
+            elif os.path.splitext(entry.name)[1].lower() in extensions:
+                stat = entry.stat()
+                yield entry.path, stat.st_size, stat.st_mtime
+
+
+def transcribe_shard(audio_files: List[str], device: str | None = None) -> List[TranscriptionResult]:
+    """Transcribe a list of files with one engine on a single device."""
+    engine = TranscriptionEngine(model_name="base", device=device)
+    return engine.transcribe_batch(
+        audio_files,
+        batch_size=16,  # Opt into batched decoding: faster, one segment per 30 s window
+        language=None,  # Auto-detect
+        word_timestamps=False,  # Word alignment requires per-file decoding
+    )
 
 
 def main():
     """Demonstrate batch transcription of multiple files."""
+    parser = argparse.ArgumentParser(description="Maestrai batch processing example")
+    parser.add_argument(
+        "--input-dir",
+        help="Transcribe every matching file under this directory (recursively)",
+    )
+    parser.add_argument(
+        "--ext",
+        default=",".join(Config.get_supported_formats()),
+        help="Comma-separated extensions to pick up with --input-dir (default: all supported)",
+    )
+    args = parser.parse_args()
 
     print("Maestrai - Batch Processing Example")
     print("=" * 60)
 
-    # List of audio files to transcribe
-    # NOTE: Replace with your actual audio file paths
-    audio_files = [
-        "path/to/audio1.mp3",
-        "path/to/audio2.wav",
-        "path/to/audio3.m4a",
-    ]
+    if args.input_dir:
+        extensions = {
+            ext if ext.startswith(".") else f".{ext}"
+            for ext in (e.strip().lower() for e in args.ext.split(","))
+            if ext
+        }
+        # Largest files first, so the per-GPU shards below get similar amounts of audio
+        found = sorted(_iter_audio_files(args.input_dir, extensions), key=lambda f: -f[1])
+        audio_files = [path for path, _, _ in found]
+    else:
+        # List of audio files to transcribe
+        # NOTE: Replace with your actual audio file paths, or use --input-dir
+        audio_files = [
+            "path/to/audio1.mp3",
+            "path/to/audio2.wav",
+            "path/to/audio3.m4a",
+        ]
 
     print(f"\n1. Processing {len(audio_files)} audio files...")
 
-    # Initialize engine
-    print("   Initializing transcription engine...")
-    engine = TranscriptionEngine(model_name="base")
-
-    # Batch transcribe
-    print("\n2. Starting batch transcription...")
-    results = engine.transcribe_batch(
-        audio_files,
-        language=None,  # Auto-detect
-        word_timestamps=True,
-    )
+    # Validate all inputs up front (ffprobe runs concurrently for every file)
+    print("   Validating input files...")
+    probes = AudioProcessor().validate_and_info_many(audio_files)
+    for audio_file, (is_valid, info_or_error) in zip(audio_files, probes):
+        if not is_valid:
+            print(f"   Skipping {audio_file}: {info_or_error}")
+    audio_files = [f for f, (is_valid, _) in zip(audio_files, probes) if is_valid]
+
+    if not audio_files:
+        print("\n⚠️  No valid audio files to process.")
+        print("   Pass --input-dir or update the 'audio_files' list in this script.")
+        return
+
+    # Batch transcribe (windows from all files are decoded together on the GPU).
+    # With several GPUs, each one gets its own process, engine and shard of files.
+    num_gpus = torch.cuda.device_count()
+    if num_gpus > 1:
+        print(f"\n2. Starting batch transcription on {num_gpus} GPUs...")
+        shards = [audio_files[i::num_gpus] for i in range(num_gpus)]
+        with ProcessPoolExecutor(
+            max_workers=num_gpus, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            futures = [
+                executor.submit(transcribe_shard, shard, f"cuda:{i}")
+                for i, shard in enumerate(shards)
+                if shard
+            ]
+            results = [result for future in futures for result in future.result()]
+    else:
+        print("\n2. Starting batch transcription...")
+        results = transcribe_shard(audio_files)
 
     print(f"\n3. Batch Results: {len(results)}/{len(audio_files)} successful")
 
-    # Process each result
+    # Show each result
     for i, result in enumerate(results, 1):
         print(f"\n--- File {i} ---")
         print(f"Language: {result.language}")
@@ -48,29 +128,35 @@ def main():
         print(f"Words: {result.word_count}")
         print(f"Preview: {result.text[:100]}...")
 
-        # Export each result
-        audio_path = Path(audio_files[i - 1])
-        srt_path = audio_path.with_suffix(".srt")
-        txt_path = audio_path.with_suffix(".txt")
-
-        try:
-            engine.export_srt(result, srt_path)
-            engine.export_txt(result, txt_path)
-            print(f"Exported: {srt_path.name}, {txt_path.name}")
-        except Exception as e:
-            print(f"Export failed: {e}")
+    # Render all SRT/TXT documents, then write them in one batched pass
+    outputs = []
+    for result in results:
+        audio_path = Path(result.metadata["source_file"])
+        srt = TranscriptionEngine.render_srt(result)
+        txt = TranscriptionEngine.render_txt(result)
+        outputs.append((audio_path.with_suffix(".srt"), srt.encode("utf-8")))
+        outputs.append((audio_path.with_suffix(".txt"), txt.encode("utf-8")))
+
+    for path, error in write_many_checked(outputs):
+        if error is None:
+            print(f"Exported: {path.name}")
+        else:
+            print(f"Export failed for {path.name}: {error}")
 
     print("\n✅ Batch processing completed!")
 
-    # Summary statistics
-    total_duration = sum(r.duration for r in results)
-    total_words = sum(r.word_count for r in results)
+    if not results:
+        return
+
+    # Summary statistics (one pass over the results into flat arrays)
+    durations = np.fromiter((r.duration for r in results), dtype=np.float64, count=len(results))
+    words = np.fromiter((r.word_count for r in results), dtype=np.int64, count=len(results))
 
     print("\n4. Summary Statistics:")
     print(f"   Total files processed: {len(results)}")
-    print(f"   Total audio duration: {total_duration:.2f}s")
-    print(f"   Total words transcribed: {total_words}")
-    print(f"   Average words per file: {total_words / len(results):.0f}")
+    print(f"   Total audio duration: {durations.sum():.2f}s")
+    print(f"   Total words transcribed: {words.sum()}")
+    print(f"   Average words per file: {words.mean():.0f}")
 
 
 if __name__ == "__main__":
@@ -4,8 +4,10 @@
 import sys
 from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add parent directory to path when run as a file from a source checkout
+# (not needed with `python -m` or when the package is installed)
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.transcription_engine import TranscriptionEngine
 from src.audio_processor import AudioProcessor
@@ -60,7 +62,7 @@ def main():
         result = engine.transcribe(
             video_file,
             language=None,  # Auto-detect
-            word_timestamps=True,
+            word_timestamps=False,  # Subtitles only need segment times
         )
 
         print("\n6. Transcription Results:")
@@ -106,9 +108,6 @@ def main():
         print("   with the path to your actual video file.")
     except Exception as e:
         print(f"\n❌ Error: {e}")
-    finally:
-        # Cleanup temporary files
-        processor.cleanup_temp_files()
 
 
 if __name__ == "__main__":
@@ -2,11 +2,14 @@
 """Interactive demo script for Maestrai Audio Transcription Service."""
 
 import sys
+import json
 import logging
 from pathlib import Path
 import argparse
 import ssl
+from typing import Dict
 import certifi
+import torch
 
 # Fix SSL certificate issues for Whisper model downloads
 # This is a common issue on macOS where Python's SSL certificates may not be properly installed
@@ -19,20 +22,44 @@ except Exception:
     print("⚠️  SSL certificate verification disabled (unable to use certifi)")
     ssl._create_default_https_context = ssl._create_unverified_context
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add parent directory to path when run as a file from a source checkout
+# (not needed with `python -m` or when the package is installed)
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.transcription_engine import TranscriptionEngine
 from src.audio_processor import AudioProcessor
 from src.utils.config import Config
+from scripts.maestrai_daemon import request_transcription
+
+# Remembers choices made in the interactive wizard between runs
+DEMO_CONFIG_PATH = Path.home() / ".maestrai" / "demo.json"
+
+# Drop idle models before loading another when less GPU memory than this is free
+MIN_FREE_GPU_FRACTION = 0.25
 
 
 class TranscriptionDemo:
     """Interactive demo for the transcription service."""
 
-    def __init__(self):
-        """Initialize the demo."""
-        self.engine = None
+    def __init__(
+        self,
+        reconfigure: bool = False,
+        compute_type: str = Config.COMPUTE_TYPE,
+        word_timestamps: bool = False,
+    ):
+        """Initialize the demo.
+
+        Args:
+            reconfigure: Ignore saved choices and run the setup wizard again
+            compute_type: Model weight precision passed to the engine
+            word_timestamps: Also align individual words (slower)
+        """
+        self._engines: Dict[str, TranscriptionEngine] = {}
+        self.reconfigure = reconfigure
+        self.compute_type = compute_type
+        self.word_timestamps = word_timestamps
+        self.config = self._load_config()
         self.processor = AudioProcessor()
         # Output directory relative to project root
         self.output_dir = Path(__file__).parent.parent / "output"
@@ -45,12 +72,41 @@ class TranscriptionDemo:
         print("  Powered by OpenAI Whisper")
         print("=" * 80 + "\n")
 
+    def _load_config(self) -> dict:
+        """Load saved wizard choices.
+
+        Returns:
+            Saved settings, or an empty dict if none are available
+        """
+        try:
+            with open(DEMO_CONFIG_PATH, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_config(self) -> None:
+        """Persist wizard choices for the next run."""
+        try:
+            DEMO_CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with open(DEMO_CONFIG_PATH, "w", encoding="utf-8") as f:
+                json.dump(self.config, f, indent=2)
+        except OSError as e:
+            print(f"⚠️  Could not save settings: {e}")
+
     def select_model(self) -> str:
         """Interactive model selection wizard.
 
+        The previously selected model is reused without prompting unless the
+        demo was started with --reconfigure.
+
         Returns:
             Selected model name
         """
+        saved_model = self.config.get("model")
+        if not self.reconfigure and saved_model in Config.AVAILABLE_MODELS:
+            print(f"ℹ️  Using saved model: {saved_model} (run with --reconfigure to change)")
+            return saved_model
+
         print("Select a Whisper model:")
         print("-" * 40)
 
@@ -79,6 +135,8 @@ class TranscriptionDemo:
                 if 1 <= choice_num <= len(Config.AVAILABLE_MODELS):
                     selected_model = Config.AVAILABLE_MODELS[choice_num - 1]
                     print(f"\nℹ️  Selected model: {selected_model}")
+                    self.config["model"] = selected_model
+                    self._save_config()
                     return selected_model
                 else:
                     print(f"Please enter a number between 1 and {len(Config.AVAILABLE_MODELS)}")
@@ -124,6 +182,32 @@ class TranscriptionDemo:
             print(f"⚠️  Could not retrieve audio info: {e}")
             return False
 
+    def get_engine(self, model_name: str) -> TranscriptionEngine:
+        """Return a loaded engine for the model, reusing one loaded earlier.
+
+        Previously loaded models are released first if GPU memory is running low.
+
+        Args:
+            model_name: Whisper model name
+
+        Returns:
+            TranscriptionEngine for the model
+        """
+        if model_name in self._engines:
+            return self._engines[model_name]
+
+        if self._engines and torch.cuda.is_available():
+            free, total = torch.cuda.mem_get_info()
+            if free / total < MIN_FREE_GPU_FRACTION:
+                self._engines.clear()
+                torch.cuda.empty_cache()
+
+        print(f"ℹ️  Loading {model_name} model...")
+        engine = TranscriptionEngine(model_name=model_name, compute_type=self.compute_type)
+        print("✅ Model loaded successfully")
+        self._engines[model_name] = engine
+        return engine
+
     def run_transcription(self, file_path: str, model_name: str):
         """Run transcription with progress indicators.
 
@@ -135,63 +219,83 @@ class TranscriptionDemo:
         print("TRANSCRIPTION")
         print("=" * 80)
 
-        # Initialize engine
-        print(f"\nℹ️  Loading {model_name} model...")
-        try:
-            self.engine = TranscriptionEngine(model_name=model_name)
-            print("✅ Model loaded successfully")
-        except Exception as e:
-            print(f"❌ Failed to load model: {e}")
-            return
-
-        # Run transcription
         print("\nℹ️  Starting transcription...")
         print("   (This may take a while depending on audio length and model size)")
         print()
 
+        # Prefer a running daemon, which keeps the model loaded between runs
         try:
-            result = self.engine.transcribe(file_path, word_timestamps=True)
-            print("✅ Transcription completed!")
-
-            self.display_results(result)
-            self.export_results(result, file_path)
-
+            result = request_transcription(
+                file_path,
+                model_name,
+                word_timestamps=self.word_timestamps,
+                compute_type=self.compute_type,
+            )
         except Exception as e:
             print(f"❌ Transcription failed: {e}")
             return
 
+        if result is None:
+            # Initialize engine (reused if this model was loaded before)
+            try:
+                engine = self.get_engine(model_name)
+            except Exception as e:
+                print(f"❌ Failed to load model: {e}")
+                return
+
+            try:
+                result = engine.transcribe(file_path, word_timestamps=self.word_timestamps)
+            except Exception as e:
+                print(f"❌ Transcription failed: {e}")
+                return
+        else:
+            print("ℹ️  Transcribed by running daemon")
+
+        print("✅ Transcription completed!")
+
+        self.display_results(result)
+        self.export_results(result, file_path)
+
     def display_results(self, result):
         """Display transcription results.
 
         Args:
             result: TranscriptionResult object
         """
-        print("\n" + "=" * 80)
-        print("RESULTS")
-        print("=" * 80)
-
-        print(f"\nℹ️  Summary:")
-        print(f"   Language: {result.language}")
-        print(f"   Duration: {result.duration:.2f} seconds")
-        print(f"   Segments: {len(result.segments)}")
-        print(f"   Words: {result.word_count}")
-
-        print(f"\n📝 Full Transcription:")
-        print("-" * 40)
-        print(result.text)
-        print("-" * 40)
+        lines = [
+            "",
+            "=" * 80,
+            "RESULTS",
+            "=" * 80,
+            "",
+            "ℹ️  Summary:",
+            f"   Language: {result.language}",
+            f"   Duration: {result.duration:.2f} seconds",
+            f"   Segments: {len(result.segments)}",
+            f"   Words: {result.word_count}",
+            "",
+            "📝 Full Transcription:",
+            "-" * 40,
+            result.text,
+            "-" * 40,
+            "",
+            # Show first few segments with details
+            "📊 Segment Details (showing first 3):",
+        ]
 
-        # Show first few segments with details
-        print(f"\n📊 Segment Details (showing first 3):")
         for i, segment in enumerate(result.segments[:3], 1):
-            print(f"\nSegment {i}:")
-            print(f"  Time: {segment.start:.2f}s - {segment.end:.2f}s")
-            print(f"  Text: {segment.text}")
+            lines.append(f"\nSegment {i}:")
+            lines.append(f"  Time: {segment.start:.2f}s - {segment.end:.2f}s")
+            lines.append(f"  Text: {segment.text}")
             if segment.words:
-                print(f"  Words: {len(segment.words)}")
+                lines.append(f"  Words: {len(segment.words)}")
 
         if len(result.segments) > 3:
-            print(f"\n... and {len(result.segments) - 3} more segments")
+            lines.append(f"\n... and {len(result.segments) - 3} more segments")
+
+        # Emit the whole section in a single write; long transcripts otherwise
+        # pay for many small writes to the terminal
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def export_results(self, result, original_file: str):
         """Export results to SRT and TXT files.
@@ -212,7 +316,7 @@ class TranscriptionDemo:
         # Export SRT
         srt_path = self.output_dir / f"{base_name}.srt"
         try:
-            self.engine.export_srt(result, srt_path)
+            TranscriptionEngine.export_srt(result, srt_path)
             print(f"SRT exported to: {srt_path}")
         except Exception as e:
             print(f"SRT export failed: {e}")
@@ -220,7 +324,7 @@ class TranscriptionDemo:
         # Export TXT
         txt_path = self.output_dir / f"{base_name}.txt"
         try:
-            self.engine.export_txt(result, txt_path)
+            TranscriptionEngine.export_txt(result, txt_path)
             print(f"Text exported to: {txt_path}")
         except Exception as e:
             print(f"Text export failed: {e}")
@@ -310,6 +414,10 @@ Examples:
   Quick mode:
     python demo.py audio.mp3
     python demo.py video.mp4 --model small
+
+  Keep models loaded between runs:
+    python maestrai_daemon.py &
+    python demo.py audio.mp3
         """,
     )
 
@@ -327,6 +435,25 @@ Examples:
         help="Whisper model to use (default: base)",
     )
 
+    parser.add_argument(
+        "--compute-type",
+        default=Config.COMPUTE_TYPE,
+        choices=Config.AVAILABLE_COMPUTE_TYPES,
+        help="Model weight precision (default: auto, float16 on CUDA and float32 on CPU)",
+    )
+
+    parser.add_argument(
+        "--word-timestamps",
+        action="store_true",
+        help="Also compute word-level timestamps (slower)",
+    )
+
+    parser.add_argument(
+        "--reconfigure",
+        action="store_true",
+        help="Ignore saved interactive settings and run the setup wizard again",
+    )
+
     parser.add_argument(
         "-v",
         "--verbose",
@@ -344,7 +471,11 @@ Examples:
     )
 
     # Create demo instance
-    demo = TranscriptionDemo()
+    demo = TranscriptionDemo(
+        reconfigure=args.reconfigure,
+        compute_type=args.compute_type,
+        word_timestamps=args.word_timestamps,
+    )
 
     try:
         if args.file:
@@ -364,10 +495,6 @@ Examples:
 
             traceback.print_exc()
         sys.exit(1)
-    finally:
-        # Cleanup
-        if hasattr(demo, "processor"):
-            demo.processor.cleanup_temp_files()
 
 
 if __name__ == "__main__":
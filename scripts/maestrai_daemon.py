@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""Resident transcription daemon for Maestrai.
+
+Keeps Whisper models and the Basic Pitch music pipeline loaded between runs so
+repeated demo invocations skip model loading and only pay for inference.
+
+Usage:
+    python scripts/maestrai_daemon.py &
+    python scripts/demo.py audio.mp3          # transcribed by the daemon
+    python scripts/music_demo.py song.mp3     # music transcribed by the daemon
+"""
+
+import os
+import sys
+import logging
+import argparse
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+from multiprocessing.connection import Client, Listener
+
+# Add parent directory to path when run as a file from a source checkout
+# (not needed with `python -m` or when the package is installed)
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.config import Config
+
+# Engines are imported on first use so that clients importing the request
+# helpers (and a music-only daemon) do not load torch and Whisper
+if TYPE_CHECKING:
+    from scripts.music_demo import MusicTranscriptionDemo
+    from src.transcription_engine import TranscriptionEngine, TranscriptionResult
+
+logger = logging.getLogger(__name__)
+
+
+class TranscriptionDaemon:
+    """Serves transcription requests over a Unix domain socket."""
+
+    def __init__(self, socket_path: str | Path = Config.DAEMON_SOCKET):
+        """Initialize the daemon.
+
+        Args:
+            socket_path: Path of the Unix domain socket to listen on
+        """
+        self.socket_path = Path(socket_path)
+        self.engines: Dict[Tuple[str, str], "TranscriptionEngine"] = {}
+        self.music_demos: Dict[Tuple[int, str], "MusicTranscriptionDemo"] = {}
+
+    def get_engine(
+        self, model_name: str, compute_type: str = Config.COMPUTE_TYPE
+    ) -> "TranscriptionEngine":
+        """Return a loaded engine for the model, loading it on first use.
+
+        Args:
+            model_name: Whisper model name
+            compute_type: Model weight precision
+
+        Returns:
+            TranscriptionEngine for the model
+        """
+        from src.transcription_engine import TranscriptionEngine
+
+        key = (model_name, compute_type)
+        if key not in self.engines:
+            logger.info(f"Loading model '{model_name}' ({compute_type})")
+            self.engines[key] = TranscriptionEngine(
+                model_name=model_name, compute_type=compute_type
+            )
+        return self.engines[key]
+
+    def get_music_demo(self, sample_rate: int, device: str) -> "MusicTranscriptionDemo":
+        """Return a music pipeline with its engines loaded, loading it on first use.
+
+        Args:
+            sample_rate: Sample rate audio is decoded at for analysis
+            device: Basic Pitch inference device
+
+        Returns:
+            MusicTranscriptionDemo collecting JSON summaries
+        """
+        from scripts.music_demo import MusicTranscriptionDemo
+
+        key = (sample_rate, device)
+        if key not in self.music_demos:
+            logger.info(f"Loading music engines (sr={sample_rate}, device={device})")
+            demo = MusicTranscriptionDemo(sample_rate=sample_rate, json_output=True, device=device)
+            if not demo.initialize_engines():
+                raise RuntimeError("Failed to initialize music engines")
+            self.music_demos[key] = demo
+        return self.music_demos[key]
+
+    def handle_music(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Analyze, transcribe and export one file with the music pipeline.
+
+        Args:
+            request: Dict with 'file', and optionally 'sample_rate', 'device'
+                and 'use_cache'
+
+        Returns:
+            The file's JSON summary, as produced by ``music_demo.py --json``
+        """
+        from scripts.music_demo import DEFAULT_SAMPLE_RATE
+
+        demo = self.get_music_demo(
+            request.get("sample_rate", DEFAULT_SAMPLE_RATE), request.get("device", "cpu")
+        )
+        demo.use_cache = request.get("use_cache", True)
+        demo.process_file(request["file"])
+        return demo.summary.pop()
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle a single transcription request.
+
+        Args:
+            request: Dict with 'file', and optionally 'model', 'compute_type'
+                and 'word_timestamps'; or with 'task': 'music' for the music
+                pipeline (see handle_music())
+
+        Returns:
+            Dict with either a 'result' or an 'error' entry
+        """
+        try:
+            if request.get("task") == "music":
+                return {"result": self.handle_music(request)}
+
+            engine = self.get_engine(
+                request.get("model", Config.DEFAULT_MODEL),
+                request.get("compute_type", Config.COMPUTE_TYPE),
+            )
+            result = engine.transcribe(
+                request["file"],
+                word_timestamps=request.get("word_timestamps", True),
+            )
+            return {"result": result}
+        except Exception as e:
+            logger.error(f"Request failed: {e}")
+            return {"error": str(e)}
+
+    def serve_forever(self) -> None:
+        """Accept and serve requests until interrupted.
+
+        Raises:
+            RuntimeError: If another daemon is already listening on the socket
+        """
+        if self.socket_path.exists():
+            try:
+                Client(str(self.socket_path), family="AF_UNIX").close()
+            except OSError:
+                # Stale socket left behind by a daemon that did not shut down cleanly
+                self.socket_path.unlink()
+            else:
+                raise RuntimeError(f"A daemon is already running on {self.socket_path}")
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        listener = Listener(str(self.socket_path), family="AF_UNIX")
+        os.chmod(self.socket_path, 0o600)
+        logger.info(f"Listening on {self.socket_path}")
+
+        try:
+            while True:
+                with listener.accept() as conn:
+                    try:
+                        request = conn.recv()
+                    except EOFError:
+                        continue
+                    conn.send(self.handle(request))
+        finally:
+            listener.close()
+
+
+def request_transcription(
+    file_path: str | Path,
+    model_name: str,
+    word_timestamps: bool = True,
+    compute_type: str = Config.COMPUTE_TYPE,
+    socket_path: str | Path = Config.DAEMON_SOCKET,
+) -> Optional["TranscriptionResult"]:
+    """Transcribe a file through a running daemon.
+
+    Args:
+        file_path: Path to audio or video file
+        model_name: Whisper model to use
+        word_timestamps: Extract word-level timestamps
+        compute_type: Model weight precision
+        socket_path: Path of the daemon's Unix domain socket
+
+    Returns:
+        TranscriptionResult, or None if no daemon is running
+
+    Raises:
+        RuntimeError: If the daemon reports a transcription error
+    """
+    return _send_request(
+        {
+            "file": str(Path(file_path).resolve()),
+            "model": model_name,
+            "word_timestamps": word_timestamps,
+            "compute_type": compute_type,
+        },
+        socket_path,
+    )
+
+
+def request_music_transcription(
+    file_path: str | Path,
+    sample_rate: int,
+    device: str = "cpu",
+    use_cache: bool = True,
+    socket_path: str | Path = Config.DAEMON_SOCKET,
+) -> Optional[Dict[str, Any]]:
+    """Analyze, transcribe and export a file with a running daemon's music pipeline.
+
+    Args:
+        file_path: Path to audio file
+        sample_rate: Sample rate audio is decoded at for analysis
+        device: Basic Pitch inference device
+        use_cache: Reuse cached analysis and transcription results
+        socket_path: Path of the daemon's Unix domain socket
+
+    Returns:
+        The file's JSON summary, or None if no daemon is running
+
+    Raises:
+        RuntimeError: If the daemon reports an error
+    """
+    return _send_request(
+        {
+            "task": "music",
+            "file": str(Path(file_path).expanduser().resolve()),
+            "sample_rate": sample_rate,
+            "device": device,
+            "use_cache": use_cache,
+        },
+        socket_path,
+    )
+
+
+def _send_request(request: Dict[str, Any], socket_path: str | Path) -> Optional[Any]:
+    """Send a request to a running daemon and return its result.
+
+    Returns:
+        The 'result' entry of the response, or None if no daemon is running
+
+    Raises:
+        RuntimeError: If the daemon reports an error
+    """
+    socket_path = Path(socket_path)
+    if not socket_path.exists():
+        return None
+
+    try:
+        with Client(str(socket_path), family="AF_UNIX") as conn:
+            conn.send(request)
+            response = conn.recv()
+    except (OSError, EOFError):
+        return None
+
+    if "error" in response:
+        raise RuntimeError(response["error"])
+    return response["result"]
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Maestrai Transcription Daemon")
+
+    parser.add_argument(
+        "--socket",
+        default=str(Config.DAEMON_SOCKET),
+        help=f"Unix socket to listen on (default: {Config.DAEMON_SOCKET})",
+    )
+
+    parser.add_argument(
+        "-m",
+        "--model",
+        choices=Config.AVAILABLE_MODELS,
+        help="Model to preload at startup (others are loaded on first request)",
+    )
+
+    parser.add_argument(
+        "--compute-type",
+        default=Config.COMPUTE_TYPE,
+        choices=Config.AVAILABLE_COMPUTE_TYPES,
+        help="Precision of the preloaded model (default: auto)",
+    )
+
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Enable verbose logging",
+    )
+
+    args = parser.parse_args()
+
+    # Configure logging
+    log_level = logging.DEBUG if args.verbose else logging.INFO
+    logging.basicConfig(
+        level=log_level,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
+    daemon = TranscriptionDaemon(args.socket)
+
+    try:
+        if args.model:
+            daemon.get_engine(args.model, args.compute_type)
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        print("\nDaemon stopped.")
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
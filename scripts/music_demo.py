@@ -9,71 +9,185 @@ Converts audio recordings into:
 
 import sys
 import os
+import json
+import contextlib
+import functools
 import logging
+import tempfile
+import threading
 import warnings
+from collections import deque
 from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import argparse
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import numpy as np
 
 # Suppress noisy warnings from dependencies BEFORE importing them
 os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"  # Suppress TensorFlow logging
-warnings.filterwarnings("ignore", category=UserWarning)
-warnings.filterwarnings("ignore", category=DeprecationWarning)
-warnings.filterwarnings("ignore", message=".*beam.*")  # music21 beam warnings
-warnings.filterwarnings("ignore", message=".*scikit-learn.*")
-warnings.filterwarnings("ignore", message=".*TensorFlow.*")
-warnings.filterwarnings("ignore", message=".*Torch.*")
-warnings.filterwarnings("ignore", message=".*tflite.*")
-warnings.filterwarnings("ignore", message=".*onnxruntime.*")
+warnings.simplefilter("ignore", UserWarning)
+warnings.simplefilter("ignore", DeprecationWarning)
+# One filter for all noisy messages (music21 beams, optional ML backends): the
+# filter list is scanned for every warning emitted, and TF emits many on import
+warnings.filterwarnings(
+    "ignore", message=".*(beam|scikit-learn|TensorFlow|Torch|tflite|onnxruntime)"
+)
 
 # Suppress root logger warnings
 logging.getLogger("root").setLevel(logging.ERROR)
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Project root, resolved once; outputs are written below it
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Add parent directory to path when run as a file from a source checkout
+# (not needed with `python -m` or when the package is installed)
+if not __package__:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+# The engines pull in TensorFlow, librosa and music21, so they are imported in
+# initialize_engines() rather than here; --help and bad arguments stay fast
+from src.utils.transcription_cache import TranscriptionCache
+
+
+# Basic Pitch always works at 22.05 kHz; analyzing at the same rate keeps every
+# stage's buffers the same size and avoids decoding at the file's native rate
+DEFAULT_SAMPLE_RATE = 22050
+
+# Report rules and fixed banners, built once
+_BANNER = "=" * 80
+_FILE_BANNER = "#" * 80
+_SEP = "-" * 40
+_HEADER = (
+    f"\n{_BANNER}\n"
+    "  MAESTRAI - Music Transcription Service Demo\n"
+    "  Audio to Sheet Music powered by Spotify Basic Pitch\n"
+    f"{_BANNER}\n\n"
+)
+_FOOTER = f"\n{_BANNER}\nDemo completed!\n{_BANNER}\n\n"
 
-from src.music_transcription_engine import MusicTranscriptionEngine
-from src.audio_analyzer import AudioAnalyzer
-from src.score_generator import ScoreGenerator
+
+def _print_section(title: str, rule: str = _BANNER) -> None:
+    """Print a section title between two rules in a single write."""
+    sys.stdout.write(f"\n{rule}\n{title}\n{rule}\n")
 
 
 class MusicTranscriptionDemo:
     """Interactive demo for the music transcription service."""
 
-    def __init__(self):
-        """Initialize the demo."""
+    # Files analyzed and transcribed ahead of the one being reported in batch
+    # mode; each in-flight file holds its decoded audio, hence the bound
+    BATCH_LOOKAHEAD = max(1, (os.cpu_count() or 1) // 4)
+
+    def __init__(
+        self,
+        use_cache: bool = True,
+        sample_rate: int = DEFAULT_SAMPLE_RATE,
+        json_output: bool = False,
+        device: str = "cpu",
+    ):
+        """Initialize the demo.
+
+        Args:
+            use_cache: Reuse analysis and transcription results from earlier runs
+            sample_rate: Sample rate audio is decoded at for analysis
+            json_output: Collect a per-file summary in ``self.summary`` instead
+                of printing the analysis, transcription and export reports
+            device: Basic Pitch inference device ('cpu', 'cuda' or 'coreml')
+        """
         self.engine = None
         self.analyzer = None
         self.score_gen = None
         # Output directory relative to project root
-        self.output_dir = Path(__file__).parent.parent / "output"
+        self.output_dir = _REPO_ROOT / "output"
         self.output_dir.mkdir(exist_ok=True)
+        self.use_cache = use_cache
+        self.sample_rate = sample_rate
+        self.device = device
+        self.cache = TranscriptionCache(self.output_dir / ".cache")
+        self.json_output = json_output
+        self.summary: List[Dict[str, Any]] = []
+        # Results already loaded or computed in this process, by cache key
+        self._memo: Dict[str, Any] = {}
+        # AudioProcessor for ffmpeg decoding; False once ffmpeg is known to be missing
+        self._audio_processor: Any = None
+        # PDF renders left running in the background, reported by wait_for_pdfs()
+        self._pdf_executor: Optional[ThreadPoolExecutor] = None
+        self._pdf_renders: List[Tuple[Path, Future]] = []
+        # Export paths by input file, built once per file (see _output_paths())
+        self._output_paths_by_file: Dict[str, Dict[str, Path]] = {}
+
+    def _cached(self, file_path: str, name: str, compute: Callable[[], Any], **options) -> Any:
+        """Return a cached result for the file contents and options, computing it on a miss.
+
+        Args:
+            file_path: Path to the input audio file
+            name: Name of the producing component (part of the cache key)
+            compute: Function producing the result on a cache miss
+            **options: Settings that affect the result
+
+        Returns:
+            The cached or freshly computed result
+        """
+        if not self.use_cache:
+            return compute()
+
+        key = self.cache.make_key(file_path, name, None, **options)
+        result = self._memo.get(key)
+        if result is None:
+            result = self.cache.get(key)
+        if result is None:
+            result = compute()
+            self.cache.put(key, result)
+        self._memo[key] = result
+        return result
 
     def print_header(self):
         """Print demo header."""
-        print("\n" + "=" * 80)
-        print("  MAESTRAI - Music Transcription Service Demo")
-        print("  Audio to Sheet Music powered by Spotify Basic Pitch")
-        print("=" * 80 + "\n")
+        sys.stdout.write(_HEADER)
 
     def initialize_engines(self):
         """Initialize transcription engines."""
         print("Initializing music transcription engines...")
-        print("-" * 40)
+        print(_SEP)
 
-        try:
-            print("  Loading Basic Pitch model...")
-            self.engine = MusicTranscriptionEngine()
-            print("  Basic Pitch model loaded")
+        def load_engine():
+            from src.music_transcription_engine import MusicTranscriptionEngine
 
-            print("  Initializing audio analyzer...")
-            self.analyzer = AudioAnalyzer()
-            print("  Audio analyzer ready")
+            return MusicTranscriptionEngine(device=self.device)
 
-            print("  Initializing score generator...")
-            self.score_gen = ScoreGenerator()
-            print("  Score generator ready")
+        def load_analyzer():
+            from src.audio_analyzer import AudioAnalyzer
 
-            print("-" * 40)
+            # Chromagrams are cached next to the results, so re-analyzing a file
+            # with different settings skips the constant-Q transform
+            return AudioAnalyzer(
+                sample_rate=self.sample_rate,
+                cache_dir=self.cache.cache_dir if self.use_cache else None,
+            )
+
+        def load_score_generator():
+            from src.score_generator import ScoreGenerator
+
+            return ScoreGenerator()
+
+        try:
+            # TensorFlow/Basic Pitch, librosa and music21 are independent and each
+            # take seconds to import and set up, so they are loaded side by side
+            print("  Loading Basic Pitch model, audio analyzer and score generator...")
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                engine = executor.submit(load_engine)
+                analyzer = executor.submit(load_analyzer)
+                score_gen = executor.submit(load_score_generator)
+
+                self.engine = engine.result()
+                print("  Basic Pitch model loaded")
+                self.analyzer = analyzer.result()
+                print("  Audio analyzer ready")
+                self.score_gen = score_gen.result()
+                print("  Score generator ready")
+
+            print(_SEP)
             print("All engines initialized successfully")
             return True
 
@@ -81,56 +195,268 @@ class MusicTranscriptionDemo:
             print(f"Failed to initialize engines: {e}")
             return False
 
-    def analyze_audio(self, file_path: str):
+    def _decode(self, file_path: str, sample_rate: int) -> np.ndarray:
+        """Decode a file to mono float32 PCM, reusing a decoded copy from an earlier run.
+
+        Decoded samples are kept as .npy files next to the result cache and
+        memory-mapped on reuse, so repeat runs with different analysis or
+        transcription settings skip audio decoding and share page-cache pages.
+
+        Args:
+            file_path: Path to audio file
+            sample_rate: Target sample rate
+
+        Returns:
+            Mono float32 samples (read-only when memory-mapped)
+        """
+        if not self.use_cache:
+            return self._read_pcm(file_path, sample_rate)
+
+        key = self.cache.make_key(file_path, "pcm", None, sample_rate=sample_rate)
+        pcm_path = self.cache.cache_dir / f"{key}.npy"
+        try:
+            return np.load(pcm_path, mmap_mode="r")
+        except (OSError, ValueError):
+            pass
+
+        audio = self._read_pcm(file_path, sample_rate)
+        try:
+            pcm_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=pcm_path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, audio)
+            os.replace(tmp_name, pcm_path)
+        except OSError as e:
+            logging.getLogger(__name__).warning(f"Failed to cache decoded audio: {e}")
+        return audio
+
+    def _read_pcm(self, file_path: str, sample_rate: int) -> np.ndarray:
+        """Decode and resample a file to mono float32 in one ffmpeg pass.
+
+        MP3/M4A inputs otherwise go through librosa's audioread fallback and a
+        separate resampling step; librosa is still used if ffmpeg is missing.
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        if self._audio_processor is None:
+            from src.audio_processor import AudioProcessor
+
+            try:
+                self._audio_processor = AudioProcessor()
+            except RuntimeError:
+                self._audio_processor = False
+
+        if not self._audio_processor:
+            import librosa
+
+            return librosa.load(file_path, sr=sample_rate, mono=True)[0]
+
+        try:
+            return self._audio_processor.extract_pcm_stream(file_path, sample_rate, 1)
+        except RuntimeError:
+            # Report a bad path the same way as the other decode paths
+            if not Path(file_path).exists():
+                raise FileNotFoundError(f"Audio file not found: {file_path}")
+            raise
+
+    def _audio_loader(self, file_path: str) -> Callable[[], np.ndarray]:
+        """Return a function that decodes the file on first call and then reuses it.
+
+        Analysis and transcription run on separate threads; whichever needs the
+        samples first decodes them and the other one shares the same buffer.
+        Nothing is decoded if both results come from the cache.
+        """
+        lock = threading.Lock()
+        decoded: List[np.ndarray] = []
+
+        def load() -> np.ndarray:
+            with lock:
+                if not decoded:
+                    decoded.append(self._decode(file_path, self.engine.SAMPLE_RATE))
+                return decoded[0]
+
+        return load
+
+    def _analyze(self, file_path: str, load_audio: Optional[Callable[[], np.ndarray]] = None):
+        """Run (or load cached) audio analysis without printing anything."""
+
+        def analyze():
+            # The shared buffer is decoded at Basic Pitch's rate; use it when it matches
+            shared = load_audio and self.analyzer.sample_rate == self.engine.SAMPLE_RATE
+            return self.analyzer.analyze(file_path, audio=load_audio() if shared else None)
+
+        return self._cached(
+            file_path,
+            "audio_analyzer",
+            analyze,
+            sample_rate=self.analyzer.sample_rate,
+            hop_length=self.analyzer.hop_length,
+            onset_backend=self.analyzer.onset_backend,
+            key_chroma=self.analyzer.key_chroma,
+        )
+
+    def _transcribe(self, file_path: str, load_audio: Optional[Callable[[], np.ndarray]] = None):
+        """Run (or load cached) Basic Pitch transcription without printing anything."""
+        engine = self.engine
+        load_audio = load_audio or self._audio_loader(file_path)
+        return self._cached(
+            file_path,
+            "basic_pitch",
+            lambda: engine.transcribe(file_path, audio=load_audio()),
+            onset_threshold=engine.onset_threshold,
+            frame_threshold=engine.frame_threshold,
+            minimum_note_length=engine.minimum_note_length,
+            minimum_frequency=engine.minimum_frequency,
+            maximum_frequency=engine.maximum_frequency,
+            multiple_pitch_bends=engine.multiple_pitch_bends,
+            melodia_trick=engine.melodia_trick,
+            model_path=str(engine.model_path),
+            # Backends and execution providers differ slightly in their outputs
+            device=engine.device,
+            backend=engine.model.model_type.name,
+        )
+
+    def _submit(self, executor: ThreadPoolExecutor, file_path: str) -> Tuple[Future, Future]:
+        """Start analysis and transcription of a file on the executor."""
+        load_audio = self._audio_loader(file_path)
+        return executor.submit(self._analyze, file_path, load_audio), executor.submit(
+            self._transcribe, file_path, load_audio
+        )
+
+    def process_file(self, file_path: str, pending: Optional[Tuple[Future, Future]] = None):
+        """Analyze, transcribe and export a single file.
+
+        librosa analysis and Basic Pitch inference start together on one shared
+        decoded buffer, and their reports are printed as they finish.
+
+        Args:
+            file_path: Path to audio file
+            pending: Optional (analysis, transcription) futures already started
+                for this file
+        """
+        if pending is None:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                return self.process_file(file_path, self._submit(executor, file_path))
+
+        if self.json_output:
+            self.summary.append(self._summarize(file_path, pending))
+            return
+
+        pending_analysis, pending_result = pending
+        analysis = self.analyze_audio(file_path, pending_analysis)
+        result = self.transcribe_music(file_path, analysis, pending_result)
+
+        if result:
+            self.export_results(result, analysis, file_path)
+
+    def _summarize(self, file_path: str, pending: Tuple[Future, Future]) -> Dict[str, Any]:
+        """Analyze, transcribe and export a file without printing, for --json.
+
+        Args:
+            file_path: Path to audio file
+            pending: (analysis, transcription) futures started for this file
+
+        Returns:
+            JSON-serializable summary of the file's results
+        """
+        summary: Dict[str, Any] = {"file": file_path, "errors": {}}
+        pending_analysis, pending_result = pending
+
+        analysis = None
+        try:
+            analysis = pending_analysis.result()
+            summary["analysis"] = {
+                "duration": analysis.duration,
+                "sample_rate": analysis.sample_rate,
+                "tempo": analysis.tempo,
+                "key": analysis.key,
+                "time_signature": analysis.time_signature,
+                "beats": len(analysis.beats),
+                "onsets": len(analysis.onsets),
+                "spectral_centroid": analysis.spectral_centroid,
+                "rms_energy": analysis.rms_energy,
+            }
+        except Exception as e:
+            summary["errors"]["analysis"] = str(e)
+
+        try:
+            result = pending_result.result()
+        except Exception as e:
+            summary["errors"]["transcription"] = str(e)
+            return summary
+
+        if analysis:
+            result.tempo = analysis.tempo
+            result.key = analysis.key
+            result.time_signature = analysis.time_signature
+        summary["transcription"] = self.engine.get_statistics(result)
+
+        summary["exports"] = {}
+        for fmt, (path, error) in self._export(result, file_path).items():
+            if path:
+                summary["exports"][fmt] = str(path)
+            else:
+                summary["errors"][fmt] = error
+        return summary
+
+    def analyze_audio(self, file_path: str, pending: Optional[Future] = None):
         """Analyze audio file and display info.
 
         Args:
             file_path: Path to audio file
+            pending: Optional Future already computing the analysis
         """
-        print("\n" + "=" * 80)
-        print("AUDIO ANALYSIS")
-        print("=" * 80)
+        _print_section("AUDIO ANALYSIS")
 
         try:
-            analysis = self.analyzer.analyze(file_path)
-
-            print(f"\nFile: {Path(file_path).name}")
-            print(f"Duration: {analysis.duration:.2f} seconds")
-            print(f"Sample Rate: {analysis.sample_rate} Hz")
-            print("-" * 40)
-            print(f"Tempo: {analysis.tempo:.1f} BPM")
-            print(f"Key: {analysis.key}")
-            print(f"Time Signature: {analysis.time_signature}")
-            print(f"Beats detected: {len(analysis.beats)}")
-            print(f"Onsets detected: {len(analysis.onsets)}")
+            analysis = pending.result() if pending else self._analyze(file_path)
+
+            lines = [
+                "",
+                f"File: {Path(file_path).name}",
+                f"Duration: {analysis.duration:.2f} seconds",
+                f"Sample Rate: {analysis.sample_rate} Hz",
+                _SEP,
+                f"Tempo: {analysis.tempo:.1f} BPM",
+                f"Key: {analysis.key}",
+                f"Time Signature: {analysis.time_signature}",
+                f"Beats detected: {len(analysis.beats)}",
+                f"Onsets detected: {len(analysis.onsets)}",
+            ]
 
             if analysis.spectral_centroid:
-                print(f"Spectral Centroid: {analysis.spectral_centroid:.1f} Hz")
+                lines.append(f"Spectral Centroid: {analysis.spectral_centroid:.1f} Hz")
             if analysis.rms_energy:
-                print(f"RMS Energy: {analysis.rms_energy:.4f}")
+                lines.append(f"RMS Energy: {analysis.rms_energy:.4f}")
 
+            # One write per section instead of one per line
+            sys.stdout.write("\n".join(lines) + "\n")
             return analysis
 
+        except FileNotFoundError:
+            raise
         except Exception as e:
             print(f"Analysis failed: {e}")
             return None
 
-    def transcribe_music(self, file_path: str, analysis=None):
+    def transcribe_music(self, file_path: str, analysis=None, pending: Optional[Future] = None):
         """Transcribe audio to musical notes.
 
         Args:
             file_path: Path to audio file
             analysis: Optional AudioAnalysis from previous step
+            pending: Optional Future already computing the transcription
         """
-        print("\n" + "=" * 80)
-        print("MUSIC TRANSCRIPTION")
-        print("=" * 80)
+        _print_section("MUSIC TRANSCRIPTION")
 
-        print("\nTranscribing audio to musical notes...")
-        print("(This may take a moment depending on file length)")
+        sys.stdout.write(
+            "\nTranscribing audio to musical notes...\n"
+            "(This may take a moment depending on file length)\n"
+        )
 
         try:
-            result = self.engine.transcribe(file_path)
+            result = pending.result() if pending else self._transcribe(file_path)
 
             # Update result with analysis data if available
             if analysis:
@@ -138,35 +464,43 @@ class MusicTranscriptionDemo:
                 result.key = analysis.key
                 result.time_signature = analysis.time_signature
 
-            print(f"\nTranscription completed!")
-            print("-" * 40)
-            print(f"Notes detected: {result.note_count}")
-            print(f"Duration: {result.duration:.2f} seconds")
-            print(f"Pitch range: {result.pitch_range_names[0]} - {result.pitch_range_names[1]}")
+            lines = [
+                "",
+                "Transcription completed!",
+                _SEP,
+                f"Notes detected: {result.note_count}",
+                f"Duration: {result.duration:.2f} seconds",
+                f"Pitch range: {result.pitch_range_names[0]} - {result.pitch_range_names[1]}",
+            ]
 
             if result.tempo:
-                print(f"Tempo: {result.tempo:.1f} BPM")
+                lines.append(f"Tempo: {result.tempo:.1f} BPM")
             if result.key:
-                print(f"Key: {result.key}")
+                lines.append(f"Key: {result.key}")
 
             # Show statistics
             stats = self.engine.get_statistics(result)
-            print(f"\nStatistics:")
-            print(f"  Notes per second: {stats['notes_per_second']:.2f}")
-            print(f"  Average velocity: {stats['average_velocity']:.1f}")
-            print(f"  Average note duration: {stats['average_note_duration']:.3f}s")
+            lines += [
+                "",
+                "Statistics:",
+                f"  Notes per second: {stats['notes_per_second']:.2f}",
+                f"  Average velocity: {stats['average_velocity']:.1f}",
+                f"  Average note duration: {stats['average_note_duration']:.3f}s",
+            ]
 
             # Show first few notes
-            print(f"\nFirst 10 notes:")
-            print("-" * 40)
-            for note in result.notes[:10]:
-                print(f"  {note}")
+            lines += ["", "First 10 notes:", _SEP]
+            lines.extend(map("  {!r}".format, result.notes[:10]))
 
             if len(result.notes) > 10:
-                print(f"  ... and {len(result.notes) - 10} more notes")
+                lines.append(f"  ... and {len(result.notes) - 10} more notes")
 
+            # One write per section instead of one per line
+            sys.stdout.write("\n".join(lines) + "\n")
             return result
 
+        except FileNotFoundError:
+            raise
         except Exception as e:
             print(f"Transcription failed: {e}")
             import traceback
@@ -174,6 +508,105 @@ class MusicTranscriptionDemo:
             traceback.print_exc()
             return None
 
+    def _output_paths(self, file_path: str) -> Dict[str, Path]:
+        """Return the MIDI, MusicXML and PDF output paths for an input file.
+
+        The paths are built on first use and reused when the same file is
+        exported again (e.g. by a long-running daemon).
+
+        Args:
+            file_path: Path to the input audio file
+
+        Returns:
+            Dict mapping format name to output path
+        """
+        paths = self._output_paths_by_file.get(file_path)
+        if paths is None:
+            base_name = Path(file_path).stem
+            paths = {
+                fmt: self.output_dir / f"{base_name}{suffix}"
+                for fmt, suffix in (("MIDI", ".mid"), ("MusicXML", ".musicxml"), ("PDF", ".pdf"))
+            }
+            self._output_paths_by_file[file_path] = paths
+        return paths
+
+    def _export(
+        self,
+        result,
+        original_file: str,
+        pending_score: Optional[Future] = None,
+        background_pdf: bool = False,
+    ) -> Dict[str, Tuple[Optional[Path], Optional[str]]]:
+        """Write the MIDI, MusicXML and PDF files for a transcription.
+
+        Args:
+            result: MusicTranscriptionResult object
+            original_file: Original audio file path
+            pending_score: Optional Future building the music21 score for the
+                result, shared with other consumers such as the preview
+            background_pdf: Leave the PDF render running instead of waiting for
+                it; its outcome is reported by wait_for_pdfs()
+
+        Returns:
+            Dict mapping format name to (output path, None) on success or
+            (None, reason) if the export failed or was skipped
+        """
+        paths = self._output_paths(original_file)
+        midi_path, musicxml_path, pdf_path = paths["MIDI"], paths["MusicXML"], paths["PDF"]
+        has_pdf_tools = self.score_gen.musescore_path or self.score_gen.lilypond_path
+
+        def export_midi_then_pdf():
+            self.engine.export_midi(result, midi_path)
+            if not has_pdf_tools:
+                return None
+            # Use MIDI file directly for PDF generation (more reliable)
+            if background_pdf:
+                if self._pdf_executor is None:
+                    self._pdf_executor = ThreadPoolExecutor(max_workers=2)
+                return self._pdf_executor.submit(self.score_gen.export_pdf, midi_path, pdf_path)
+            return executor.submit(self.score_gen.export_pdf, midi_path, pdf_path)
+
+        # The exports are independent except that the PDF is rendered from the
+        # MIDI file, so MIDI and MusicXML run side by side and the (external,
+        # slow) PDF render starts as soon as the MIDI file exists
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            midi_future = executor.submit(export_midi_then_pdf)
+            musicxml_future = executor.submit(
+                lambda: self.score_gen.export_musicxml(
+                    pending_score.result() if pending_score else result, musicxml_path
+                )
+            )
+
+            outcomes = {}
+            pdf_future = None
+            try:
+                pdf_future = midi_future.result()
+                outcomes["MIDI"] = (midi_path, None)
+            except Exception as e:
+                outcomes["MIDI"] = (None, f"failed: {e}")
+
+            try:
+                musicxml_future.result()
+                outcomes["MusicXML"] = (musicxml_path, None)
+            except Exception as e:
+                outcomes["MusicXML"] = (None, f"failed: {e}")
+
+            if not has_pdf_tools:
+                outcomes["PDF"] = (None, "skipped (MuseScore or LilyPond not installed)")
+            elif pdf_future is None:
+                outcomes["PDF"] = (None, "skipped (MIDI export failed)")
+            elif background_pdf:
+                self._pdf_renders.append((pdf_path, pdf_future))
+                outcomes["PDF"] = (None, f"rendering in the background ({pdf_path.name})")
+            else:
+                try:
+                    pdf_future.result()
+                    outcomes["PDF"] = (pdf_path, None)
+                except Exception as e:
+                    outcomes["PDF"] = (None, f"failed: {e}")
+
+        return outcomes
+
     def export_results(self, result, analysis, original_file: str):
         """Export results to various formats.
 
@@ -182,55 +615,118 @@ class MusicTranscriptionDemo:
             analysis: AudioAnalysis object
             original_file: Original audio file path
         """
-        print("\n" + "=" * 80)
-        print("EXPORT")
-        print("=" * 80)
-
-        original_path = Path(original_file)
-        base_name = original_path.stem
+        _print_section("EXPORT")
 
         print(f"\nOutput directory: {self.output_dir}")
 
-        # Export MIDI
-        midi_path = self.output_dir / f"{base_name}.mid"
-        try:
-            self.engine.export_midi(result, midi_path)
-            print(f"MIDI exported to: {midi_path}")
-        except Exception as e:
-            print(f"MIDI export failed: {e}")
-
-        # Export MusicXML
-        musicxml_path = self.output_dir / f"{base_name}.musicxml"
-        try:
-            self.score_gen.export_musicxml(
-                result,
-                musicxml_path,
+        # The music21 score is built once for both the MusicXML export and the
+        # preview, in the background while the MIDI/PDF exports start
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            score = executor.submit(self.score_gen.from_transcription, result)
+            preview = executor.submit(lambda: self.score_gen.preview(score.result()))
+
+            outcomes = self._export(result, original_file, score, background_pdf=True).items()
+            sys.stdout.write(
+                "".join(
+                    f"{fmt} exported to: {path}\n" if path else f"{fmt} export {error}\n"
+                    for fmt, (path, error) in outcomes
+                )
             )
-            print(f"MusicXML exported to: {musicxml_path}")
-        except Exception as e:
-            print(f"MusicXML export failed: {e}")
 
-        # Try PDF export - use MIDI file directly for better results
-        pdf_path = self.output_dir / f"{base_name}.pdf"
-        try:
-            if self.score_gen.musescore_path or self.score_gen.lilypond_path:
-                # Use MIDI file directly for PDF generation (more reliable)
-                self.score_gen.export_pdf(midi_path, pdf_path)
-                print(f"PDF exported to: {pdf_path}")
+            # Show score preview
+            _print_section("SCORE PREVIEW")
+            sys.stdout.write(preview.result() + "\n")
+
+    def run_daemon(self, file_paths: List[str]) -> bool:
+        """Process files through a running maestrai daemon, if there is one.
+
+        The daemon keeps the analyzer, Basic Pitch model and score generator
+        loaded between runs, so only decoding and inference are paid per file.
+
+        Args:
+            file_paths: Paths to audio files
+
+        Returns:
+            True if a daemon processed the files, False if none is running
+        """
+        from scripts.maestrai_daemon import request_music_transcription
+
+        for i, file_path in enumerate(file_paths):
+            try:
+                summary = request_music_transcription(
+                    file_path, self.sample_rate, self.device, self.use_cache
+                )
+            except RuntimeError as e:
+                summary = {"file": file_path, "errors": {"daemon": str(e)}}
+
+            if summary is None:
+                if i == 0:
+                    return False
+                summary = {"file": file_path, "errors": {"daemon": "daemon stopped responding"}}
+
+            if self.json_output:
+                self.summary.append(summary)
             else:
-                print("PDF export skipped (MuseScore or LilyPond not installed)")
-        except Exception as e:
-            print(f"PDF export failed: {e}")
+                self._print_summary(summary)
+        return True
 
-        # Show score preview
-        print("\n" + "=" * 80)
-        print("SCORE PREVIEW")
-        print("=" * 80)
-        preview = self.score_gen.preview(result)
-        print(preview)
+    def _print_summary(self, summary: Dict[str, Any]):
+        """Print a file summary returned by the daemon.
+
+        Args:
+            summary: Summary of one file, as collected for --json
+        """
+        _print_section(f"{Path(summary['file']).name} (transcribed by running daemon)")
+
+        lines = [""]
+        analysis = summary.get("analysis")
+        if analysis:
+            lines += [
+                f"Duration: {analysis['duration']:.2f} seconds",
+                f"Tempo: {analysis['tempo']:.1f} BPM",
+                f"Key: {analysis['key']}",
+                f"Time Signature: {analysis['time_signature']}",
+            ]
+        stats = summary.get("transcription")
+        if stats:
+            lines.append(f"Notes detected: {stats['note_count']}")
+        for fmt, path in summary.get("exports", {}).items():
+            lines.append(f"{fmt} exported to: {path}")
+        for stage, error in summary["errors"].items():
+            lines.append(f"{stage} failed: {error}")
+
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    def wait_for_pdfs(self):
+        """Wait for PDF renders left running in the background and report them."""
+        if not self._pdf_renders:
+            return
+
+        print(f"\nWaiting for {len(self._pdf_renders)} PDF render(s) to finish...")
+        for pdf_path, future in self._pdf_renders:
+            try:
+                future.result()
+                print(f"PDF exported to: {pdf_path}")
+            except Exception as e:
+                print(f"PDF export failed ({pdf_path.name}): {e}")
+        self._pdf_renders.clear()
 
     def run_interactive(self):
-        """Run interactive mode."""
+        """Run interactive mode.
+
+        When stdin is not a terminal, file paths are read from it one per line
+        and processed in quick or batch mode instead of prompting.
+        """
+        if not sys.stdin.isatty():
+            file_paths = [line.strip().strip("\"'") for line in sys.stdin]
+            file_paths = [p for p in file_paths if p]
+            if not file_paths:
+                print("No file paths given on stdin.")
+                sys.exit(1)
+            if len(file_paths) > 1:
+                return self.run_batch(file_paths)
+            return self.run_quick(file_paths[0])
+
         self.print_header()
 
         print("Welcome to the Maestrai Music Transcription Demo!")
@@ -241,9 +737,7 @@ class MusicTranscriptionDemo:
             sys.exit(1)
 
         # Get audio file path
-        print("\n" + "=" * 80)
-        print("AUDIO FILE")
-        print("=" * 80)
+        _print_section("AUDIO FILE")
 
         while True:
             try:
@@ -257,29 +751,19 @@ class MusicTranscriptionDemo:
                 file_path = file_path.strip("\"'")
                 file_path = str(Path(file_path).expanduser())
 
-                if not Path(file_path).exists():
-                    print(f"File not found: {file_path}")
-                    continue
-
+                # Analyze, transcribe and export; a bad path surfaces when the
+                # file is first opened rather than through a separate stat
+                self.process_file(file_path)
                 break
 
+            except FileNotFoundError:
+                print(f"File not found: {file_path}")
             except KeyboardInterrupt:
                 print("\n\nDemo cancelled.")
                 return
 
-        # Analyze audio
-        analysis = self.analyze_audio(file_path)
-
-        # Transcribe music
-        result = self.transcribe_music(file_path, analysis)
-
-        if result:
-            # Export results
-            self.export_results(result, analysis, file_path)
-
-        print("\n" + "=" * 80)
-        print("Demo completed!")
-        print("=" * 80 + "\n")
+        self.wait_for_pdfs()
+        sys.stdout.write(_FOOTER)
 
     def run_quick(self, file_path: str):
         """Run quick mode with a single file.
@@ -294,29 +778,70 @@ class MusicTranscriptionDemo:
 
         print(f"Quick Mode: Transcribing {file_path}\n")
 
-        if not Path(file_path).exists():
+        if not self.initialize_engines():
+            print("\nFailed to initialize. Exiting.")
+            sys.exit(1)
+
+        # Analyze, transcribe and export
+        try:
+            self.process_file(file_path)
+        except FileNotFoundError:
             print(f"File not found: {file_path}")
             sys.exit(1)
 
+        self.wait_for_pdfs()
+        print("\nQuick transcription completed!\n")
+
+    def run_batch(self, file_paths: List[str]):
+        """Run quick mode over several files with a single engine load.
+
+        While one file's results are printed and exported, the next
+        BATCH_LOOKAHEAD files are already being analyzed and transcribed in the
+        background, so their (largely single-threaded) analysis uses idle cores.
+
+        Args:
+            file_paths: Paths to audio files
+        """
+        self.print_header()
+
+        file_paths = [str(Path(p).expanduser()) for p in file_paths]
+
+        print(f"Batch Mode: Transcribing {len(file_paths)} files\n")
+
         if not self.initialize_engines():
             print("\nFailed to initialize. Exiting.")
             sys.exit(1)
 
-        # Analyze
-        analysis = self.analyze_audio(file_path)
-
-        # Transcribe
-        result = self.transcribe_music(file_path, analysis)
-
-        if result:
-            # Export
-            self.export_results(result, analysis, file_path)
+        missing = 0
+        lookahead = min(self.BATCH_LOOKAHEAD, len(file_paths) - 1)
+        with ThreadPoolExecutor(max_workers=2 * (lookahead + 1)) as executor:
+            pending = deque(self._submit(executor, p) for p in file_paths[:lookahead])
+            for i, file_path in enumerate(file_paths):
+                if i + lookahead < len(file_paths):
+                    # Queue upcoming files behind this one so they run during export
+                    pending.append(self._submit(executor, file_paths[i + lookahead]))
+                current = pending.popleft()
+
+                title = f"FILE {i + 1}/{len(file_paths)}: {Path(file_path).name}"
+                _print_section(title, _FILE_BANNER)
+                try:
+                    self.process_file(file_path, current)
+                except FileNotFoundError:
+                    print(f"File not found, skipping: {file_path}")
+                    missing += 1
+
+        self.wait_for_pdfs()
+
+        if missing == len(file_paths):
+            print("No input files found.")
+            sys.exit(1)
 
-        print("\nQuick transcription completed!\n")
+        print(f"\nBatch transcription completed: {len(file_paths) - missing} files\n")
 
 
-def main():
-    """Main entry point."""
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser once; main() may be called repeatedly when embedded."""
     parser = argparse.ArgumentParser(
         description="Maestrai Music Transcription Demo",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -328,13 +853,51 @@ Examples:
   Quick mode:
     python music_demo.py song.mp3
     python music_demo.py piano.wav
+
+  Batch mode (models are loaded once):
+    python music_demo.py songs/*.mp3
+
+  Machine-readable summary:
+    python music_demo.py --json songs/*.mp3 > summary.json
+
+  File paths from a pipe, one per line:
+    find songs -name '*.wav' | python music_demo.py
+
+  Keep models loaded between runs:
+    python maestrai_daemon.py &
         """,
     )
 
     parser.add_argument(
-        "file",
-        nargs="?",
-        help="Audio file to transcribe (optional, triggers quick mode)",
+        "files",
+        nargs="*",
+        help="Audio file(s) to transcribe (optional, triggers quick/batch mode)",
+    )
+
+    parser.add_argument(
+        "--sample-rate",
+        type=int,
+        default=DEFAULT_SAMPLE_RATE,
+        help=f"Sample rate for audio analysis in Hz (default: {DEFAULT_SAMPLE_RATE})",
+    )
+
+    parser.add_argument(
+        "--device",
+        default="cpu",
+        choices=["cpu", "cuda", "coreml"],
+        help="Basic Pitch inference device; cuda/coreml run via ONNX Runtime (default: cpu)",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-run analysis and transcription even if cached results exist",
+    )
+
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print a JSON summary to stdout instead of the reports (progress goes to stderr)",
     )
 
     parser.add_argument(
@@ -344,8 +907,17 @@ Examples:
         help="Enable verbose logging",
     )
 
+    return parser
+
+
+def main():
+    """Main entry point."""
+    parser = _build_parser()
     args = parser.parse_args()
 
+    if args.json and not args.files and sys.stdin.isatty():
+        parser.error("--json requires input files as arguments or on stdin")
+
     # Configure logging
     log_level = logging.DEBUG if args.verbose else logging.WARNING
     logging.basicConfig(
@@ -354,13 +926,29 @@ Examples:
     )
 
     # Create demo instance
-    demo = MusicTranscriptionDemo()
+    demo = MusicTranscriptionDemo(
+        use_cache=not args.no_cache,
+        sample_rate=args.sample_rate,
+        device=args.device,
+        json_output=args.json,
+    )
 
     try:
-        if args.file:
-            demo.run_quick(args.file)
-        else:
-            demo.run_interactive()
+        # Keep stdout for the JSON document; headers and progress go to stderr
+        with contextlib.redirect_stdout(sys.stderr) if args.json else contextlib.nullcontext():
+            # Prefer a running daemon, which keeps the engines loaded between runs
+            if args.files and demo.run_daemon(args.files):
+                pass
+            elif len(args.files) > 1:
+                demo.run_batch(args.files)
+            elif args.files:
+                demo.run_quick(args.files[0])
+            else:
+                demo.run_interactive()
+
+        if args.json:
+            json.dump({"files": demo.summary}, sys.stdout, indent=2, default=str)
+            sys.stdout.write("\n")
 
     except KeyboardInterrupt:
         print("\n\nDemo interrupted by user.")
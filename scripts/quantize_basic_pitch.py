@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""Quantize the Basic Pitch model for faster CPU inference (TFLite).
+
+Basic Pitch inference on CPU is memory-bandwidth bound. Two modes are offered:
+
+- int16x8 (default): int8 weights (~4x smaller) with 16-bit activations, which
+  holds up well for audio models.
+- int8: int8 weights and activations, which run on the int8 kernels of
+  TFLite's XNNPACK backend (NEON dot-product on ARM) but lose more accuracy.
+
+Activation ranges are calibrated on model windows cut from the given audio
+files, so use a few representative recordings. Model inputs and outputs stay
+float32, as basic_pitch feeds float audio windows.
+
+The result is written where MusicTranscriptionEngine picks it up automatically
+(Config.QUANTIZED_MUSIC_MODEL_PATH or Config.INT8_MUSIC_MODEL_PATH). Requires
+TensorFlow.
+
+Usage:
+    python scripts/quantize_basic_pitch.py piano.wav guitar.mp3 voice.flac
+    python scripts/quantize_basic_pitch.py --mode int8 piano.wav
+"""
+
+import sys
+import logging
+import argparse
+from pathlib import Path
+from typing import Iterator, List
+
+import numpy as np
+
+# Add parent directory to path when run as a file from a source checkout
+# (not needed with `python -m` or when the package is installed)
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+def representative_windows(audio_files: List[str], max_windows: int) -> Iterator[list]:
+    """Yield model input windows from audio files for activation calibration.
+
+    Args:
+        audio_files: Paths to calibration recordings
+        max_windows: Maximum number of windows to yield in total
+
+    Yields:
+        Single-element lists holding one (1, AUDIO_N_SAMPLES, 1) float32 window
+    """
+    import librosa
+    from basic_pitch.constants import AUDIO_N_SAMPLES, AUDIO_SAMPLE_RATE, FFT_HOP
+    from basic_pitch.inference import window_audio_file
+
+    # Same window hop as basic_pitch.inference.run_inference
+    hop_size = AUDIO_N_SAMPLES - 30 * FFT_HOP
+    count = 0
+    for audio_file in audio_files:
+        audio, _ = librosa.load(audio_file, sr=AUDIO_SAMPLE_RATE, mono=True)
+        for window, _ in window_audio_file(audio, hop_size):
+            yield [window[np.newaxis].astype(np.float32)]
+            count += 1
+            if count >= max_windows:
+                return
+
+
+# Output path and TFLite op sets per quantization mode. Ops without a quantized
+# kernel fall back to float through TFLITE_BUILTINS
+QUANTIZATION_MODES = {
+    "int16x8": (
+        Config.QUANTIZED_MUSIC_MODEL_PATH,
+        ["EXPERIMENTAL_TFLITE_BUILTINS_ACTIVATIONS_INT16_WEIGHTS_INT8", "TFLITE_BUILTINS"],
+    ),
+    "int8": (Config.INT8_MUSIC_MODEL_PATH, ["TFLITE_BUILTINS_INT8", "TFLITE_BUILTINS"]),
+}
+
+
+def quantize(
+    audio_files: List[str],
+    output_path: Path,
+    max_windows: int = 100,
+    mode: str = "int16x8",
+) -> Path:
+    """Convert the bundled Basic Pitch SavedModel to a quantized TFLite model.
+
+    Args:
+        audio_files: Paths to calibration recordings
+        output_path: Where to write the .tflite model
+        max_windows: Number of calibration windows
+        mode: Quantization mode, a key of QUANTIZATION_MODES
+
+    Returns:
+        Path to the written model
+
+    Raises:
+        RuntimeError: If conversion fails
+    """
+    import tensorflow as tf
+    from basic_pitch import FilenameSuffix, build_icassp_2022_model_path
+
+    saved_model = build_icassp_2022_model_path(FilenameSuffix.tf)
+    logger.info(
+        f"Quantizing {saved_model} ({mode}) with {len(audio_files)} calibration file(s)"
+    )
+
+    try:
+        converter = tf.lite.TFLiteConverter.from_saved_model(str(saved_model))
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.representative_dataset = lambda: representative_windows(
+            audio_files, max_windows
+        )
+        converter.target_spec.supported_ops = [
+            getattr(tf.lite.OpsSet, name) for name in QUANTIZATION_MODES[mode][1]
+        ]
+        model = converter.convert()
+    except Exception as e:
+        error_msg = f"Failed to quantize Basic Pitch model: {str(e)}"
+        logger.error(error_msg)
+        raise RuntimeError(error_msg)
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_bytes(model)
+    logger.info(f"Wrote {output_path} ({len(model) / 1024 / 1024:.1f} MB)")
+    return output_path
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Quantize the Basic Pitch model for faster CPU transcription"
+    )
+
+    parser.add_argument("files", nargs="+", help="Audio files used to calibrate activations")
+
+    parser.add_argument(
+        "--mode",
+        default="int16x8",
+        choices=list(QUANTIZATION_MODES),
+        help="int16x8 (int8 weights, 16-bit activations) or int8 (default: int16x8)",
+    )
+
+    parser.add_argument(
+        "-o",
+        "--output",
+        help="Output model path (default: the path the engine loads for --mode)",
+    )
+
+    parser.add_argument(
+        "--windows",
+        type=int,
+        default=100,
+        help="Number of calibration windows (default: 100)",
+    )
+
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
+    try:
+        output_path = Path(args.output or QUANTIZATION_MODES[args.mode][0]).expanduser()
+        output_path = quantize(args.files, output_path, args.windows, args.mode)
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        sys.exit(1)
+
+    print(f"\nQuantized model written to: {output_path}")
+    print("Compare transcriptions of a few held-out files against the float model before")
+    print("relying on it; set MUSIC_MODEL_PATH to the bundled model to switch back.")
+
+
+if __name__ == "__main__":
+    main()
@@ -23,7 +23,7 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/maestrai",
-    packages=find_packages(),
+    packages=find_packages(exclude=["tests", "tests.*"]),
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -47,10 +47,15 @@ setup(
             "flake8>=6.0.0",
             "mypy>=1.5.0",
         ],
+        "gpu": [
+            "onnxruntime-gpu>=1.14.0",
+        ],
     },
     entry_points={
         "console_scripts": [
             "maestrai=scripts.demo:main",
+            "maestrai-music=scripts.music_demo:main",
+            "maestrai-daemon=scripts.maestrai_daemon:main",
         ],
     },
     include_package_data=True,
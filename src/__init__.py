@@ -11,23 +11,26 @@ Features:
 __version__ = "2.0.0"
 __author__ = "Maestrai Team"
 
-# Speech transcription (Phase 1)
-from .transcription_engine import (
-    TranscriptionEngine,
-    TranscriptionResult,
-    TranscriptionSegment,
-    Word,
-)
-from .audio_processor import AudioProcessor
-
-# Music transcription (Phase 2)
-from .music_transcription_engine import (
-    MusicTranscriptionEngine,
-    MusicTranscriptionResult,
-    Note,
-)
-from .audio_analyzer import AudioAnalyzer, AudioAnalysis
-from .score_generator import ScoreGenerator
+from importlib import import_module
+
+# Public classes and the submodules defining them. They are imported on first
+# access, so importing one component (or src.utils) does not pull in Whisper,
+# PyTorch, TensorFlow and music21 all at once.
+_EXPORTS = {
+    # Speech transcription (Phase 1)
+    "TranscriptionEngine": ".transcription_engine",
+    "TranscriptionResult": ".transcription_engine",
+    "TranscriptionSegment": ".transcription_engine",
+    "Word": ".transcription_engine",
+    "AudioProcessor": ".audio_processor",
+    # Music transcription (Phase 2)
+    "MusicTranscriptionEngine": ".music_transcription_engine",
+    "MusicTranscriptionResult": ".music_transcription_engine",
+    "Note": ".music_transcription_engine",
+    "AudioAnalyzer": ".audio_analyzer",
+    "AudioAnalysis": ".audio_analyzer",
+    "ScoreGenerator": ".score_generator",
+}
 
 __all__ = [
     # Speech transcription
@@ -44,3 +47,16 @@ __all__ = [
     "AudioAnalysis",
     "ScoreGenerator",
 ]
+
+
+def __getattr__(name: str):
+    """Import public classes lazily on first access."""
+    if name in _EXPORTS:
+        value = getattr(import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
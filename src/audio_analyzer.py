@@ -8,18 +8,58 @@ Provides audio analysis features including:
 - Spectral analysis
 """
 
+import functools
+import hashlib
 import logging
-from dataclasses import dataclass, field
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Optional, List, Dict, Any, Tuple
 import numpy as np
 
 import librosa
 
+from src.utils.config import Config
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _zscore(x: np.ndarray) -> np.ndarray:
+    """Standardize along the last axis (zero mean, unit population std)."""
+    return (x - x.mean(axis=-1, keepdims=True)) / x.std(axis=-1, keepdims=True)
+
+
+@functools.lru_cache(maxsize=None)
+def _spectral_flux_kernel():
+    """Compile the Numba spectral flux kernel on first use (numba ships with librosa)."""
+    from numba import njit
+
+    # Not parallel=True: analysis stages run on worker threads, and launching
+    # numba's parallel kernels from them can hang the TBB threading layer
+    @njit(fastmath=True, cache=True)
+    def spectral_flux(S):
+        # Mean half-wave rectified increase between consecutive frames of a
+        # (freq, time) spectrogram: librosa's diff, max(0, .) and mean over
+        # frequency fused into one pass without temporaries
+        n_bins, n_frames = S.shape
+        flux = np.zeros(n_frames, dtype=np.float32)
+        for t in range(1, n_frames):
+            total = 0.0
+            for f in range(n_bins):
+                diff = S[f, t] - S[f, t - 1]
+                if diff > 0:
+                    total += diff
+            flux[t] = total / n_bins
+        return flux
+
+    return spectral_flux
+
+
+@dataclass(slots=True)
 class AudioAnalysis:
     """Complete audio analysis result."""
 
@@ -28,8 +68,10 @@ class AudioAnalysis:
     time_signature: str  # Estimated time signature (e.g., "4/4")
     duration: float  # Duration in seconds
     sample_rate: int  # Sample rate in Hz
-    beats: List[float] = field(default_factory=list)  # Beat times in seconds
-    onsets: List[float] = field(default_factory=list)  # Onset times in seconds
+    # Beat/onset times in seconds, kept as float arrays (8 bytes per event rather
+    # than a boxed float per list item) so they can be searched/compared directly
+    beats: np.ndarray = field(default_factory=lambda: np.empty(0))
+    onsets: np.ndarray = field(default_factory=lambda: np.empty(0))
     chroma: Optional[np.ndarray] = None  # Chromagram
     spectral_centroid: Optional[float] = None  # Average spectral centroid
     rms_energy: Optional[float] = None  # Average RMS energy
@@ -64,27 +106,95 @@ class AudioAnalyzer:
         [6.33, 2.68, 3.52, 5.38, 2.60, 3.53, 2.54, 4.75, 3.98, 2.69, 3.34, 3.17]
     )
 
+    # All 24 key profiles as rows (C major, C minor, C# major, ...), z-scored
+    # once so correlating a chroma vector with every key is one product.
+    # Row i of _ROTATIONS indexes a profile as np.roll(profile, i)
+    _ROTATIONS = (np.arange(12) - np.arange(12)[:, None]) % 12
+    KEY_PROFILES = _zscore(
+        np.stack([MAJOR_PROFILE[_ROTATIONS], MINOR_PROFILE[_ROTATIONS]], axis=1).reshape(24, 12)
+    )
+    # Key name for each row of KEY_PROFILES
+    KEY_LABELS = tuple(f"{name} {mode}" for name in KEY_NAMES for mode in ("major", "minor"))
+
+    # FFT size of the spectrogram shared by beat, onset and spectral analysis
+    # (librosa's default for each of them)
+    N_FFT = 2048
+
+    # Spectrogram frames computed at a time by analyze(), so the STFT stage uses
+    # a fixed amount of memory (~16 MB) however long the audio is
+    STFT_BLOCK_FRAMES = 2048
+
+    # analyze() results shared by all instances, keyed by the file's (abspath,
+    # mtime_ns, size) plus the settings that affect the result, so an edited or
+    # replaced file is analyzed again
+    _analysis_cache: "OrderedDict[Tuple[Any, ...], AudioAnalysis]" = OrderedDict()
+    _analysis_cache_lock = threading.Lock()
+    ANALYSIS_CACHE_SIZE = 64
+
     def __init__(
         self,
         sample_rate: int = 22050,
         hop_length: int = 512,
+        onset_backend: str = Config.ONSET_BACKEND,
+        key_chroma: str = Config.KEY_CHROMA,
+        num_workers: int = 2,
+        cache_dir: Optional[str | Path] = None,
     ):
         """Initialize the audio analyzer.
 
         Args:
             sample_rate: Target sample rate for analysis
             hop_length: Hop length for spectral analysis
+            onset_backend: 'librosa', or 'numba' to compute the onset strength
+                envelope with a compiled spectral flux kernel
+            key_chroma: 'cqt' to detect the key from a constant-Q chromagram,
+                or 'stft' to derive the chromagram from the spectrogram shared
+                with beat and onset analysis (no extra transform)
+            num_workers: Threads running the independent analysis stages of
+                analyze(); 1 runs them one after another
+            cache_dir: Optional directory where chromagrams (the costliest
+                stage) are kept between runs, keyed by the audio content
+
+        Raises:
+            ValueError: If onset_backend or key_chroma is not supported
         """
+        if onset_backend not in Config.AVAILABLE_ONSET_BACKENDS:
+            raise ValueError(
+                f"Unsupported onset backend '{onset_backend}'. "
+                f"Options: {', '.join(Config.AVAILABLE_ONSET_BACKENDS)}"
+            )
+        if key_chroma not in Config.AVAILABLE_KEY_CHROMAS:
+            raise ValueError(
+                f"Unsupported key chroma '{key_chroma}'. "
+                f"Options: {', '.join(Config.AVAILABLE_KEY_CHROMAS)}"
+            )
+
         self.sample_rate = sample_rate
         self.hop_length = hop_length
+        self.onset_backend = onset_backend
+        self.key_chroma = key_chroma
+        self.num_workers = max(1, num_workers)
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        # Last decoded file as ((abspath, mtime_ns, size), samples); see _load()
+        self._last_load: Optional[Tuple[Tuple[str, int, int], np.ndarray]] = None
+
+        logger.info(
+            f"AudioAnalyzer initialized (sr={sample_rate}, hop={hop_length}, "
+            f"onsets={onset_backend}, chroma={key_chroma})"
+        )
 
-        logger.info(f"AudioAnalyzer initialized (sr={sample_rate}, hop={hop_length})")
-
-    def analyze(self, audio_path: str | Path) -> AudioAnalysis:
+    def analyze(self, audio_path: str | Path, audio: Optional[np.ndarray] = None) -> AudioAnalysis:
         """Perform comprehensive audio analysis.
 
+        Results for files read from disk are memoized per (path, mtime, size)
+        and analyzer settings, so analyzing the same unchanged file again
+        returns at once.
+
         Args:
             audio_path: Path to audio file
+            audio: Optional mono samples of the file already decoded at
+                ``self.sample_rate``; skips decoding the file again (and the
+                memoized results, which are keyed by the file)
 
         Returns:
             AudioAnalysis with all detected features
@@ -95,25 +205,65 @@ class AudioAnalyzer:
         """
         audio_path = Path(audio_path)
 
-        if not audio_path.exists():
+        if audio is None and not audio_path.exists():
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
+        cache_key = None
+        if audio is None:
+            stat = os.stat(audio_path)
+            cache_key = (
+                os.path.abspath(audio_path),
+                stat.st_mtime_ns,
+                stat.st_size,
+                self.sample_rate,
+                self.hop_length,
+                self.onset_backend,
+                self.key_chroma,
+            )
+            with self._analysis_cache_lock:
+                cached = self._analysis_cache.get(cache_key)
+                if cached is not None:
+                    self._analysis_cache.move_to_end(cache_key)
+                    logger.info(f"Using memoized analysis: {audio_path.name}")
+                    return replace(cached, metadata=dict(cached.metadata))
+
         logger.info(f"Analyzing audio: {audio_path.name}")
 
         try:
             # Load audio
-            y, sr = librosa.load(str(audio_path), sr=self.sample_rate, mono=True)
+            if audio is None:
+                y, sr = self._load(audio_path)
+            else:
+                y, sr = audio, self.sample_rate
             duration = librosa.get_duration(y=y, sr=sr)
 
             logger.info(f"Loaded audio: {duration:.2f}s at {sr}Hz")
 
-            # Perform analyses
-            tempo, beats = self._detect_tempo_and_beats(y, sr)
-            key = self._detect_key(y, sr)
+            stft_chroma = self.key_chroma == "stft"
+
+            def spectral_analyses():
+                # One log-mel spectrogram feeds beat tracking and onset detection,
+                # which would otherwise each compute their own from the signal
+                mel, spectral_centroid, rms_energy, chroma = self._spectral_features(
+                    y, sr, chroma=stft_chroma
+                )
+                tempo, beats = self._detect_tempo_and_beats(y, sr, mel)
+                onsets = self._detect_onsets(y, sr, mel)
+                key = self._detect_key(y, sr, chroma) if stft_chroma else None
+                return tempo, beats, onsets, spectral_centroid, rms_energy, key
+
+            # Key detection (constant-Q chroma) is the slowest stage and shares
+            # nothing with the spectrogram stages, so they run side by side;
+            # the FFT and filtering kernels underneath release the GIL. STFT
+            # chroma comes from the shared spectrogram, so it runs in that stage
+            with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
+                spectral = executor.submit(spectral_analyses)
+                cqt_key = None if stft_chroma else executor.submit(self._detect_key, y, sr)
+                tempo, beats, onsets, spectral_centroid, rms_energy, key = spectral.result()
+                if cqt_key is not None:
+                    key = cqt_key.result()
+
             time_signature = self._estimate_time_signature(tempo, beats)
-            onsets = self._detect_onsets(y, sr)
-            spectral_centroid = self._compute_spectral_centroid(y, sr)
-            rms_energy = self._compute_rms_energy(y)
 
             result = AudioAnalysis(
                 tempo=tempo,
@@ -121,8 +271,8 @@ class AudioAnalyzer:
                 time_signature=time_signature,
                 duration=duration,
                 sample_rate=sr,
-                beats=beats.tolist() if isinstance(beats, np.ndarray) else beats,
-                onsets=onsets.tolist() if isinstance(onsets, np.ndarray) else onsets,
+                beats=np.asarray(beats, dtype=np.float64),
+                onsets=np.asarray(onsets, dtype=np.float64),
                 spectral_centroid=spectral_centroid,
                 rms_energy=rms_energy,
                 metadata={
@@ -132,6 +282,14 @@ class AudioAnalyzer:
             )
 
             logger.info(f"Analysis complete: {result}")
+
+            if cache_key is not None:
+                with self._analysis_cache_lock:
+                    self._analysis_cache[cache_key] = replace(
+                        result, metadata=dict(result.metadata)
+                    )
+                    if len(self._analysis_cache) > self.ANALYSIS_CACHE_SIZE:
+                        self._analysis_cache.popitem(last=False)
             return result
 
         except Exception as e:
@@ -139,20 +297,81 @@ class AudioAnalyzer:
             logger.error(error_msg)
             raise RuntimeError(error_msg)
 
-    def _detect_tempo_and_beats(self, y: np.ndarray, sr: int) -> Tuple[float, np.ndarray]:
+    def _spectral_features(
+        self, y: np.ndarray, sr: int, chroma: bool = False
+    ) -> Tuple[np.ndarray, float, float, Optional[np.ndarray]]:
+        """Compute the log-mel spectrogram, spectral centroid, RMS energy and chromagram.
+
+        The magnitude STFT (librosa's centered framing) is computed
+        STFT_BLOCK_FRAMES frames at a time and reduced to mel bands, centroids
+        and chroma before the next block, so only those reductions grow with
+        the audio length. Frame RMS is taken from the same block of samples
+        while it is in cache, rather than in a second pass over the signal.
+
+        Args:
+            y: Audio time series
+            sr: Sample rate
+            chroma: Also compute the STFT chromagram (see _stft_chroma())
+
+        Returns:
+            Tuple of (log-power mel spectrogram, average spectral centroid in Hz,
+            average RMS energy, chromagram or None)
+        """
+        hop = self.hop_length
+        n_frames = 1 + len(y) // hop
+        padded = np.pad(y, self.N_FFT // 2)
+
+        mel_blocks = []
+        centroid_blocks = []
+        rms_blocks = []
+        chroma_blocks = []
+        for start in range(0, n_frames, self.STFT_BLOCK_FRAMES):
+            stop = min(start + self.STFT_BLOCK_FRAMES, n_frames)
+            block = padded[start * hop : (stop - 1) * hop + self.N_FFT]
+            S = np.abs(librosa.stft(block, n_fft=self.N_FFT, hop_length=hop, center=False))
+            power = S**2
+            mel_blocks.append(librosa.feature.melspectrogram(S=power, sr=sr))
+            centroid_blocks.append(
+                librosa.feature.spectral_centroid(S=S, sr=sr, n_fft=self.N_FFT)
+            )
+            # Same frames as librosa.feature.rms(y=y, hop_length=hop)
+            rms_blocks.append(
+                librosa.feature.rms(y=block, frame_length=self.N_FFT, hop_length=hop, center=False)
+            )
+            if chroma:
+                chroma_blocks.append(self._stft_chroma(S=power, sr=sr))
+
+        mel = librosa.power_to_db(np.concatenate(mel_blocks, axis=-1))
+        centroid = float(np.mean(np.concatenate(centroid_blocks, axis=-1)))
+        rms = float(np.mean(np.concatenate(rms_blocks, axis=-1)))
+        return mel, centroid, rms, np.concatenate(chroma_blocks, axis=-1) if chroma else None
+
+    def _detect_tempo_and_beats(
+        self, y: np.ndarray, sr: int, mel: Optional[np.ndarray] = None
+    ) -> Tuple[float, np.ndarray]:
         """Detect tempo and beat positions.
 
         Args:
             y: Audio time series
             sr: Sample rate
+            mel: Optional log-power mel spectrogram of y; computed if omitted
 
         Returns:
             Tuple of (tempo in BPM, beat times in seconds)
         """
         logger.debug("Detecting tempo and beats...")
 
+        # Same onset envelope beat_track() builds itself (median over mel bands)
+        onset_envelope = None
+        if mel is not None:
+            onset_envelope = librosa.onset.onset_strength(
+                S=mel, sr=sr, hop_length=self.hop_length, aggregate=np.median
+            )
+
         # Get tempo and beat frames
-        tempo, beat_frames = librosa.beat.beat_track(y=y, sr=sr, hop_length=self.hop_length)
+        tempo, beat_frames = librosa.beat.beat_track(
+            y=y, sr=sr, onset_envelope=onset_envelope, hop_length=self.hop_length
+        )
 
         # Convert frames to time
         beat_times = librosa.frames_to_time(beat_frames, sr=sr, hop_length=self.hop_length)
@@ -165,7 +384,7 @@ class AudioAnalyzer:
 
         return float(tempo), beat_times
 
-    def _detect_key(self, y: np.ndarray, sr: int) -> str:
+    def _detect_key(self, y: np.ndarray, sr: int, chroma: Optional[np.ndarray] = None) -> str:
         """Detect musical key using chromagram analysis.
 
         Uses Krumhansl-Schmuckler key-finding algorithm.
@@ -173,6 +392,7 @@ class AudioAnalyzer:
         Args:
             y: Audio time series
             sr: Sample rate
+            chroma: Optional precomputed chromagram of y; computed if omitted
 
         Returns:
             Key signature string (e.g., "C major", "A minor")
@@ -180,35 +400,88 @@ class AudioAnalyzer:
         logger.debug("Detecting key signature...")
 
         # Compute chromagram
-        chroma = librosa.feature.chroma_cqt(y=y, sr=sr, hop_length=self.hop_length)
+        if chroma is None:
+            chroma = self._chroma(y, sr)
 
         # Get mean chroma vector
         chroma_mean = np.mean(chroma, axis=1)
 
-        # Correlate with key profiles
-        best_key = None
-        best_correlation = -1
+        # A flat chroma vector (e.g. silence) correlates with no key
+        if not np.std(chroma_mean) > 0:
+            logger.info("Detected key: Unknown (flat chroma)")
+            return "Unknown"
+
+        # Pearson correlation with all 24 key profiles at once
+        correlations = self.KEY_PROFILES @ _zscore(chroma_mean) / len(chroma_mean)
+        best = int(np.argmax(correlations))
+        best_key = self.KEY_LABELS[best]
+
+        logger.info(f"Detected key: {best_key} (correlation: {correlations[best]:.3f})")
 
-        for i in range(12):
-            # Rotate profiles to match each key
-            major_rotated = np.roll(self.MAJOR_PROFILE, i)
-            minor_rotated = np.roll(self.MINOR_PROFILE, i)
+        return best_key
 
-            # Calculate correlation
-            major_corr = np.corrcoef(chroma_mean, major_rotated)[0, 1]
-            minor_corr = np.corrcoef(chroma_mean, minor_rotated)[0, 1]
+    def _chroma(self, y: np.ndarray, sr: int) -> np.ndarray:
+        """Compute the key detection chromagram, reusing a cached one for the same audio.
 
-            if major_corr > best_correlation:
-                best_correlation = major_corr
-                best_key = f"{self.KEY_NAMES[i]} major"
+        Only the constant-Q chromagram is cached; the STFT one is cheaper to
+        recompute than to hash the audio for.
 
-            if minor_corr > best_correlation:
-                best_correlation = minor_corr
-                best_key = f"{self.KEY_NAMES[i]} minor"
+        Args:
+            y: Audio time series
+            sr: Sample rate
+
+        Returns:
+            Chromagram (12, frames)
+        """
+        if self.key_chroma == "stft":
+            return self._stft_chroma(y=y, sr=sr)
 
-        logger.info(f"Detected key: {best_key} (correlation: {best_correlation:.3f})")
+        if self.cache_dir is None:
+            return librosa.feature.chroma_cqt(y=y, sr=sr, hop_length=self.hop_length)
 
-        return best_key or "Unknown"
+        digest = hashlib.blake2b(np.ascontiguousarray(y), digest_size=16)
+        digest.update(f"{y.dtype}:{sr}:{self.hop_length}:{librosa.__version__}".encode())
+        cache_path = self.cache_dir / f"chroma_{digest.hexdigest()}.npy"
+
+        try:
+            chroma = np.load(cache_path)
+            logger.debug(f"Using cached chromagram: {cache_path}")
+            return chroma
+        except (OSError, ValueError):
+            pass
+
+        chroma = librosa.feature.chroma_cqt(y=y, sr=sr, hop_length=self.hop_length)
+        try:
+            # Written to a temporary file and renamed, so readers never see a partial file
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, chroma)
+            os.replace(tmp_name, cache_path)
+        except OSError as e:
+            logger.warning(f"Failed to cache chromagram {cache_path}: {e}")
+        return chroma
+
+    def _stft_chroma(
+        self, sr: int, y: Optional[np.ndarray] = None, S: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Compute an STFT chromagram from audio or a power spectrogram.
+
+        Tuning is fixed at A440 rather than estimated, so a chromagram built
+        block by block from the shared spectrogram matches one computed in a
+        single pass.
+
+        Args:
+            sr: Sample rate
+            y: Audio time series
+            S: Power spectrogram (N_FFT, centered framing), used instead of y
+
+        Returns:
+            Chromagram (12, frames)
+        """
+        return librosa.feature.chroma_stft(
+            y=y, S=S, sr=sr, n_fft=self.N_FFT, hop_length=self.hop_length, tuning=0.0
+        )
 
     def _estimate_time_signature(self, tempo: float, beats: np.ndarray) -> str:
         """Estimate time signature from tempo and beat pattern.
@@ -237,49 +510,107 @@ class AudioAnalyzer:
         else:
             return "4/4"  # Default to 4/4
 
-    def _detect_onsets(self, y: np.ndarray, sr: int) -> np.ndarray:
+    def _detect_onsets(
+        self, y: np.ndarray, sr: int, mel: Optional[np.ndarray] = None
+    ) -> np.ndarray:
         """Detect note onsets in audio.
 
         Args:
             y: Audio time series
             sr: Sample rate
+            mel: Optional log-power mel spectrogram of y; computed if omitted
 
         Returns:
             Array of onset times in seconds
         """
         logger.debug("Detecting onsets...")
 
-        onset_frames = librosa.onset.onset_detect(y=y, sr=sr, hop_length=self.hop_length)
+        if mel is None:
+            mel = librosa.power_to_db(
+                librosa.feature.melspectrogram(
+                    y=y, sr=sr, n_fft=self.N_FFT, hop_length=self.hop_length
+                )
+            )
+        if self.onset_backend == "numba":
+            onset_envelope = self._onset_strength(mel)
+        else:
+            onset_envelope = librosa.onset.onset_strength(S=mel, sr=sr, hop_length=self.hop_length)
+        onset_frames = librosa.onset.onset_detect(
+            y=y, sr=sr, onset_envelope=onset_envelope, hop_length=self.hop_length
+        )
         onset_times = librosa.frames_to_time(onset_frames, sr=sr, hop_length=self.hop_length)
 
         logger.info(f"Detected {len(onset_times)} onsets")
 
         return onset_times
 
-    def _compute_spectral_centroid(self, y: np.ndarray, sr: int) -> float:
-        """Compute average spectral centroid (brightness indicator).
+    def _onset_strength(self, mel: np.ndarray) -> np.ndarray:
+        """Compute the onset strength envelope with the Numba spectral flux kernel.
+
+        Equivalent to librosa.onset.onset_strength() with its default settings.
 
         Args:
-            y: Audio time series
-            sr: Sample rate
+            mel: Log-power mel spectrogram
 
         Returns:
-            Average spectral centroid in Hz
+            Onset strength per frame
         """
-        centroid = librosa.feature.spectral_centroid(y=y, sr=sr, hop_length=self.hop_length)
-        return float(np.mean(centroid))
+        flux = _spectral_flux_kernel()(np.ascontiguousarray(mel, dtype=np.float32))
+
+        # Shift by half a window to undo the centered framing, as librosa does
+        offset = self.N_FFT // (2 * self.hop_length)
+        return np.concatenate((np.zeros(offset, dtype=flux.dtype), flux))[: mel.shape[-1]]
+
+    def _load(self, audio_path: str | Path) -> Tuple[np.ndarray, int]:
+        """Decode a file at ``self.sample_rate``, reusing the last file decoded.
 
-    def _compute_rms_energy(self, y: np.ndarray) -> float:
-        """Compute average RMS energy (loudness indicator).
+        Calling several of the get_* helpers (or analyze()) on one file then
+        decodes it only once. An edited or replaced file is decoded again.
 
         Args:
-            y: Audio time series
+            audio_path: Path to audio file
 
         Returns:
-            Average RMS energy
+            Tuple of (mono samples, sample rate)
         """
-        rms = librosa.feature.rms(y=y, hop_length=self.hop_length)
-        return float(np.mean(rms))
+        stat = os.stat(audio_path)
+        key = (os.path.abspath(audio_path), stat.st_mtime_ns, stat.st_size)
+
+        last = self._last_load
+        if last is not None and last[0] == key:
+            return last[1], self.sample_rate
+
+        y = self._decode(audio_path)
+        self._last_load = (key, y)
+        return y, self.sample_rate
+
+    def _decode(self, audio_path: str | Path) -> np.ndarray:
+        """Decode a file to mono float32 at ``self.sample_rate``.
+
+        Reads with soundfile and resamples with soxr directly (both ship with
+        librosa), skipping librosa.load's per-call overhead. Formats libsndfile
+        cannot read fall back to librosa.load and its audioread backend.
+
+        Args:
+            audio_path: Path to audio file
+
+        Returns:
+            Mono samples at ``self.sample_rate``
+        """
+        import soundfile as sf
+        import soxr
+
+        try:
+            y, sr = sf.read(str(audio_path), dtype="float32", always_2d=False)
+        except sf.LibsndfileError:
+            y, _ = librosa.load(str(audio_path), sr=self.sample_rate, mono=True)
+            return y
+
+        if y.ndim > 1:
+            y = y.mean(axis=-1)
+        if sr != self.sample_rate:
+            y = soxr.resample(y, sr, self.sample_rate, quality="HQ")
+        return np.ascontiguousarray(y, dtype=np.float32)
 
     def get_tempo(self, audio_path: str | Path) -> float:
         """Quick tempo detection.
@@ -290,7 +621,7 @@ class AudioAnalyzer:
         Returns:
             Tempo in BPM
         """
-        y, sr = librosa.load(str(audio_path), sr=self.sample_rate, mono=True)
+        y, sr = self._load(audio_path)
         tempo, _ = self._detect_tempo_and_beats(y, sr)
         return tempo
 
@@ -303,7 +634,7 @@ class AudioAnalyzer:
         Returns:
             Key signature string
         """
-        y, sr = librosa.load(str(audio_path), sr=self.sample_rate, mono=True)
+        y, sr = self._load(audio_path)
         return self._detect_key(y, sr)
 
     def get_beat_times(self, audio_path: str | Path) -> List[float]:
@@ -315,6 +646,6 @@ class AudioAnalyzer:
         Returns:
             List of beat times in seconds
         """
-        y, sr = librosa.load(str(audio_path), sr=self.sample_rate, mono=True)
+        y, sr = self._load(audio_path)
         _, beat_times = self._detect_tempo_and_beats(y, sr)
         return beat_times.tolist()
@@ -2,20 +2,66 @@
 
 import hashlib
 import logging
+import os
 import subprocess
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 import json
 import ffmpeg
+import numpy as np
 
 from .utils.config import Config
+from .utils.transcription_cache import TranscriptionCache
 
 logger = logging.getLogger(__name__)
 
+# Caps the ffmpeg/ffprobe processes running at once, so batch transcription and
+# concurrent callers queue for a slot instead of oversubscribing CPU and disk
+_ffmpeg_slots = threading.BoundedSemaphore(max(1, Config.FFMPEG_CONCURRENCY))
+
+
+def _run_ffmpeg(args: List[str], capture_stdout: bool = False) -> bytes:
+    """Run ffmpeg with the given arguments, without the ffmpeg-python graph layer.
+
+    Only errors are logged to stderr, so a long run does not buffer its progress
+    output in memory.
+
+    Args:
+        args: Arguments after the ffmpeg executable
+        capture_stdout: Return what ffmpeg writes to stdout (e.g. ``pipe:`` output)
+
+    Returns:
+        Captured stdout, or empty bytes
+
+    Raises:
+        subprocess.CalledProcessError: If ffmpeg exits with an error (stderr attached)
+    """
+    with _ffmpeg_slots:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-loglevel", "error", *args],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            check=True,
+        )
+    return result.stdout or b""
+
 
 class AudioProcessor:
     """Handles audio file validation, conversion, and processing using FFmpeg."""
 
+    # ffprobe results shared by all instances, keyed by (abspath, mtime_ns, size) so
+    # an edited or replaced file is probed again
+    _info_cache: "OrderedDict[Tuple[str, int, int], Dict[str, Any]]" = OrderedDict()
+    _info_cache_lock = threading.Lock()
+    INFO_CACHE_SIZE = 256
+
+    # Set once any instance has found ffmpeg, so later instances skip the check
+    _ffmpeg_available = False
+
     def __init__(self):
         """Initialize the AudioProcessor."""
         Config.ensure_temp_dir()
@@ -25,16 +71,24 @@ class AudioProcessor:
     def _check_ffmpeg(self) -> None:
         """Check if FFmpeg is installed and available.
 
+        Runs ``ffmpeg -version`` only until it first succeeds in this process;
+        a failed check is repeated by the next instance.
+
         Raises:
             RuntimeError: If FFmpeg is not installed
         """
+        if AudioProcessor._ffmpeg_available:
+            return
+
         try:
-            subprocess.run(
-                ["ffmpeg", "-version"],
-                capture_output=True,
-                check=True,
-                timeout=5,
-            )
+            with _ffmpeg_slots:
+                subprocess.run(
+                    ["ffmpeg", "-version"],
+                    capture_output=True,
+                    check=True,
+                    timeout=5,
+                )
+            AudioProcessor._ffmpeg_available = True
             logger.info("FFmpeg is available")
         except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
             error_msg = (
@@ -45,29 +99,91 @@ class AudioProcessor:
             logger.error(error_msg)
             raise RuntimeError(error_msg)
 
-    def validate_audio_file(self, file_path: str | Path) -> tuple[bool, Optional[str]]:
+    def validate_audio_file(
+        self, file_path: str | Path, quick: bool = False
+    ) -> tuple[bool, Optional[str]]:
         """Validate an audio file for format, size, and integrity.
 
         Args:
             file_path: Path to the audio file
+            quick: Only check existence, format and size, skipping the ffprobe
+                integrity check (and its process start-up)
 
         Returns:
             Tuple of (is_valid, error_message)
         """
+        if quick:
+            error = self._check_file(Path(file_path))
+            return error is None, error
+
+        is_valid, info_or_error = self._validate_and_info(file_path)
+        return (True, None) if is_valid else (False, info_or_error)
+
+    def validate_and_info_many(
+        self, file_paths: List[str | Path], max_workers: Optional[int] = None
+    ) -> List[Tuple[bool, Dict[str, Any] | str]]:
+        """Validate many files and read their metadata concurrently.
+
+        Each file needs its own ffprobe process; running them on a thread pool
+        overlaps the process start-up and probing time across files. At most
+        Config.FFMPEG_CONCURRENCY probes run at once whatever max_workers is.
+
+        Args:
+            file_paths: Paths to the audio files
+            max_workers: Maximum number of concurrent probes (default: CPU count)
+
+        Returns:
+            List of (is_valid, audio_info_or_error_message) tuples, in input order
+        """
+        if not file_paths:
+            return []
+
+        max_workers = max_workers or os.cpu_count() or 1
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(file_paths))) as executor:
+            return list(executor.map(self._validate_and_info, file_paths))
+
+    def _validate_and_info(self, file_path: str | Path) -> Tuple[bool, Dict[str, Any] | str]:
+        """Validate a file and return its metadata from a single probe.
+
+        Args:
+            file_path: Path to the audio file
+
+        Returns:
+            Tuple of (is_valid, audio_info_or_error_message)
+        """
         file_path = Path(file_path)
 
+        error = self._check_file(file_path)
+        if error is not None:
+            return False, error
+
+        # Verify file integrity with ffprobe
+        try:
+            return True, self.get_audio_info(file_path)
+        except Exception as e:
+            return False, f"File integrity check failed: {str(e)}"
+
+    def _check_file(self, file_path: Path) -> Optional[str]:
+        """Check a file's existence, format and size without probing it.
+
+        Args:
+            file_path: Path to the audio file
+
+        Returns:
+            Error message, or None if the checks pass
+        """
         # Check if file exists
         if not file_path.exists():
-            return False, f"File not found: {file_path}"
+            return f"File not found: {file_path}"
 
         # Check if it's a file
         if not file_path.is_file():
-            return False, f"Not a file: {file_path}"
+            return f"Not a file: {file_path}"
 
         # Check file extension
         supported_formats = Config.get_supported_formats()
         if file_path.suffix.lower() not in supported_formats:
-            return False, (
+            return (
                 f"Unsupported format: {file_path.suffix}. "
                 f"Supported formats: {', '.join(supported_formats)}"
             )
@@ -75,25 +191,22 @@ class AudioProcessor:
         # Check file size
         file_size = file_path.stat().st_size
         if file_size == 0:
-            return False, "File is empty"
+            return "File is empty"
 
         if file_size > Config.MAX_FILE_SIZE:
-            return False, (
+            return (
                 f"File too large: {file_size / (1024**2):.2f} MB. "
                 f"Max size: {Config.MAX_FILE_SIZE_MB} MB"
             )
 
-        # Verify file integrity with ffprobe
-        try:
-            self.get_audio_info(file_path)
-        except Exception as e:
-            return False, f"File integrity check failed: {str(e)}"
-
-        return True, None
+        return None
 
     def get_audio_info(self, file_path: str | Path) -> Dict[str, Any]:
         """Get audio file metadata using ffprobe.
 
+        Results are memoized per (path, mtime, size), so probing the same unchanged
+        file again (e.g. validation followed by transcription) does not rerun ffprobe.
+
         Args:
             file_path: Path to the audio file
 
@@ -106,7 +219,21 @@ class AudioProcessor:
         file_path = Path(file_path)
 
         try:
-            probe = ffmpeg.probe(str(file_path))
+            stat = os.stat(file_path)
+            cache_key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            cache_key = None
+
+        if cache_key is not None:
+            with self._info_cache_lock:
+                cached = self._info_cache.get(cache_key)
+                if cached is not None:
+                    self._info_cache.move_to_end(cache_key)
+                    return dict(cached)
+
+        try:
+            with _ffmpeg_slots:
+                probe = ffmpeg.probe(str(file_path))
 
             # Extract audio stream information
             audio_streams = [
@@ -130,6 +257,13 @@ class AudioProcessor:
             }
 
             logger.info(f"Audio info for {file_path.name}: {metadata}")
+
+            if cache_key is not None:
+                with self._info_cache_lock:
+                    self._info_cache[cache_key] = dict(metadata)
+                    if len(self._info_cache) > self.INFO_CACHE_SIZE:
+                        self._info_cache.popitem(last=False)
+
             return metadata
 
         except ffmpeg.Error as e:
@@ -141,27 +275,35 @@ class AudioProcessor:
             logger.error(error_msg)
             raise RuntimeError(error_msg)
 
-    def _get_file_hash(self, file_path: Path) -> str:
-        """Calculate MD5 hash of a file for caching purposes.
+    def _get_file_hash(self, file_path: Path, content_addressed: bool = False) -> str:
+        """Calculate a hash identifying a file for caching purposes.
+
+        By default the hash covers the file's resolved path, mtime and size,
+        which takes one stat() however large the file is; an edited or replaced
+        file gets a new hash. A content hash reads the whole file but also
+        matches copies and renamed files; it shares the transcription cache's
+        BLAKE2b digests, which are memoized per (path, mtime, size).
 
         Args:
             file_path: Path to the file
+            content_addressed: Hash the file's content instead of its metadata
 
         Returns:
-            MD5 hash string
+            Hex digest string
         """
-        md5_hash = hashlib.md5()
-        with open(file_path, "rb") as f:
-            # Read in chunks to handle large files
-            for chunk in iter(lambda: f.read(4096), b""):
-                md5_hash.update(chunk)
-        return md5_hash.hexdigest()
+        if content_addressed:
+            return TranscriptionCache._file_key(file_path)
+
+        stat = os.stat(file_path)
+        identity = f"{file_path.resolve()}|{stat.st_mtime_ns}|{stat.st_size}"
+        return hashlib.blake2b(identity.encode("utf-8"), digest_size=8).hexdigest()
 
     def convert_to_wav(
         self,
         input_path: str | Path,
         sample_rate: int = Config.SAMPLE_RATE,
         channels: int = Config.CHANNELS,
+        content_addressed: bool = False,
     ) -> Path:
         """Convert audio file to WAV format optimized for Whisper.
 
@@ -169,6 +311,9 @@ class AudioProcessor:
             input_path: Path to input audio file
             sample_rate: Target sample rate (default: 16000 Hz for Whisper)
             channels: Number of audio channels (default: 1 for mono)
+            content_addressed: Key the cached WAV by the input's content rather
+                than its path, mtime and size, so copies and renamed files reuse
+                it (costs a full read of the input)
 
         Returns:
             Path to the converted WAV file
@@ -179,7 +324,7 @@ class AudioProcessor:
         input_path = Path(input_path)
 
         # Generate cache-friendly output filename using hash
-        file_hash = self._get_file_hash(input_path)
+        file_hash = self._get_file_hash(input_path, content_addressed)
         output_filename = f"{file_hash}_{sample_rate}hz_{channels}ch.wav"
         output_path = Config.TEMP_DIR / output_filename
 
@@ -191,21 +336,26 @@ class AudioProcessor:
         logger.info(f"Converting {input_path.name} to WAV format...")
 
         try:
-            stream = ffmpeg.input(str(input_path))
-            stream = ffmpeg.output(
-                stream,
-                str(output_path),
-                acodec="pcm_s16le",
-                ar=sample_rate,
-                ac=channels,
+            _run_ffmpeg(
+                [
+                    "-y",
+                    "-i",
+                    str(input_path),
+                    "-acodec",
+                    "pcm_s16le",
+                    "-ar",
+                    str(sample_rate),
+                    "-ac",
+                    str(channels),
+                    str(output_path),
+                ]
             )
-            ffmpeg.run(stream, overwrite_output=True, capture_stdout=True, capture_stderr=True)
 
             self._temp_files.append(output_path)
             logger.info(f"Converted to: {output_path}")
             return output_path
 
-        except ffmpeg.Error as e:
+        except subprocess.CalledProcessError as e:
             error_msg = f"FFmpeg conversion error: {e.stderr.decode() if e.stderr else str(e)}"
             logger.error(error_msg)
             raise RuntimeError(error_msg)
@@ -214,6 +364,61 @@ class AudioProcessor:
             logger.error(error_msg)
             raise RuntimeError(error_msg)
 
+    def extract_pcm_stream(
+        self,
+        input_path: str | Path,
+        sample_rate: int = Config.SAMPLE_RATE,
+        channels: int = Config.CHANNELS,
+    ) -> np.ndarray:
+        """Decode an audio or video file straight to float32 PCM in memory.
+
+        FFmpeg writes raw samples to a pipe that is read into a NumPy array, so
+        no intermediate WAV file is written, re-read or cleaned up.
+
+        Args:
+            input_path: Path to input audio or video file
+            sample_rate: Target sample rate (default: 16000 Hz for Whisper)
+            channels: Number of audio channels (default: 1 for mono)
+
+        Returns:
+            Float32 array of samples in [-1, 1], interleaved if channels > 1
+
+        Raises:
+            RuntimeError: If decoding fails
+        """
+        input_path = Path(input_path)
+
+        logger.info(f"Decoding {input_path.name} to PCM...")
+
+        try:
+            out = _run_ffmpeg(
+                [
+                    "-i",
+                    str(input_path),
+                    "-f",
+                    "f32le",
+                    "-acodec",
+                    "pcm_f32le",
+                    "-ar",
+                    str(sample_rate),
+                    "-ac",
+                    str(channels),
+                    "pipe:",
+                ],
+                capture_stdout=True,
+            )
+            # Copy out of the immutable bytes so torch.from_numpy gets a writable array
+            return np.frombuffer(out, dtype=np.float32).copy()
+
+        except subprocess.CalledProcessError as e:
+            error_msg = f"FFmpeg decode error: {e.stderr.decode() if e.stderr else str(e)}"
+            logger.error(error_msg)
+            raise RuntimeError(error_msg)
+        except Exception as e:
+            error_msg = f"Audio decoding failed: {str(e)}"
+            logger.error(error_msg)
+            raise RuntimeError(error_msg)
+
     def extract_audio_from_video(
         self,
         video_path: str | Path,
@@ -281,14 +486,25 @@ class AudioProcessor:
 
         try:
             duration = end_time - start_time
-            stream = ffmpeg.input(str(input_path), ss=start_time, t=duration)
-            stream = ffmpeg.output(stream, str(output_path), acodec="copy")
-            ffmpeg.run(stream, overwrite_output=True, capture_stdout=True, capture_stderr=True)
+            _run_ffmpeg(
+                [
+                    "-y",
+                    "-ss",
+                    str(start_time),
+                    "-t",
+                    str(duration),
+                    "-i",
+                    str(input_path),
+                    "-acodec",
+                    "copy",
+                    str(output_path),
+                ]
+            )
 
             logger.info(f"Trimmed audio saved to: {output_path}")
             return output_path
 
-        except ffmpeg.Error as e:
+        except subprocess.CalledProcessError as e:
             error_msg = f"FFmpeg trim error: {e.stderr.decode() if e.stderr else str(e)}"
             logger.error(error_msg)
             raise RuntimeError(error_msg)
@@ -3,21 +3,55 @@
 Converts audio recordings into MIDI files with pitch, timing, and velocity data.
 """
 
+import itertools
 import logging
+import threading
 from dataclasses import dataclass, field
+from functools import cached_property, wraps
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, Iterator, List, Dict, Any, Tuple
 import numpy as np
 
-from basic_pitch.inference import predict
-from basic_pitch import ICASSP_2022_MODEL_PATH
+from basic_pitch.inference import Model, predict, window_audio_file
+from basic_pitch import (
+    ICASSP_2022_MODEL_PATH,
+    FilenameSuffix,
+    build_icassp_2022_model_path,
+    note_creation,
+)
+from basic_pitch.constants import ANNOTATIONS_FPS, AUDIO_N_SAMPLES, AUDIO_SAMPLE_RATE, FFT_HOP
+
+from .utils.config import Config
+from .utils.prefetch import prefetch
 
 logger = logging.getLogger(__name__)
 
+# ONNX Runtime execution providers per device, with CPU as the fallback
+ONNX_PROVIDERS: Dict[str, List[str]] = {
+    "cpu": ["CPUExecutionProvider"],
+    "cuda": ["CUDAExecutionProvider", "CPUExecutionProvider"],
+    "coreml": ["CoreMLExecutionProvider", "CPUExecutionProvider"],
+}
 
-@dataclass
+_NOTE_NAMES = ("C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B")
+
+# Name with octave (e.g. C4, A#3) of every MIDI pitch, indexed by pitch
+_MIDI_NOTE_NAMES = tuple(f"{_NOTE_NAMES[pitch % 12]}{pitch // 12 - 1}" for pitch in range(128))
+
+
+def _midi_note_name(pitch: int) -> str:
+    """Convert a MIDI pitch to a note name with octave (e.g. C4, A#3)."""
+    if 0 <= pitch < 128:
+        return _MIDI_NOTE_NAMES[pitch]
+    return f"{_NOTE_NAMES[pitch % 12]}{pitch // 12 - 1}"
+
+
+@dataclass(slots=True)
 class Note:
-    """Represents a single musical note."""
+    """Represents a single musical note.
+
+    Slotted (no per-instance __dict__): a transcription holds thousands of these.
+    """
 
     pitch: int  # MIDI pitch (0-127)
     start: float  # Start time in seconds
@@ -33,10 +67,7 @@ class Note:
     @property
     def note_name(self) -> str:
         """Convert MIDI pitch to note name (e.g., C4, A#3)."""
-        note_names = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
-        octave = (self.pitch // 12) - 1
-        note = note_names[self.pitch % 12]
-        return f"{note}{octave}"
+        return _midi_note_name(self.pitch)
 
     def __repr__(self) -> str:
         return (
@@ -73,12 +104,29 @@ class MusicTranscriptionResult:
         """Get pitch range as note names."""
         if not self.notes:
             return ("N/A", "N/A")
-        note_names = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
-        low_oct = (self.pitch_range[0] // 12) - 1
-        low_note = note_names[self.pitch_range[0] % 12]
-        high_oct = (self.pitch_range[1] // 12) - 1
-        high_note = note_names[self.pitch_range[1] % 12]
-        return (f"{low_note}{low_oct}", f"{high_note}{high_oct}")
+        return (_midi_note_name(self.pitch_range[0]), _midi_note_name(self.pitch_range[1]))
+
+    @cached_property
+    def note_stats(self) -> Dict[str, float]:
+        """Velocity and duration statistics over all notes, computed once.
+
+        Returns:
+            Dictionary with average velocity and average/min/max note duration
+        """
+        if not self.notes:
+            return {"average_velocity": 0, "average_note_duration": 0}
+
+        count = len(self.notes)
+        velocities = np.fromiter((n.velocity for n in self.notes), dtype=np.float64, count=count)
+        durations = np.fromiter(
+            (n.end - n.start for n in self.notes), dtype=np.float64, count=count
+        )
+        return {
+            "average_velocity": float(velocities.mean()),
+            "average_note_duration": float(durations.mean()),
+            "min_note_duration": float(durations.min()),
+            "max_note_duration": float(durations.max()),
+        }
 
     def __repr__(self) -> str:
         return (
@@ -88,6 +136,33 @@ class MusicTranscriptionResult:
         )
 
 
+class _OnnxModel(Model):
+    """Basic Pitch ONNX model on a chosen ONNX Runtime execution provider.
+
+    basic_pitch's Model always creates its ONNX session on the CPU provider.
+    This subclass only swaps the session, so predict() and basic_pitch's
+    inference functions work with it unchanged.
+    """
+
+    def __init__(self, model_path: str | Path, providers: List[str]):
+        import onnxruntime as ort
+
+        self.model_type = Model.MODEL_TYPES.ONNX
+        self.model = ort.InferenceSession(str(model_path), providers=providers)
+
+
+def _serialized(func):
+    """Wrap a function so that only one thread runs it at a time."""
+    lock = threading.Lock()
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with lock:
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
 class MusicTranscriptionEngine:
     """Main music transcription engine using Spotify's Basic Pitch.
 
@@ -98,6 +173,25 @@ class MusicTranscriptionEngine:
     - Pitch bend detection
     """
 
+    # Sample rate Basic Pitch runs at; audio passed to transcribe() must use it
+    SAMPLE_RATE = AUDIO_SAMPLE_RATE
+
+    # Loaded Basic Pitch models shared by all engines in the process, by (model path, device)
+    _models: Dict[Tuple[str, str], Model] = {}
+    _models_lock = threading.Lock()
+
+    # Model windows per inference call on an accelerator; 1 keeps basic_pitch's
+    # own per-window behaviour on CPU
+    ACCELERATOR_BATCH_SIZE = 16
+
+    # Decoded audio longer than STREAMING_MIN_SECONDS is converted to notes in
+    # segments (see transcribe_streaming()), so the model output held in memory
+    # (~150 KB per second of audio) is bounded by the segment length instead of
+    # growing with the audio
+    STREAMING_MIN_SECONDS = 300
+    STREAMING_SEGMENT_SECONDS = 60
+    STREAMING_CONTEXT_SECONDS = 5
+
     def __init__(
         self,
         onset_threshold: float = 0.5,
@@ -107,6 +201,8 @@ class MusicTranscriptionEngine:
         maximum_frequency: Optional[float] = None,
         multiple_pitch_bends: bool = False,
         melodia_trick: bool = True,
+        model_path: Optional[str | Path] = None,
+        device: str = "cpu",
     ):
         """Initialize the music transcription engine.
 
@@ -120,7 +216,17 @@ class MusicTranscriptionEngine:
             maximum_frequency: Maximum frequency to detect (Hz). None = no limit.
             multiple_pitch_bends: Allow multiple simultaneous pitch bends.
             melodia_trick: Use melodia trick for monophonic sources.
+            model_path: Basic Pitch model to load. None = Config.MUSIC_MODEL_PATH,
+                else a quantized model if present, else the bundled model.
+            device: 'cpu', or 'cuda'/'coreml' to run the ONNX model through
+                ONNX Runtime on that execution provider (needs onnxruntime-gpu
+                for CUDA).
         """
+        if device not in ONNX_PROVIDERS:
+            raise ValueError(
+                f"Unsupported device '{device}'. Options: {', '.join(ONNX_PROVIDERS)}"
+            )
+
         self.onset_threshold = onset_threshold
         self.frame_threshold = frame_threshold
         self.minimum_note_length = minimum_note_length
@@ -128,8 +234,19 @@ class MusicTranscriptionEngine:
         self.maximum_frequency = maximum_frequency
         self.multiple_pitch_bends = multiple_pitch_bends
         self.melodia_trick = melodia_trick
+        self.device = device
+        if model_path:
+            self.model_path = Path(model_path)
+        elif device != "cpu":
+            # Accelerated execution goes through ONNX Runtime
+            self.model_path = build_icassp_2022_model_path(FilenameSuffix.onnx)
+        else:
+            self.model_path = self._default_model_path()
+        self.model = self._load_model(self.model_path, device)
+        self.batch_size = self.ACCELERATOR_BATCH_SIZE if device != "cpu" else 1
 
         logger.info("MusicTranscriptionEngine initialized with Basic Pitch")
+        logger.info(f"  Model: {self.model_path} ({device})")
         logger.info(f"  Onset threshold: {onset_threshold}")
         logger.info(f"  Frame threshold: {frame_threshold}")
         logger.info(f"  Minimum note length: {minimum_note_length}ms")
@@ -139,6 +256,7 @@ class MusicTranscriptionEngine:
         audio_path: str | Path,
         save_midi: bool = False,
         midi_path: Optional[str | Path] = None,
+        audio: Optional[np.ndarray] = None,
     ) -> MusicTranscriptionResult:
         """Transcribe audio file to musical notes.
 
@@ -146,6 +264,8 @@ class MusicTranscriptionEngine:
             audio_path: Path to audio file (MP3, WAV, FLAC, etc.)
             save_midi: Whether to save MIDI file
             midi_path: Custom path for MIDI output (optional)
+            audio: Optional mono samples of the file already decoded at
+                ``SAMPLE_RATE``; skips decoding the file again
 
         Returns:
             MusicTranscriptionResult with detected notes and metadata
@@ -156,23 +276,27 @@ class MusicTranscriptionEngine:
         """
         audio_path = Path(audio_path)
 
-        if not audio_path.exists():
+        if audio is None and not audio_path.exists():
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
         logger.info(f"Transcribing music from: {audio_path.name}")
 
         try:
             # Run Basic Pitch inference
-            model_output, midi_data, note_events = predict(
-                str(audio_path),
-                onset_threshold=self.onset_threshold,
-                frame_threshold=self.frame_threshold,
-                minimum_note_length=self.minimum_note_length,
-                minimum_frequency=self.minimum_frequency,
-                maximum_frequency=self.maximum_frequency,
-                multiple_pitch_bends=self.multiple_pitch_bends,
-                melodia_trick=self.melodia_trick,
-            )
+            if audio is None:
+                model_output, midi_data, note_events = predict(
+                    str(audio_path),
+                    model_or_model_path=self.model,
+                    onset_threshold=self.onset_threshold,
+                    frame_threshold=self.frame_threshold,
+                    minimum_note_length=self.minimum_note_length,
+                    minimum_frequency=self.minimum_frequency,
+                    maximum_frequency=self.maximum_frequency,
+                    multiple_pitch_bends=self.multiple_pitch_bends,
+                    melodia_trick=self.melodia_trick,
+                )
+            else:
+                midi_data, note_events = self._predict_array(audio)
 
             # Parse note events into Note objects
             notes = self._parse_notes(note_events)
@@ -188,6 +312,7 @@ class MusicTranscriptionEngine:
                     "source_file": str(audio_path),
                     "onset_threshold": self.onset_threshold,
                     "frame_threshold": self.frame_threshold,
+                    "model_path": str(self.model_path),
                 },
             )
 
@@ -212,39 +337,233 @@ class MusicTranscriptionEngine:
             logger.error(error_msg)
             raise RuntimeError(error_msg)
 
-    def _parse_notes(self, note_events: List) -> List[Note]:
-        """Parse Basic Pitch note events into Note objects.
+    @staticmethod
+    def _default_model_path() -> Path:
+        """Pick the configured model, preferring a quantized one when present.
+
+        Returns:
+            Path to the Basic Pitch model to load
+        """
+        if Config.MUSIC_MODEL_PATH:
+            return Config.MUSIC_MODEL_PATH
+        for quantized in (Config.QUANTIZED_MUSIC_MODEL_PATH, Config.INT8_MUSIC_MODEL_PATH):
+            if quantized.exists():
+                return quantized
+        return Path(ICASSP_2022_MODEL_PATH)
+
+    @classmethod
+    def _load_model(cls, model_path: str | Path, device: str = "cpu") -> Model:
+        """Load a Basic Pitch model, reusing it if already loaded in this process.
 
         Args:
-            note_events: List of note events from Basic Pitch
+            model_path: Path to the serialized model
+            device: 'cpu' for basic_pitch's default backend, else an ONNX_PROVIDERS key
 
         Returns:
-            List of Note objects
+            Loaded Basic Pitch Model
         """
-        notes = []
+        key = (str(model_path), device)
+        with cls._models_lock:
+            model = cls._models.get(key)
+            if model is None:
+                logger.info(f"Loading Basic Pitch model: {model_path} ({device})")
+                if device == "cpu":
+                    model = Model(model_path)
+                    if model.model_type == Model.MODEL_TYPES.TFLITE:
+                        # A TFLite interpreter must not be invoked from two threads
+                        # at once, and the model is shared by every engine
+                        model.predict = _serialized(model.predict)
+                else:
+                    model = _OnnxModel(model_path, ONNX_PROVIDERS[device])
+                cls._models[key] = model
+            return model
+
+    def _predict_array(self, audio: np.ndarray) -> Tuple[Any, List]:
+        """Run Basic Pitch on already decoded audio.
+
+        Mirrors basic_pitch.inference.predict(), which only accepts file paths:
+        the signal is cut into overlapping model windows, run through the model
+        and the frame outputs are converted to notes with the same settings.
+        Audio longer than STREAMING_MIN_SECONDS goes through
+        transcribe_streaming() instead, so memory use does not grow with length.
 
-        for event in note_events:
-            start_time, end_time, pitch, velocity, pitch_bend = event
+        Args:
+            audio: Mono float32 samples at ``SAMPLE_RATE``
 
-            # Convert velocity to 0-127 range
-            velocity_int = int(min(127, max(0, velocity * 127)))
+        Returns:
+            Tuple of (PrettyMIDI object, note events)
+        """
+        if len(audio) > self.STREAMING_MIN_SECONDS * AUDIO_SAMPLE_RATE:
+            note_events = list(itertools.chain.from_iterable(self.transcribe_streaming(audio)))
+        else:
+            n_frames = int(np.floor(len(audio) * ANNOTATIONS_FPS / AUDIO_SAMPLE_RATE))
+            outputs: Dict[str, List[np.ndarray]] = {"note": [], "onset": [], "contour": []}
+            for frames in self._model_frames(audio):
+                for name, value in frames.items():
+                    outputs[name].append(value)
+
+            times = note_creation.model_frames_to_time(n_frames)
+            note_events = [
+                (times[start], times[end], pitch, amplitude, bends)
+                for start, end, pitch, amplitude, bends in self._frames_to_notes(
+                    {name: np.concatenate(values)[:n_frames] for name, values in outputs.items()}
+                )
+            ]
 
-            # Calculate frequency from MIDI pitch
-            frequency = 440.0 * (2 ** ((pitch - 69) / 12))
+        midi_data = note_creation.note_events_to_midi(note_events, self.multiple_pitch_bends)
+        return midi_data, note_events
 
-            note = Note(
-                pitch=int(pitch),
-                start=float(start_time),
-                end=float(end_time),
-                velocity=velocity_int,
-                frequency=frequency,
-            )
-            notes.append(note)
+    def transcribe_streaming(self, audio: np.ndarray) -> Iterator[List[Tuple]]:
+        """Convert decoded audio to note events one segment at a time.
 
-        # Sort by start time
-        notes.sort(key=lambda n: n.start)
+        Model inference runs on a background thread, at most two batches ahead
+        of note creation. Notes are created for each STREAMING_SEGMENT_SECONDS
+        segment from its model output plus STREAMING_CONTEXT_SECONDS on either
+        side, and kept only if they start inside the segment, so notes at
+        segment boundaries are neither lost nor duplicated. Only a segment's
+        worth of model output is held at a time; a note is cut short if it
+        continues more than the context past the end of its segment.
 
-        return notes
+        basic_pitch scales the onsets it infers from frame changes by their
+        maximum over the whole input; here that maximum is per segment, so
+        results can differ slightly from a whole-file run.
+
+        Args:
+            audio: Mono float32 samples at ``SAMPLE_RATE``
+
+        Yields:
+            List of note events (start, end, pitch, amplitude, pitch bends) per
+            segment, in order
+        """
+        n_frames = int(np.floor(len(audio) * ANNOTATIONS_FPS / AUDIO_SAMPLE_RATE))
+        times = note_creation.model_frames_to_time(n_frames)
+        segment = self.STREAMING_SEGMENT_SECONDS * ANNOTATIONS_FPS
+        context = self.STREAMING_CONTEXT_SECONDS * ANNOTATIONS_FPS
+
+        # Model output for frames from buffer_start onwards, not yet released
+        buffer: Dict[str, List[np.ndarray]] = {"note": [], "onset": [], "contour": []}
+        buffer_start = buffered = 0
+        segment_start = 0
+
+        model_frames = (frames for _, frames, _ in prefetch(self._model_frames(audio)))
+        while segment_start < n_frames:
+            segment_end = min(segment_start + segment, n_frames)
+            needed = min(segment_end + context, n_frames)
+            for frames in model_frames:
+                for name, value in frames.items():
+                    buffer[name].append(value)
+                buffered += len(frames["note"])
+                if buffer_start + buffered >= needed:
+                    break
+            if buffer_start + buffered <= segment_start:
+                break
+
+            output = {name: np.concatenate(values) for name, values in buffer.items()}
+            lo = max(segment_start - context, buffer_start)
+            hi = min(needed, buffer_start + buffered)
+            window = slice(lo - buffer_start, hi - buffer_start)
+            notes = self._frames_to_notes({name: value[window] for name, value in output.items()})
+            yield [
+                (times[lo + start], times[lo + end], pitch, amplitude, bends)
+                for start, end, pitch, amplitude, bends in notes
+                if segment_start <= lo + start < segment_end
+            ]
+
+            # Keep only what the next segment needs as left context
+            keep = segment_end - context - buffer_start
+            buffer = {name: [value[keep:].copy()] for name, value in output.items()}
+            buffer_start += keep
+            buffered -= keep
+            segment_start = segment_end
+
+    def _model_frames(self, audio: np.ndarray) -> Iterator[Dict[str, np.ndarray]]:
+        """Run Basic Pitch over decoded audio, yielding frame outputs per model call.
+
+        Uses the same windowing as basic_pitch.inference.run_inference (30
+        overlapping frames, half of them dropped at each end of a window), so
+        the yielded frames concatenate to basic_pitch's unwrapped output.
+
+        Args:
+            audio: Mono float32 samples at ``SAMPLE_RATE``
+
+        Yields:
+            Dict of 'note', 'onset' and 'contour' frames (time, bins)
+        """
+        n_overlapping_frames = 30
+        overlap_len = n_overlapping_frames * FFT_HOP
+        hop_size = AUDIO_N_SAMPLES - overlap_len
+        n_olap = n_overlapping_frames // 2
+        padded = np.concatenate([np.zeros(overlap_len // 2, dtype=np.float32), audio])
+
+        # Windows are stacked into batches of batch_size (one per call on CPU)
+        windows = (window for window, _ in window_audio_file(padded, hop_size))
+        while batch := list(itertools.islice(windows, self.batch_size)):
+            yield {
+                name: value[:, n_olap:-n_olap].reshape(-1, value.shape[-1])
+                for name, value in self.model.predict(np.stack(batch)).items()
+            }
+
+    def _frames_to_notes(self, output: Dict[str, np.ndarray]) -> List[Tuple]:
+        """Convert model frame outputs to note events, as basic_pitch does.
+
+        Args:
+            output: Dict of 'note', 'onset' and 'contour' frames
+
+        Returns:
+            List of (start frame, end frame, pitch, amplitude, pitch bends)
+        """
+        min_note_len = int(np.round(self.minimum_note_length / 1000 * ANNOTATIONS_FPS))
+        notes = note_creation.output_to_notes_polyphonic(
+            output["note"],
+            output["onset"],
+            onset_thresh=self.onset_threshold,
+            frame_thresh=self.frame_threshold,
+            infer_onsets=True,
+            min_note_len=min_note_len,
+            min_freq=self.minimum_frequency,
+            max_freq=self.maximum_frequency,
+            melodia_trick=self.melodia_trick,
+        )
+        return note_creation.get_pitch_bends(output["contour"], notes)
+
+    def _parse_notes(self, note_events: List) -> List[Note]:
+        """Parse Basic Pitch note events into Note objects.
+
+        Args:
+            note_events: List of note events from Basic Pitch
+
+        Returns:
+            List of Note objects, sorted by start time
+        """
+        if not note_events:
+            return []
+
+        # Columns as arrays, so the conversions below run once per field rather
+        # than once per note (pitch bends are not kept on Note)
+        start_times, end_times, pitches, velocities, _ = zip(*note_events)
+        start_times = np.asarray(start_times, dtype=np.float64)
+        pitches = np.asarray(pitches, dtype=np.int64)
+
+        # Convert velocity to 0-127 range
+        velocities = np.clip(np.asarray(velocities, dtype=np.float64) * 127, 0, 127)
+        velocities = velocities.astype(np.int64)
+
+        # Calculate frequency from MIDI pitch
+        frequencies = 440.0 * 2.0 ** ((pitches - 69) / 12)
+
+        # Sort by start time (stable, so simultaneous notes keep their order)
+        order = np.argsort(start_times, kind="stable")
+
+        return list(
+            map(
+                Note,
+                pitches[order].tolist(),
+                start_times[order].tolist(),
+                np.asarray(end_times, dtype=np.float64)[order].tolist(),
+                velocities[order].tolist(),
+                frequencies[order].tolist(),
+            )
+        )
 
     def export_midi(
         self,
@@ -289,6 +608,10 @@ class MusicTranscriptionEngine:
     ) -> List[MusicTranscriptionResult]:
         """Transcribe multiple audio files.
 
+        Upcoming files are decoded on a background thread while the model runs
+        on the current one, so decoding overlaps inference instead of adding
+        to it. The model itself stays loaded once in this process.
+
         Args:
             audio_paths: List of paths to audio files
             save_midi: Whether to save MIDI files
@@ -297,14 +620,26 @@ class MusicTranscriptionEngine:
         Returns:
             List of MusicTranscriptionResult objects
         """
+        import librosa
+
         logger.info(f"Starting batch transcription of {len(audio_paths)} files")
 
+        def decode(audio_path: Path) -> np.ndarray:
+            # Decoded the way Basic Pitch's predict() loads a file
+            if not audio_path.exists():
+                raise FileNotFoundError(f"Audio file not found: {audio_path}")
+            audio, _ = librosa.load(str(audio_path), sr=self.SAMPLE_RATE, mono=True)
+            return audio
+
         results = []
-        for i, audio_path in enumerate(audio_paths, 1):
-            audio_path = Path(audio_path)
+        prefetched = prefetch(map(Path, audio_paths), decode)
+        for i, (audio_path, audio, error) in enumerate(prefetched, 1):
             logger.info(f"Processing file {i}/{len(audio_paths)}: {audio_path.name}")
 
             try:
+                if error is not None:
+                    raise error
+
                 midi_path = None
                 if save_midi and output_dir:
                     midi_path = Path(output_dir) / f"{audio_path.stem}.mid"
@@ -313,6 +648,7 @@ class MusicTranscriptionEngine:
                     audio_path,
                     save_midi=save_midi,
                     midi_path=midi_path,
+                    audio=audio,
                 )
                 results.append(result)
 
@@ -342,19 +678,13 @@ class MusicTranscriptionEngine:
                 "average_note_duration": 0,
             }
 
-        velocities = [n.velocity for n in result.notes]
-        durations = [n.duration for n in result.notes]
-
         return {
             "note_count": result.note_count,
             "duration": result.duration,
             "notes_per_second": result.note_count / result.duration if result.duration > 0 else 0,
             "pitch_range": result.pitch_range,
             "pitch_range_names": result.pitch_range_names,
-            "average_velocity": sum(velocities) / len(velocities),
-            "average_note_duration": sum(durations) / len(durations),
-            "min_note_duration": min(durations),
-            "max_note_duration": max(durations),
+            **result.note_stats,
             "tempo": result.tempo,
             "key": result.key,
         }
@@ -6,8 +6,9 @@ Converts MIDI/transcription data into sheet music formats:
 """
 
 import logging
+import os
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Tuple, Union
 import tempfile
 import subprocess
 import shutil
@@ -30,6 +31,9 @@ class ScoreGenerator:
     - MIDI (re-export)
     """
 
+    # (musescore_path, lilypond_path) found per PATH value, shared by all instances
+    _pdf_tools: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+
     def __init__(
         self,
         quantize: bool = True,
@@ -60,8 +64,21 @@ class ScoreGenerator:
 
     def _check_pdf_tools(self):
         """Check for available PDF rendering tools."""
-        self.musescore_path = None
-        self.lilypond_path = None
+        self.musescore_path, self.lilypond_path = self.discover_tools_once()
+
+    @classmethod
+    def discover_tools_once(cls) -> Tuple[Optional[str], Optional[str]]:
+        """Locate MuseScore and LilyPond, probing the filesystem only once per PATH.
+
+        Returns:
+            Tuple of (musescore_path, lilypond_path); either may be None
+        """
+        search_path = os.environ.get("PATH", "")
+        if search_path in cls._pdf_tools:
+            return cls._pdf_tools[search_path]
+
+        musescore_path = None
+        lilypond_path = None
 
         # Check for MuseScore
         for path in [
@@ -73,21 +90,24 @@ class ScoreGenerator:
             shutil.which("musescore"),
         ]:
             if path and Path(str(path)).exists():
-                self.musescore_path = path
+                musescore_path = path
                 logger.info(f"Found MuseScore at: {path}")
                 break
 
         # Check for LilyPond
         lilypond = shutil.which("lilypond")
         if lilypond:
-            self.lilypond_path = lilypond
+            lilypond_path = lilypond
             logger.info(f"Found LilyPond at: {lilypond}")
 
-        if not self.musescore_path and not self.lilypond_path:
+        if not musescore_path and not lilypond_path:
             logger.warning(
                 "No PDF rendering tools found. " "Install MuseScore or LilyPond for PDF export."
             )
 
+        cls._pdf_tools[search_path] = (musescore_path, lilypond_path)
+        return musescore_path, lilypond_path
+
     def from_transcription(
         self,
         result: MusicTranscriptionResult,
@@ -141,18 +161,25 @@ class ScoreGenerator:
         # Convert notes - note_data.start is in seconds, need to convert to quarter notes
         current_tempo = tempo_bpm or result.tempo or 120
         beats_per_second = current_tempo / 60.0
+        grid = self.quantize_resolution
 
+        # Notes are quantized as they are created and bulk-inserted with
+        # coreInsert, so the part is re-indexed once instead of once per note
         for note_data in result.notes:
             n = self._create_note(note_data, current_tempo)
             # Convert start time from seconds to quarter notes (beats)
             offset_in_quarters = note_data.start * beats_per_second
-            part.insert(offset_in_quarters, n)
+            if self.quantize:
+                offset_in_quarters = round(offset_in_quarters / grid) * grid
+                quantized_dur = round(n.duration.quarterLength / grid) * grid
+                n.duration.quarterLength = max(grid, quantized_dur)
+            part.coreInsert(offset_in_quarters, n)
+        part.coreElementsChanged()
+        # Sort now so later read-only consumers (export, preview) never sort lazily
+        part.sort()
 
         score.append(part)
 
-        if self.quantize:
-            score = self._quantize_score(score)
-
         logger.info("Score created successfully")
         return score
 
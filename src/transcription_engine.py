@@ -1,13 +1,17 @@
 """Core transcription engine for Maestrai using OpenAI Whisper."""
 
 import logging
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Iterable, Iterator, Tuple
+import numpy as np
 import torch
 import whisper
+from whisper.audio import CHUNK_LENGTH, N_SAMPLES
 
 from .utils.config import Config
+from .utils.prefetch import prefetch
+from .utils.transcription_cache import TranscriptionCache
 from .audio_processor import AudioProcessor
 
 logger = logging.getLogger(__name__)
@@ -70,18 +74,39 @@ class TranscriptionResult:
         )
 
 
+@dataclass
+class _PreparedInput:
+    """A file that has been validated, probed and decoded, ready for inference."""
+
+    audio_path: Optional[Path]
+    cache_key: Optional[str] = None
+    cached_result: Optional[TranscriptionResult] = None
+    audio_info: Dict[str, Any] = field(default_factory=dict)
+    audio: Optional[np.ndarray] = None
+
+
 class TranscriptionEngine:
     """Main transcription engine using OpenAI Whisper."""
 
-    def __init__(self, model_name: str = Config.DEFAULT_MODEL, device: Optional[str] = None):
+    # Batched transcription decodes its queued windows once they fill this many batches
+    MAX_QUEUED_BATCHES = 4
+
+    def __init__(
+        self,
+        model_name: str = Config.DEFAULT_MODEL,
+        device: Optional[str] = None,
+        compute_type: str = Config.COMPUTE_TYPE,
+    ):
         """Initialize the transcription engine.
 
         Args:
             model_name: Whisper model to use (tiny, base, small, medium, large)
             device: Device to use ('cuda' or 'cpu'). Auto-detects if None
+            compute_type: Weight precision ('auto', 'float16' or 'float32').
+                'auto' uses float16 on CUDA and float32 on CPU
 
         Raises:
-            ValueError: If model_name is invalid
+            ValueError: If model_name or compute_type is invalid
             RuntimeError: If model fails to load
         """
         if not Config.validate_model(model_name):
@@ -90,6 +115,12 @@ class TranscriptionEngine:
                 f"Available models: {', '.join(Config.AVAILABLE_MODELS)}"
             )
 
+        if compute_type not in Config.AVAILABLE_COMPUTE_TYPES:
+            raise ValueError(
+                f"Invalid compute type: {compute_type}. "
+                f"Available compute types: {', '.join(Config.AVAILABLE_COMPUTE_TYPES)}"
+            )
+
         self.model_name = model_name
 
         # Auto-detect device if not specified
@@ -98,10 +129,22 @@ class TranscriptionEngine:
         else:
             self.device = device
 
-        logger.info(f"Initializing Whisper model '{model_name}' on device '{self.device}'")
+        # Resolve precision; float16 kernels are only worthwhile (and supported) on CUDA
+        if compute_type == "auto":
+            compute_type = "float16" if self.device.startswith("cuda") else "float32"
+        elif compute_type == "float16" and not self.device.startswith("cuda"):
+            raise ValueError("compute_type 'float16' requires a CUDA device")
+        self.compute_type = compute_type
+
+        logger.info(
+            f"Initializing Whisper model '{model_name}' on device '{self.device}' "
+            f"({self.compute_type})"
+        )
 
         try:
             self.model = whisper.load_model(model_name, device=self.device)
+            if self.compute_type == "float16":
+                self._halve_weights()
             logger.info(f"Model '{model_name}' loaded successfully")
         except Exception as e:
             error_msg = f"Failed to load model '{model_name}': {str(e)}"
@@ -119,22 +162,37 @@ class TranscriptionEngine:
             raise RuntimeError(error_msg)
 
         self.audio_processor = AudioProcessor()
+        self.cache = TranscriptionCache()
+
+    def _halve_weights(self) -> None:
+        """Store the model's matmul, conv and embedding weights in float16.
+
+        Whisper's Linear/Conv1d cast their weights to the input dtype on every call,
+        so half-precision storage halves the bytes read per forward pass without
+        changing the math. LayerNorm stays in float32, as Whisper computes it there.
+        """
+        for module in self.model.modules():
+            if isinstance(module, (torch.nn.Linear, torch.nn.Conv1d, torch.nn.Embedding)):
+                module.half()
 
     def transcribe(
         self,
-        audio_path: str | Path,
+        audio_path: str | Path | np.ndarray,
         language: Optional[str] = None,
         task: str = "transcribe",
         word_timestamps: bool = True,
+        use_cache: bool = True,
         **kwargs,
     ) -> TranscriptionResult:
         """Transcribe an audio file.
 
         Args:
-            audio_path: Path to audio or video file
+            audio_path: Path to audio or video file, or an already decoded
+                16 kHz mono float32 waveform (not validated or cached)
             language: Language code (e.g., 'en', 'es'). Auto-detects if None
             task: Task to perform ('transcribe' or 'translate')
             word_timestamps: Extract word-level timestamps
+            use_cache: Reuse a cached result for identical file contents and options
             **kwargs: Additional arguments for Whisper
 
         Returns:
@@ -144,8 +202,51 @@ class TranscriptionEngine:
             ValueError: If file validation fails
             RuntimeError: If transcription fails
         """
-        audio_path = Path(audio_path)
+        if isinstance(audio_path, np.ndarray):
+            if language and not Config.validate_language(language):
+                raise ValueError(
+                    f"Unsupported language: {language}. "
+                    "Use None for auto-detection or check Config.SUPPORTED_LANGUAGES"
+                )
+            audio = audio_path.astype(np.float32, copy=False)
+            prepared = _PreparedInput(
+                None, audio_info={"duration": len(audio) / Config.SAMPLE_RATE}, audio=audio
+            )
+            return self._run_transcription(prepared, language, task, word_timestamps, **kwargs)
 
+        prepared = self._prepare_input(
+            Path(audio_path), language, task, word_timestamps, use_cache, **kwargs
+        )
+        if prepared.cached_result is not None:
+            return prepared.cached_result
+        return self._run_transcription(prepared, language, task, word_timestamps, **kwargs)
+
+    def _prepare_input(
+        self,
+        audio_path: Path,
+        language: Optional[str] = None,
+        task: str = "transcribe",
+        word_timestamps: bool = True,
+        use_cache: bool = True,
+        **kwargs,
+    ) -> _PreparedInput:
+        """Validate, probe and decode a file: everything in transcribe() before inference.
+
+        Args:
+            audio_path: Path to audio or video file
+            language: Language code. Auto-detects if None
+            task: Task to perform ('transcribe' or 'translate')
+            word_timestamps: Extract word-level timestamps
+            use_cache: Look up a cached result for identical file contents and options
+            **kwargs: Additional arguments for Whisper
+
+        Returns:
+            _PreparedInput holding either a cached result or the decoded audio
+
+        Raises:
+            ValueError: If the language or the file is not supported
+            RuntimeError: If the file cannot be probed or decoded
+        """
         # Validate language if provided
         if language and not Config.validate_language(language):
             raise ValueError(
@@ -153,31 +254,74 @@ class TranscriptionEngine:
                 "Use None for auto-detection or check Config.SUPPORTED_LANGUAGES"
             )
 
-        # Validate audio file
-        is_valid, error_msg = self.audio_processor.validate_audio_file(audio_path)
+        # Validate audio file; the ffprobe integrity check waits until a cache
+        # miss, so cache hits never start a probe process
+        is_valid, error_msg = self.audio_processor.validate_audio_file(audio_path, quick=True)
         if not is_valid:
             raise ValueError(f"Audio validation failed: {error_msg}")
 
-        logger.info(f"Starting transcription of: {audio_path.name}")
+        # Return a cached result for identical input and options
+        cache_key = None
+        if use_cache:
+            cache_key = self.cache.make_key(
+                audio_path,
+                self.model_name,
+                language,
+                task=task,
+                word_timestamps=word_timestamps,
+                compute_type=self.compute_type,
+                **kwargs,
+            )
+            cached_result = self.cache.get(cache_key)
+            if cached_result is not None:
+                return _PreparedInput(audio_path, cache_key, cached_result)
 
-        # Get audio info
+        is_valid, error_msg = self.audio_processor.validate_audio_file(audio_path)
+        if not is_valid:
+            raise ValueError(f"Audio validation failed: {error_msg}")
+
+        # Get audio info (memoized by the validation probe)
         audio_info = self.audio_processor.get_audio_info(audio_path)
 
-        # Convert to WAV if needed (Whisper works best with WAV)
-        if audio_path.suffix.lower() in Config.SUPPORTED_VIDEO_FORMATS:
-            logger.info("Extracting audio from video...")
-            processed_path = self.audio_processor.extract_audio_from_video(audio_path)
-        elif audio_path.suffix.lower() != ".wav":
-            logger.info("Converting to WAV format...")
-            processed_path = self.audio_processor.convert_to_wav(audio_path)
-        else:
-            processed_path = audio_path
+        audio = self.audio_processor.extract_pcm_stream(audio_path)
+        return _PreparedInput(audio_path, cache_key, None, audio_info, audio)
+
+    def _run_transcription(
+        self,
+        prepared: _PreparedInput,
+        language: Optional[str] = None,
+        task: str = "transcribe",
+        word_timestamps: bool = True,
+        **kwargs,
+    ) -> TranscriptionResult:
+        """Run Whisper on a prepared input and build the result.
+
+        Args:
+            prepared: Output of _prepare_input() without a cached result
+            language: Language code. Auto-detects if None
+            task: Task to perform ('transcribe' or 'translate')
+            word_timestamps: Extract word-level timestamps
+            **kwargs: Additional arguments for Whisper
+
+        Returns:
+            TranscriptionResult object
+
+        Raises:
+            RuntimeError: If transcription fails
+        """
+        audio_path = prepared.audio_path
+        audio_info = prepared.audio_info
+        cache_key = prepared.cache_key
+
+        name = audio_path.name if audio_path else "in-memory audio"
+        logger.info(f"Starting transcription of: {name}")
 
         try:
             # Perform transcription
             logger.info("Running Whisper transcription...")
+            kwargs.setdefault("fp16", self.compute_type == "float16")
             result = self.model.transcribe(
-                str(processed_path),
+                self._to_device(prepared.audio),
                 language=language,
                 task=task,
                 word_timestamps=word_timestamps,
@@ -195,6 +339,7 @@ class TranscriptionEngine:
                 duration=audio_info.get("duration", 0.0),
                 model_name=self.model_name,
                 metadata={
+                    "source_file": str(audio_path) if audio_path else None,
                     "audio_info": audio_info,
                     "task": task,
                     "word_timestamps": word_timestamps,
@@ -206,6 +351,9 @@ class TranscriptionEngine:
                 f"{transcription_result.word_count} words"
             )
 
+            if cache_key:
+                self.cache.put(cache_key, transcription_result)
+
             return transcription_result
 
         except Exception as e:
@@ -213,6 +361,26 @@ class TranscriptionEngine:
             logger.error(error_msg)
             raise RuntimeError(error_msg)
 
+    def _to_device(self, audio: np.ndarray) -> torch.Tensor:
+        """Move a 16 kHz mono waveform to the model's device.
+
+        Whisper computes the log-Mel spectrogram on the device of its input, so
+        handing it a device tensor keeps the STFT and Mel projection on the GPU
+        instead of computing them on the CPU and copying the features over. On
+        CUDA the waveform is staged in pinned memory so the upload is a single
+        asynchronous DMA transfer.
+
+        Args:
+            audio: Float32 waveform as returned by AudioProcessor.extract_pcm_stream
+
+        Returns:
+            Float32 waveform tensor
+        """
+        waveform = torch.from_numpy(audio)
+        if self.device.startswith("cuda"):
+            return waveform.pin_memory().to(self.device, non_blocking=True)
+        return waveform
+
     def _parse_segments(self, segments_data: List[Dict]) -> List[TranscriptionSegment]:
         """Parse raw Whisper segments into TranscriptionSegment objects.
 
@@ -253,12 +421,30 @@ class TranscriptionEngine:
         return segments
 
     def transcribe_batch(
-        self, audio_paths: List[str | Path], **kwargs
+        self, audio_paths: List[str | Path], batch_size: int = 1, **kwargs
     ) -> List[TranscriptionResult]:
         """Transcribe multiple audio files.
 
+        By default files are transcribed one by one with transcribe(). Passing
+        ``batch_size > 1`` together with ``word_timestamps=False`` opts into
+        batched decoding: every file is cut into hard 30-second windows and the
+        windows of all files are decoded together in batches of ``batch_size``,
+        so the encoder and decoder run once per batch instead of once per file.
+
+        Batching trades quality for throughput. Each window becomes one segment
+        (30-second SRT cues), words at window edges may be split, the language is
+        detected per window and the first window's is reported, and Whisper's
+        temperature fallback, compression-ratio/log-probability thresholds and
+        previous-text conditioning are not applied.
+
+        Either way, upcoming files are decoded on a background thread while the
+        model runs: on the current file, or on the group of windows queued so far
+        when batching.
+
         Args:
             audio_paths: List of paths to audio files
+            batch_size: Number of 30-second windows decoded per forward pass;
+                1 (default) transcribes each file sequentially
             **kwargs: Arguments passed to transcribe()
 
         Returns:
@@ -266,20 +452,263 @@ class TranscriptionEngine:
         """
         logger.info(f"Starting batch transcription of {len(audio_paths)} files")
 
-        results = []
-        for i, audio_path in enumerate(audio_paths, 1):
-            logger.info(f"Processing file {i}/{len(audio_paths)}: {Path(audio_path).name}")
-            try:
-                result = self.transcribe(audio_path, **kwargs)
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Failed to transcribe {audio_path}: {e}")
-                # Continue with next file
-                continue
+        if batch_size > 1 and not kwargs.get("word_timestamps", True):
+            results = self._transcribe_batched(audio_paths, batch_size, **kwargs)
+        else:
+            run_kwargs = {k: v for k, v in kwargs.items() if k != "use_cache"}
+            prefetched = prefetch(
+                audio_paths, lambda path: self._prepare_input(Path(path), **kwargs)
+            )
+            results = []
+            for i, (audio_path, prepared, error) in enumerate(prefetched, 1):
+                logger.info(f"Processing file {i}/{len(audio_paths)}: {Path(audio_path).name}")
+                try:
+                    if error is not None:
+                        raise error
+                    result = prepared.cached_result or self._run_transcription(
+                        prepared, **run_kwargs
+                    )
+                    results.append(result)
+                except Exception as e:
+                    logger.error(f"Failed to transcribe {audio_path}: {e}")
+                    # Continue with next file
+                    continue
 
         logger.info(f"Batch transcription completed: {len(results)}/{len(audio_paths)} successful")
         return results
 
+    def _transcribe_batched(
+        self,
+        audio_paths: List[str | Path],
+        batch_size: int,
+        language: Optional[str] = None,
+        task: str = "transcribe",
+        word_timestamps: bool = False,
+        use_cache: bool = True,
+        **kwargs,
+    ) -> List[TranscriptionResult]:
+        """Transcribe files by decoding their 30-second windows in shared batches.
+
+        Files whose windows were in a batch that failed to decode are retried one
+        by one with transcribe(); files that still fail are logged and skipped.
+
+        Args:
+            audio_paths: List of paths to audio files
+            batch_size: Number of windows decoded per forward pass
+            language: Language code. Auto-detects per window if None
+            task: Task to perform ('transcribe' or 'translate')
+            word_timestamps: Unused; batched decoding yields segment timestamps only
+            use_cache: Reuse cached results for identical file contents and options
+            **kwargs: Additional whisper.DecodingOptions fields
+
+        Returns:
+            List of TranscriptionResult objects, in input order
+
+        Raises:
+            ValueError: If the language is not supported
+        """
+        if language and not Config.validate_language(language):
+            raise ValueError(
+                f"Unsupported language: {language}. "
+                "Use None for auto-detection or check Config.SUPPORTED_LANGUAGES"
+            )
+
+        option_names = {f.name for f in fields(whisper.DecodingOptions)}
+        decode_options = {k: v for k, v in kwargs.items() if k in option_names}
+        decode_options.setdefault("fp16", self.compute_type == "float16")
+        options = whisper.DecodingOptions(language=language, task=task, **decode_options)
+
+        def prepare(
+            item: Tuple[Tuple[int, Path, Optional[str]], Tuple[bool, Any]],
+        ) -> _PreparedInput:
+            (_, audio_path, cache_key), (is_valid, info_or_error) = item
+            if not is_valid:
+                raise ValueError(f"Audio validation failed: {info_or_error}")
+
+            audio = self.audio_processor.extract_pcm_stream(audio_path)
+            return _PreparedInput(audio_path, cache_key, None, info_or_error, audio)
+
+        # Decode files ahead on a background thread and cut them into fixed-size
+        # log-Mel windows. The queued windows are decoded as soon as they fill
+        # MAX_QUEUED_BATCHES batches, so device memory is bounded by a group of
+        # files rather than the whole input list, and the next files are decoded
+        # while the model runs.
+        max_windows = batch_size * self.MAX_QUEUED_BATCHES
+        results: List[Optional[TranscriptionResult]] = [None] * len(audio_paths)
+        pending = []
+        mels = []
+        lengths = []
+        owners = []
+
+        def flush() -> None:
+            """Decode the queued windows and build the results of their files."""
+            if not pending:
+                return
+
+            # Run the encoder and decoder once per batch of similar-length windows
+            logger.info(f"Running batched Whisper decoding on {len(mels)} windows...")
+            decoded = [None] * len(mels)
+            failed = set()
+            for bucket in self._bucket_by_length(lengths, batch_size):
+                try:
+                    mel_batch = torch.stack([mels[idx] for idx in bucket])
+                    for idx, window in zip(bucket, whisper.decode(self.model, mel_batch, options)):
+                        decoded[idx] = window
+                except Exception as e:
+                    # Only the files with a window in this batch are affected
+                    logger.error(f"Batched decoding failed for {len(bucket)} windows: {e}")
+                    failed.update(owners[idx] for idx in bucket)
+            # Release the windows (and with them the device waveforms) before retrying
+            mels.clear()
+            lengths.clear()
+            owners.clear()
+
+            # Split the decoded windows back per file
+            position = 0
+            for index, audio_info, num_chunks, cache_key in pending:
+                audio_path = Path(audio_paths[index])
+                windows = decoded[position : position + num_chunks]
+                position += num_chunks
+
+                if index in failed:
+                    # Retry the file on its own, as the unbatched path would
+                    logger.info(f"Retrying {audio_path.name} without batching")
+                    try:
+                        results[index] = self.transcribe(
+                            audio_path,
+                            language,
+                            task,
+                            word_timestamps=False,
+                            use_cache=use_cache,
+                            **kwargs,
+                        )
+                    except Exception as e:
+                        logger.error(f"Failed to transcribe {audio_path}: {e}")
+                    continue
+
+                duration = audio_info.get("duration", 0.0)
+                segments = [
+                    TranscriptionSegment(
+                        id=idx,
+                        start=float(idx * CHUNK_LENGTH),
+                        end=float(min((idx + 1) * CHUNK_LENGTH, duration)),
+                        text=window.text.strip(),
+                        temperature=window.temperature,
+                        avg_logprob=window.avg_logprob,
+                        compression_ratio=window.compression_ratio,
+                        no_speech_prob=window.no_speech_prob,
+                    )
+                    for idx, window in enumerate(windows)
+                ]
+
+                results[index] = TranscriptionResult(
+                    text=" ".join(seg.text for seg in segments if seg.text),
+                    language=windows[0].language if windows else (language or "unknown"),
+                    segments=segments,
+                    duration=duration,
+                    model_name=self.model_name,
+                    metadata={
+                        "source_file": str(audio_path),
+                        "audio_info": audio_info,
+                        "task": task,
+                        "word_timestamps": False,
+                        "batched": True,
+                    },
+                )
+                if cache_key:
+                    self.cache.put(cache_key, results[index])
+            pending.clear()
+
+        # Look up cached results before probing, so cache hits never start an
+        # ffprobe process; only the misses are probed and decoded
+        misses = []
+        for index, audio_path in enumerate(map(Path, audio_paths)):
+            is_valid, error_msg = self.audio_processor.validate_audio_file(audio_path, quick=True)
+            if not is_valid:
+                logger.error(
+                    f"Failed to transcribe {audio_path}: Audio validation failed: {error_msg}"
+                )
+                continue
+
+            cache_key = None
+            if use_cache:
+                cache_key = self.cache.make_key(
+                    audio_path,
+                    self.model_name,
+                    language,
+                    task=task,
+                    batched=True,
+                    compute_type=self.compute_type,
+                    **kwargs,
+                )
+                results[index] = self.cache.get(cache_key)
+                if results[index] is not None:
+                    continue
+            misses.append((index, audio_path, cache_key))
+
+        probes = self.audio_processor.validate_and_info_many([item[1] for item in misses])
+        prefetched = prefetch(zip(misses, probes), prepare)
+        for i, (item, prepared, error) in enumerate(prefetched, 1):
+            (index, audio_path, _), _ = item
+            logger.info(f"Preparing file {i}/{len(misses)}: {audio_path.name}")
+            if error is not None:
+                logger.error(f"Failed to transcribe {audio_path}: {error}")
+                continue
+
+            # Upload the whole waveform once; windows are then sliced, padded and
+            # turned into log-Mel features on the device
+            audio_info, cache_key = prepared.audio_info, prepared.cache_key
+            audio = self._to_device(prepared.audio)
+            num_samples = audio.shape[-1]
+            offsets = range(0, max(num_samples, 1), N_SAMPLES)
+            for offset in offsets:
+                window = whisper.pad_or_trim(audio[offset : offset + N_SAMPLES])
+                mels.append(whisper.log_mel_spectrogram(window, self.model.dims.n_mels))
+                lengths.append(min(N_SAMPLES, num_samples - offset))
+                owners.append(index)
+            pending.append((index, audio_info, len(offsets), cache_key))
+            if len(mels) >= max_windows:
+                flush()
+        flush()
+
+        return [result for result in results if result is not None]
+
+    @staticmethod
+    def _bucket_by_length(
+        lengths: List[int], batch_size: int, max_length_ratio: float = 1.5
+    ) -> List[List[int]]:
+        """Group items into batches of similar length.
+
+        Every window is padded to 30 seconds before encoding, but the decoder
+        runs until the longest transcript in a batch finishes, so mixing short
+        tails with full windows wastes decoding steps. Items are sorted by length
+        and a new batch starts when it is full or when the longest item would
+        exceed ``max_length_ratio`` times the shortest.
+
+        Args:
+            lengths: Unpadded length of each item
+            batch_size: Maximum number of items per batch
+            max_length_ratio: Maximum longest/shortest length ratio within a batch
+
+        Returns:
+            List of batches, each a list of indices into ``lengths``
+        """
+        order = sorted(range(len(lengths)), key=lambda idx: lengths[idx], reverse=True)
+
+        buckets: List[List[int]] = []
+        for idx in order:
+            bucket = buckets[-1] if buckets else None
+            if (
+                bucket is None
+                or len(bucket) >= batch_size
+                or lengths[bucket[0]] > max_length_ratio * max(lengths[idx], 1)
+            ):
+                buckets.append([idx])
+            else:
+                bucket.append(idx)
+
+        return buckets
+
     @staticmethod
     def format_timestamp(seconds: float, srt_format: bool = True) -> str:
         """Convert seconds to timestamp format.
@@ -301,7 +730,65 @@ class TranscriptionEngine:
         else:
             return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
 
-    def export_srt(self, result: TranscriptionResult, output_path: str | Path) -> Path:
+    @classmethod
+    def render_srt(cls, result: TranscriptionResult) -> str:
+        """Render a transcription in SRT subtitle format.
+
+        Args:
+            result: TranscriptionResult to render
+
+        Returns:
+            SRT document as a string
+        """
+        # SRT format:
+        # 1
+        # 00:00:00,000 --> 00:00:02,000
+        # Subtitle text
+        #
+        parts = []
+        for i, segment in enumerate(result.segments, 1):
+            parts.append(
+                f"{i}\n"
+                f"{cls.format_timestamp(segment.start)} --> "
+                f"{cls.format_timestamp(segment.end)}\n"
+                f"{segment.text}\n\n"
+            )
+        return "".join(parts)
+
+    @classmethod
+    def render_txt(cls, result: TranscriptionResult) -> str:
+        """Render a transcription as plain text with metadata and timestamps.
+
+        Args:
+            result: TranscriptionResult to render
+
+        Returns:
+            Text document as a string
+        """
+        parts = [
+            # Metadata
+            f"Transcription of: {result.metadata.get('audio_info', {}).get('filename', 'Unknown')}\n",
+            f"Language: {result.language}\n",
+            f"Model: {result.model_name}\n",
+            f"Duration: {result.duration:.2f}s\n",
+            f"Word count: {result.word_count}\n",
+            "=" * 80 + "\n\n",
+            # Full text
+            result.text + "\n\n",
+            # Segments with timestamps
+            "=" * 80 + "\n",
+            "SEGMENTS WITH TIMESTAMPS\n",
+            "=" * 80 + "\n\n",
+        ]
+
+        for segment in result.segments:
+            timestamp = f"[{cls.format_timestamp(segment.start, False)} --> {cls.format_timestamp(segment.end, False)}]"
+            parts.append(f"{timestamp}\n{segment.text}\n\n")
+
+        return "".join(parts)
+
+    @classmethod
+    def export_srt(cls, result: TranscriptionResult, output_path: str | Path) -> Path:
         """Export transcription to SRT subtitle format.
 
         Args:
@@ -316,20 +803,7 @@ class TranscriptionEngine:
         logger.info(f"Exporting SRT to: {output_path}")
 
         try:
-            with open(output_path, "w", encoding="utf-8") as f:
-                for i, segment in enumerate(result.segments, 1):
-                    # SRT format:
-                    # 1
-                    # 00:00:00,000 --> 00:00:02,000
-                    # Subtitle text
-                    #
-                    f.write(f"{i}\n")
-                    f.write(
-                        f"{self.format_timestamp(segment.start)} --> "
-                        f"{self.format_timestamp(segment.end)}\n"
-                    )
-                    f.write(f"{segment.text}\n")
-                    f.write("\n")
+            output_path.write_text(cls.render_srt(result), encoding="utf-8")
 
             logger.info(f"SRT exported successfully: {len(result.segments)} subtitles")
             return output_path
@@ -339,7 +813,8 @@ class TranscriptionEngine:
             logger.error(error_msg)
             raise RuntimeError(error_msg)
 
-    def export_txt(self, result: TranscriptionResult, output_path: str | Path) -> Path:
+    @classmethod
+    def export_txt(cls, result: TranscriptionResult, output_path: str | Path) -> Path:
         """Export transcription to plain text format.
 
         Args:
@@ -354,29 +829,7 @@ class TranscriptionEngine:
         logger.info(f"Exporting text to: {output_path}")
 
         try:
-            with open(output_path, "w", encoding="utf-8") as f:
-                # Write metadata
-                f.write(
-                    f"Transcription of: {result.metadata.get('audio_info', {}).get('filename', 'Unknown')}\n"
-                )
-                f.write(f"Language: {result.language}\n")
-                f.write(f"Model: {result.model_name}\n")
-                f.write(f"Duration: {result.duration:.2f}s\n")
-                f.write(f"Word count: {result.word_count}\n")
-                f.write("=" * 80 + "\n\n")
-
-                # Write full text
-                f.write(result.text + "\n\n")
-
-                # Write segments with timestamps
-                f.write("=" * 80 + "\n")
-                f.write("SEGMENTS WITH TIMESTAMPS\n")
-                f.write("=" * 80 + "\n\n")
-
-                for segment in result.segments:
-                    timestamp = f"[{self.format_timestamp(segment.start, False)} --> {self.format_timestamp(segment.end, False)}]"
-                    f.write(f"{timestamp}\n")
-                    f.write(f"{segment.text}\n\n")
+            output_path.write_text(cls.render_txt(result), encoding="utf-8")
 
             logger.info(f"Text exported successfully")
             return output_path
@@ -395,6 +848,7 @@ class TranscriptionEngine:
         return {
             "model_name": self.model_name,
             "device": self.device,
+            "compute_type": self.compute_type,
             "cuda_available": torch.cuda.is_available(),
             "available_models": Config.AVAILABLE_MODELS,
             "supported_languages": len(Config.SUPPORTED_LANGUAGES),
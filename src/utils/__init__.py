@@ -1,5 +1,14 @@
 """Utility modules for Maestrai."""
 
 from .config import Config
+from .file_writer import write_many, write_many_checked
+from .prefetch import prefetch
+from .transcription_cache import TranscriptionCache
 
-__all__ = ["Config"]
+__all__ = [
+    "Config",
+    "TranscriptionCache",
+    "prefetch",
+    "write_many",
+    "write_many_checked",
+]
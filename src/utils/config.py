@@ -19,6 +19,10 @@ class Config:
     # Device settings
     DEVICE: str = os.getenv("DEVICE", "cuda")  # Will auto-detect if cuda available
 
+    # Precision of the model weights ('auto' picks float16 on CUDA, float32 on CPU)
+    COMPUTE_TYPE: str = os.getenv("COMPUTE_TYPE", "auto")
+    AVAILABLE_COMPUTE_TYPES: list[str] = ["auto", "float16", "float32"]
+
     # File settings
     MAX_FILE_SIZE_MB: int = int(os.getenv("MAX_FILE_SIZE_MB", "500"))
     MAX_FILE_SIZE: int = MAX_FILE_SIZE_MB * 1024 * 1024  # Convert to bytes
@@ -36,6 +40,33 @@ class Config:
 
     # Processing settings
     TEMP_DIR: Path = Path(os.getenv("TEMP_DIR", "/tmp/maestrai"))
+    CACHE_DIR: Path = Path(os.getenv("CACHE_DIR", "~/.cache/maestrai")).expanduser()
+    DAEMON_SOCKET: Path = CACHE_DIR / "daemon.sock"
+    # Maximum ffmpeg/ffprobe processes running at once across all threads
+    FFMPEG_CONCURRENCY: int = int(
+        os.getenv("FFMPEG_CONCURRENCY", str(max(1, (os.cpu_count() or 1) // 2)))
+    )
+
+    # Basic Pitch model used for music transcription. When unset, a quantized
+    # model written by scripts/quantize_basic_pitch.py is used if one exists
+    # (int16x8 preferred over the less accurate int8), otherwise the float
+    # model bundled with basic-pitch
+    MUSIC_MODEL_PATH: Optional[Path] = (
+        Path(os.environ["MUSIC_MODEL_PATH"]).expanduser()
+        if os.getenv("MUSIC_MODEL_PATH")
+        else None
+    )
+    QUANTIZED_MUSIC_MODEL_PATH: Path = CACHE_DIR / "basic_pitch_int16x8.tflite"
+    INT8_MUSIC_MODEL_PATH: Path = CACHE_DIR / "basic_pitch_int8.tflite"
+
+    # Onset detection backend for audio analysis: "librosa", or "numba" for a
+    # compiled spectral flux kernel
+    ONSET_BACKEND: str = os.getenv("ONSET_BACKEND", "librosa")
+    AVAILABLE_ONSET_BACKENDS: list[str] = ["librosa", "numba"]
+    # Chromagram used for key detection: "cqt" (constant-Q), or "stft" to reuse
+    # the spectrogram computed for beat and onset analysis (much faster)
+    KEY_CHROMA: str = os.getenv("KEY_CHROMA", "cqt")
+    AVAILABLE_KEY_CHROMAS: list[str] = ["cqt", "stft"]
     SAMPLE_RATE: int = 16000  # Whisper's required sample rate
     CHANNELS: int = 1  # Mono audio
 
@@ -0,0 +1,101 @@
+"""Batched file writing utilities for Maestrai."""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def _write_one(item: Tuple[str | Path, bytes]) -> Path:
+    """Write a single file in one call.
+
+    Args:
+        item: Tuple of (output path, file contents)
+
+    Returns:
+        Path to the written file
+    """
+    path, data = item
+    path = Path(path)
+    path.write_bytes(data)
+    return path
+
+
+def _try_write_one(item: Tuple[str | Path, bytes]) -> Tuple[Path, Optional[str]]:
+    """Write a single file, returning its error instead of raising it.
+
+    Args:
+        item: Tuple of (output path, file contents)
+
+    Returns:
+        Tuple of (output path, error message or None)
+    """
+    try:
+        return _write_one(item), None
+    except Exception as e:
+        return Path(item[0]), str(e)
+
+
+def write_many_checked(
+    items: Iterable[Tuple[str | Path, bytes]], max_workers: int = 32
+) -> List[Tuple[Path, Optional[str]]]:
+    """Write many small files concurrently, reporting failures per file.
+
+    Like write_many(), but a failed write does not hide the outcome of the
+    others: every file is attempted and gets its own result.
+
+    Args:
+        items: Iterable of (output path, file contents) tuples
+        max_workers: Maximum number of writer threads
+
+    Returns:
+        List of (path, error_message) tuples, in input order; error_message is
+        None for files written successfully
+    """
+    items = list(items)
+    if not items:
+        return []
+
+    logger.info(f"Writing {len(items)} files")
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        results = list(executor.map(_try_write_one, items))
+
+    for path, error in results:
+        if error is not None:
+            logger.error(f"Failed to write {path}: {error}")
+    return results
+
+
+def write_many(items: Iterable[Tuple[str | Path, bytes]], max_workers: int = 32) -> List[Path]:
+    """Write many small files concurrently.
+
+    Each file is rendered up front and written with a single write call, and
+    the writes are overlapped on a thread pool so per-file open/write/close
+    latency is paid roughly once instead of once per file.
+
+    Args:
+        items: Iterable of (output path, file contents) tuples
+        max_workers: Maximum number of writer threads
+
+    Returns:
+        List of written paths, in input order
+
+    Raises:
+        RuntimeError: If any file fails to write
+    """
+    items = list(items)
+    if not items:
+        return []
+
+    logger.info(f"Writing {len(items)} files")
+
+    try:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            return list(executor.map(_write_one, items))
+    except Exception as e:
+        error_msg = f"Failed to write files: {str(e)}"
+        logger.error(error_msg)
+        raise RuntimeError(error_msg)
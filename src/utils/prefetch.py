@@ -0,0 +1,73 @@
+"""Background prefetching utilities for Maestrai."""
+
+import threading
+from queue import Full, Queue
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+
+def prefetch(
+    items: Iterable[Any], load: Optional[Callable[[Any], Any]] = None, depth: int = 2
+) -> Iterator[Tuple[Any, Any, Optional[Exception]]]:
+    """Run ``load`` over items on a background thread, up to ``depth`` items ahead.
+
+    FFmpeg decoding and model inference release the GIL, so producing the next
+    items on a background thread overlaps that work with the consumer's.
+
+    Args:
+        items: Items to load; the iterable itself is also consumed on the
+            background thread
+        load: Function applied to each item on the background thread. None
+            yields the items as they are, for iterables that do the work
+            themselves (e.g. generators)
+        depth: Maximum number of loaded items waiting to be consumed
+
+    Yields:
+        (item, loaded_value, error) tuples in input order; ``error`` is the
+        exception raised by ``load`` (and ``loaded_value`` None) if it failed
+
+    Raises:
+        Exception: Whatever iterating ``items`` raised, after the items produced
+            before it have been yielded
+    """
+    queue: Queue = Queue(maxsize=depth)
+    stop = threading.Event()
+    done = object()
+    failure: List[Exception] = []
+
+    def put(entry: Any) -> bool:
+        while not stop.is_set():
+            try:
+                queue.put(entry, timeout=0.1)
+                return True
+            except Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if load is None:
+                    entry = (item, item, None)
+                else:
+                    try:
+                        entry = (item, load(item), None)
+                    except Exception as e:
+                        entry = (item, None, e)
+                if not put(entry):
+                    return
+        except Exception as e:
+            failure.append(e)
+        put(done)
+
+    producer = threading.Thread(target=produce, name="maestrai-prefetch", daemon=True)
+    producer.start()
+    try:
+        while (entry := queue.get()) is not done:
+            yield entry
+    finally:
+        # Unblock the producer if the consumer stops early
+        stop.set()
+        producer.join()
+
+    if failure:
+        raise failure[0]
@@ -0,0 +1,153 @@
+"""Persistent on-disk cache for transcription results."""
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+from .config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class TranscriptionCache:
+    """Memoizes transcription results on disk, keyed by input content and options."""
+
+    # Content hashes shared by all instances, keyed by (abspath, mtime_ns, size) so
+    # an edited or replaced file is hashed again
+    _hash_cache: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+    _hash_cache_lock = threading.Lock()
+    HASH_CACHE_SIZE = 256
+
+    def __init__(self, cache_dir: str | Path = Config.CACHE_DIR):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory where cached results are stored
+        """
+        self.cache_dir = Path(cache_dir).expanduser()
+
+    @staticmethod
+    def _hash_file(file_path: Path) -> str:
+        """Calculate a BLAKE2b hash of a file's contents.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            Hex digest string
+        """
+        with open(file_path, "rb") as f:
+            if hasattr(os, "posix_fadvise"):
+                # One sequential pass: let the kernel read ahead aggressively. The
+                # pages stay cached for the decoder that reads the file next
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+            if hasattr(hashlib, "file_digest"):
+                # Python 3.11+: reads into one reused buffer instead of a new bytes per chunk
+                return hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
+
+            file_hash = hashlib.blake2b(digest_size=16)
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                file_hash.update(chunk)
+            return file_hash.hexdigest()
+
+    @classmethod
+    def _file_key(cls, file_path: Path) -> str:
+        """Return the content hash of a file, hashing it only when it has changed.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            Hex digest string
+        """
+        stat = os.stat(file_path)
+        stat_key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+
+        with cls._hash_cache_lock:
+            digest = cls._hash_cache.get(stat_key)
+            if digest is not None:
+                cls._hash_cache.move_to_end(stat_key)
+                return digest
+
+        digest = cls._hash_file(file_path)
+        with cls._hash_cache_lock:
+            cls._hash_cache[stat_key] = digest
+            if len(cls._hash_cache) > cls.HASH_CACHE_SIZE:
+                cls._hash_cache.popitem(last=False)
+        return digest
+
+    def make_key(
+        self,
+        file_path: str | Path,
+        model_name: str,
+        language: Optional[str] = None,
+        **options: Any,
+    ) -> str:
+        """Build a cache key for a file and the options used to transcribe it.
+
+        Args:
+            file_path: Path to the input file
+            model_name: Model used for transcription
+            language: Language code, or None for auto-detection
+            **options: Any other options that affect the result
+
+        Returns:
+            Cache key string
+        """
+        options_hash = hashlib.blake2b(
+            repr(sorted(options.items())).encode("utf-8"), digest_size=8
+        ).hexdigest()
+        return (
+            f"{self._file_key(Path(file_path))}_{model_name}_{language or 'auto'}_{options_hash}"
+        )
+
+    def get(self, key: str) -> Optional[Any]:
+        """Load a cached result.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            The cached result, or None on a miss
+        """
+        cache_path = self.cache_dir / f"{key}.pkl"
+        if not cache_path.exists():
+            return None
+
+        try:
+            with open(cache_path, "rb") as f:
+                result = pickle.load(f)
+            logger.info(f"Using cached transcription: {cache_path}")
+            return result
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache entry {cache_path}: {e}")
+            return None
+
+    def put(self, key: str, result: Any) -> None:
+        """Store a result in the cache.
+
+        The entry is written to a temporary file and atomically renamed, so
+        concurrent readers never observe a partial entry.
+
+        Args:
+            key: Cache key from make_key()
+            result: Result object to store
+        """
+        cache_path = self.cache_dir / f"{key}.pkl"
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, cache_path)
+            logger.debug(f"Cached transcription: {cache_path}")
+        except Exception as e:
+            logger.warning(f"Failed to write cache entry {cache_path}: {e}")
@@ -1,9 +1,14 @@
 """Comprehensive test suite for Maestrai transcription service."""
 
+import importlib.util
+import os
 import unittest
 import tempfile
 from pathlib import Path
 import subprocess
+from types import SimpleNamespace
+import numpy as np
+from unittest.mock import MagicMock, patch
 
 from src.audio_processor import AudioProcessor
 from src.transcription_engine import (
@@ -13,6 +18,9 @@ from src.transcription_engine import (
     Word,
 )
 from src.utils.config import Config
+from src.utils.file_writer import write_many, write_many_checked
+from src.utils.prefetch import prefetch
+from src.utils.transcription_cache import TranscriptionCache
 
 
 class TestAudioProcessor(unittest.TestCase):
@@ -62,6 +70,74 @@ class TestAudioProcessor(unittest.TestCase):
         finally:
             temp_path.unlink()
 
+    def test_validate_quick_skips_probe(self):
+        """Test that quick validation checks the file without running ffprobe."""
+        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as f:
+            temp_path = Path(f.name)
+            f.write(b"not really audio")
+
+        try:
+            with patch("src.audio_processor.ffmpeg.probe") as probe:
+                is_valid, error = self.processor.validate_audio_file(temp_path, quick=True)
+                probe.assert_not_called()
+            self.assertTrue(is_valid)
+            self.assertIsNone(error)
+
+            is_valid, error = self.processor.validate_audio_file(temp_path)
+            self.assertFalse(is_valid)
+            self.assertIn("integrity", error.lower())
+        finally:
+            temp_path.unlink()
+
+    def test_validate_and_info_many(self):
+        """Test batch validation reports per-file errors in input order."""
+        with tempfile.NamedTemporaryFile(suffix=".xyz", delete=False) as f:
+            temp_path = Path(f.name)
+            f.write(b"dummy content")
+
+        try:
+            results = self.processor.validate_and_info_many(["/nonexistent/file.mp3", temp_path])
+            self.assertEqual(len(results), 2)
+            self.assertFalse(results[0][0])
+            self.assertIn("not found", results[0][1].lower())
+            self.assertFalse(results[1][0])
+            self.assertIn("unsupported", results[1][1].lower())
+        finally:
+            temp_path.unlink()
+
+    def test_get_audio_info_is_memoized(self):
+        """Test that probing an unchanged file twice runs ffprobe once."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            wav_path = Path(temp_dir) / "tone.wav"
+            subprocess.run(
+                ["ffmpeg", "-f", "lavfi", "-i", "sine=duration=1", "-y", str(wav_path)],
+                capture_output=True,
+                check=True,
+            )
+
+            first = self.processor.get_audio_info(wav_path)
+            with patch("src.audio_processor.ffmpeg.probe") as probe:
+                second = self.processor.get_audio_info(wav_path)
+                probe.assert_not_called()
+
+            self.assertEqual(first, second)
+
+    def test_extract_pcm_stream(self):
+        """Test decoding to in-memory PCM at Whisper's sample rate."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            wav_path = Path(temp_dir) / "tone.wav"
+            subprocess.run(
+                ["ffmpeg", "-f", "lavfi", "-i", "sine=duration=1", "-y", str(wav_path)],
+                capture_output=True,
+                check=True,
+            )
+
+            audio = self.processor.extract_pcm_stream(wav_path)
+
+            self.assertEqual(audio.dtype, np.float32)
+            self.assertAlmostEqual(len(audio), Config.SAMPLE_RATE, delta=Config.SAMPLE_RATE // 100)
+            self.assertEqual(list(Path(temp_dir).iterdir()), [wav_path])
+
     def test_supported_formats_list(self):
         """Test that supported formats are properly defined."""
         formats = Config.get_supported_formats()
@@ -108,6 +184,147 @@ class TestTranscriptionEngine(unittest.TestCase):
         timestamp = TranscriptionEngine.format_timestamp(0.001, srt_format=True)
         self.assertEqual(timestamp, "00:00:00,001")
 
+    def test_bucket_by_length(self):
+        """Test that batches hold similar-length items and cover every index."""
+        lengths = [480000, 16000, 480000, 400000, 20000, 480000]
+
+        buckets = TranscriptionEngine._bucket_by_length(lengths, batch_size=2)
+
+        self.assertEqual(sorted(idx for bucket in buckets for idx in bucket), list(range(6)))
+        for bucket in buckets:
+            self.assertLessEqual(len(bucket), 2)
+            bucket_lengths = [lengths[idx] for idx in bucket]
+            self.assertLessEqual(max(bucket_lengths), 1.5 * min(bucket_lengths))
+
+    def test_prefetch_preserves_order_and_errors(self):
+        """Test that prefetching yields items in order and reports load errors."""
+
+        def load(item):
+            if item == 2:
+                raise ValueError("bad item")
+            return item * 10
+
+        entries = list(prefetch(range(4), load))
+
+        self.assertEqual([item for item, _, _ in entries], [0, 1, 2, 3])
+        self.assertEqual([value for _, value, _ in entries], [0, 10, None, 30])
+        self.assertIsInstance(entries[2][2], ValueError)
+
+    def test_prefetch_reraises_iteration_errors(self):
+        """Test that errors raised by the items iterable reach the consumer."""
+
+        def items():
+            yield 1
+            raise RuntimeError("decoder crashed")
+
+        entries = []
+        with self.assertRaises(RuntimeError):
+            for entry in prefetch(items()):
+                entries.append(entry)
+
+        self.assertEqual(entries, [(1, 1, None)])
+
+    def test_batched_decode_failure_retries_only_its_files(self):
+        """Test that a failed decoding batch falls back to per-file transcription."""
+        durations = {"short.wav": 2, "long.wav": 60}
+        engine = TranscriptionEngine.__new__(TranscriptionEngine)
+        engine.model_name = "tiny"
+        engine.device = "cpu"
+        engine.compute_type = "float32"
+        engine.model = SimpleNamespace(dims=SimpleNamespace(n_mels=80))
+        engine.audio_processor = MagicMock()
+        engine.audio_processor.validate_audio_file.return_value = (True, None)
+        engine.audio_processor.validate_and_info_many.side_effect = lambda paths: [
+            (True, {"duration": float(durations[Path(path).name])}) for path in paths
+        ]
+        engine.audio_processor.extract_pcm_stream.side_effect = lambda path: np.zeros(
+            durations[Path(path).name] * Config.SAMPLE_RATE, dtype=np.float32
+        )
+
+        def decode(model, mel_batch, options):
+            # The two full windows of long.wav share a batch; short.wav is alone
+            if len(mel_batch) == 2:
+                raise RuntimeError("out of memory")
+            return [
+                SimpleNamespace(
+                    text="hello",
+                    language="en",
+                    temperature=0.0,
+                    avg_logprob=0.0,
+                    compression_ratio=1.0,
+                    no_speech_prob=0.0,
+                )
+                for _ in mel_batch
+            ]
+
+        fallback = TranscriptionResult(
+            text="retried", language="en", segments=[], duration=60.0, model_name="tiny"
+        )
+        with (
+            patch("src.transcription_engine.whisper.decode", side_effect=decode),
+            patch.object(engine, "transcribe", return_value=fallback) as transcribe,
+        ):
+            results = engine.transcribe_batch(
+                ["short.wav", "long.wav"], batch_size=16, word_timestamps=False, use_cache=False
+            )
+
+        self.assertEqual([result.text for result in results], ["hello", "retried"])
+        transcribe.assert_called_once()
+        self.assertEqual(transcribe.call_args.args[0], Path("long.wav"))
+
+    def test_batched_cache_hits_skip_probe(self):
+        """Test that batched transcription only probes files missing from the cache."""
+        engine = TranscriptionEngine.__new__(TranscriptionEngine)
+        engine.model_name = "tiny"
+        engine.compute_type = "float32"
+        engine.audio_processor = MagicMock()
+        engine.audio_processor.validate_audio_file.return_value = (True, None)
+        engine.audio_processor.validate_and_info_many.return_value = []
+        engine.cache = MagicMock()
+        cached = TranscriptionResult(
+            text="cached", language="en", segments=[], duration=1.0, model_name="tiny"
+        )
+        engine.cache.get.return_value = cached
+
+        results = engine.transcribe_batch(["a.wav", "b.wav"], batch_size=16, word_timestamps=False)
+
+        self.assertEqual(results, [cached, cached])
+        engine.audio_processor.validate_and_info_many.assert_called_once_with([])
+        engine.audio_processor.extract_pcm_stream.assert_not_called()
+
+    def test_batched_accepts_explicit_fp16(self):
+        """Test that batched decoding accepts a caller-supplied fp16 option."""
+        engine = TranscriptionEngine.__new__(TranscriptionEngine)
+        engine.compute_type = "float16"
+        engine.audio_processor = MagicMock()
+        engine.audio_processor.validate_audio_file.return_value = (False, "missing")
+        engine.audio_processor.validate_and_info_many.return_value = []
+
+        # fp16 is also a DecodingOptions field; it must not be passed twice
+        results = engine.transcribe_batch(
+            ["a.wav"], batch_size=16, word_timestamps=False, use_cache=False, fp16=False
+        )
+
+        self.assertEqual(results, [])
+
+    def test_batched_decoding_is_opt_in(self):
+        """Test that transcribe_batch stays sequential unless batch_size is raised."""
+        engine = TranscriptionEngine.__new__(TranscriptionEngine)
+        result = TranscriptionResult(
+            text="hello", language="en", segments=[], duration=1.0, model_name="tiny"
+        )
+
+        with (
+            patch.object(engine, "_transcribe_batched") as batched,
+            patch.object(
+                engine, "_prepare_input", return_value=SimpleNamespace(cached_result=result)
+            ),
+        ):
+            results = engine.transcribe_batch(["a.wav"], word_timestamps=False)
+
+        self.assertEqual(results, [result])
+        batched.assert_not_called()
+
     def test_model_info_structure(self):
         """Test model info returns proper structure."""
         # Note: This test doesn't actually load the model to save time
@@ -115,6 +332,7 @@ class TestTranscriptionEngine(unittest.TestCase):
         info_keys = [
             "model_name",
             "device",
+            "compute_type",
             "cuda_available",
             "available_models",
             "supported_languages",
@@ -124,6 +342,7 @@ class TestTranscriptionEngine(unittest.TestCase):
         mock_info = {
             "model_name": "base",
             "device": "cpu",
+            "compute_type": "float32",
             "cuda_available": False,
             "available_models": Config.AVAILABLE_MODELS,
             "supported_languages": len(Config.SUPPORTED_LANGUAGES),
@@ -248,6 +467,401 @@ This is the second segment.
         shutil.rmtree(self.temp_dir, ignore_errors=True)
 
 
+class TestFileWriter(unittest.TestCase):
+    """Test cases for batched file writing."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def test_write_many_preserves_order_and_content(self):
+        """Test that all files are written and returned in input order."""
+        items = [(self.temp_dir / f"file{i}.txt", f"content {i}".encode()) for i in range(5)]
+
+        paths = write_many(items)
+
+        self.assertEqual(paths, [path for path, _ in items])
+        for path, data in items:
+            self.assertEqual(path.read_bytes(), data)
+
+    def test_write_many_empty(self):
+        """Test that an empty batch is a no-op."""
+        self.assertEqual(write_many([]), [])
+
+    def test_write_many_failure(self):
+        """Test that write errors are surfaced as RuntimeError."""
+        with self.assertRaises(RuntimeError):
+            write_many([(self.temp_dir / "missing" / "file.txt", b"data")])
+
+    def test_write_many_checked_reports_each_failure(self):
+        """Test that one failed write does not stop or hide the others."""
+        items = [
+            (self.temp_dir / "missing" / "a.txt", b"a"),
+            (self.temp_dir / "b.txt", b"b"),
+            (self.temp_dir / "missing" / "c.txt", b"c"),
+        ]
+
+        results = write_many_checked(items)
+
+        self.assertEqual([path for path, _ in results], [path for path, _ in items])
+        self.assertIsNotNone(results[0][1])
+        self.assertIsNone(results[1][1])
+        self.assertIsNotNone(results[2][1])
+        self.assertEqual(items[1][0].read_bytes(), b"b")
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        import shutil
+
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+
+class TestTranscriptionCache(unittest.TestCase):
+    """Test cases for the on-disk transcription cache."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.cache = TranscriptionCache(self.temp_dir / "cache")
+        self.audio_path = self.temp_dir / "audio.wav"
+        self.audio_path.write_bytes(b"fake audio data")
+
+    def test_miss_then_hit(self):
+        """Test that a stored result is returned for the same key."""
+        key = self.cache.make_key(self.audio_path, "base", None, word_timestamps=True)
+        self.assertIsNone(self.cache.get(key))
+
+        result = TranscriptionResult(
+            text="hello world", language="en", segments=[], duration=1.0, model_name="base"
+        )
+        self.cache.put(key, result)
+
+        cached = self.cache.get(key)
+        self.assertEqual(cached.text, "hello world")
+        self.assertEqual(cached.word_count, 2)
+
+    def test_key_depends_on_content_and_options(self):
+        """Test that keys change with file content, model, language, and options."""
+        key = self.cache.make_key(self.audio_path, "base", None, word_timestamps=True)
+
+        self.assertNotEqual(key, self.cache.make_key(self.audio_path, "small", None))
+        self.assertNotEqual(key, self.cache.make_key(self.audio_path, "base", "en"))
+        self.assertNotEqual(
+            key, self.cache.make_key(self.audio_path, "base", None, word_timestamps=False)
+        )
+
+        self.audio_path.write_bytes(b"different audio data")
+        self.assertNotEqual(
+            key, self.cache.make_key(self.audio_path, "base", None, word_timestamps=True)
+        )
+
+    def test_file_hash_is_memoized(self):
+        """Test that an unchanged file is hashed only once across keys."""
+        with patch.object(
+            TranscriptionCache, "_hash_file", wraps=TranscriptionCache._hash_file
+        ) as hash_file:
+            self.cache.make_key(self.audio_path, "base", None)
+            self.cache.make_key(self.audio_path, "small", None)
+            self.assertEqual(hash_file.call_count, 1)
+
+    def test_corrupt_entry_is_a_miss(self):
+        """Test that unreadable entries are ignored."""
+        key = self.cache.make_key(self.audio_path, "base", None)
+        self.cache.cache_dir.mkdir(parents=True)
+        (self.cache.cache_dir / f"{key}.pkl").write_bytes(b"not a pickle")
+
+        self.assertIsNone(self.cache.get(key))
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        import shutil
+
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+
+class TestMusicTranscriptionEngine(unittest.TestCase):
+    """Test cases for MusicTranscriptionEngine's own Basic Pitch windowing."""
+
+    def setUp(self):
+        """Set up an engine whose model reads note activations off the audio."""
+        from basic_pitch.constants import ANNOT_N_FRAMES, FFT_HOP, N_FREQ_BINS_CONTOURS
+        from src.music_transcription_engine import MusicTranscriptionEngine
+
+        def predict(batch):
+            # Each frame activates the pitch encoded by the sample it starts at, with an
+            # onset where the activation begins
+            values = batch[:, ::FFT_HOP, 0][:, :ANNOT_N_FRAMES]
+            note = np.zeros(values.shape + (88,), dtype=np.float32)
+            for window, frame in zip(*np.nonzero(values)):
+                note[window, frame, int(values[window, frame])] = 0.9
+            onset = np.zeros_like(note)
+            onset[:, 1:] = np.maximum(note[:, 1:] - note[:, :-1], 0)
+            contour = np.zeros(values.shape + (N_FREQ_BINS_CONTOURS,), dtype=np.float32)
+            return {"note": note, "onset": onset, "contour": contour}
+
+        model = SimpleNamespace(predict=predict)
+        with patch.object(MusicTranscriptionEngine, "_load_model", return_value=model):
+            self.engine = MusicTranscriptionEngine()
+        self.sample_rate = MusicTranscriptionEngine.SAMPLE_RATE
+
+    def test_streaming_matches_whole_output_at_segment_boundaries(self):
+        """Test that streamed notes match note creation on the concatenated output."""
+        self.engine.STREAMING_SEGMENT_SECONDS = 4
+        self.engine.STREAMING_CONTEXT_SECONDS = 1
+        from basic_pitch.constants import ANNOT_N_FRAMES, ANNOTATIONS_FPS, AUDIO_N_SAMPLES, FFT_HOP
+
+        # 0.6 s notes every 1.1 s, so several of them straddle a segment boundary,
+        # plus a short one starting exactly on the boundary frame at 8 s
+        audio = np.zeros(20 * self.sample_rate, dtype=np.float32)
+        for i, start in enumerate(np.arange(0.5, 19.0, 1.1)):
+            begin = int(start * self.sample_rate)
+            audio[begin : begin + int(0.6 * self.sample_rate)] = 40 + i % 12
+        # Model windows hop by AUDIO_N_SAMPLES - 30 * FFT_HOP samples and keep all
+        # but 30 frames, so output frames drift off the FFT_HOP grid across windows
+        window, frame = divmod(8 * ANNOTATIONS_FPS, ANNOT_N_FRAMES - 30)
+        boundary = window * (AUDIO_N_SAMPLES - 30 * FFT_HOP) + frame * FFT_HOP
+        audio[boundary : boundary + int(0.12 * self.sample_rate)] = 60
+
+        _, whole = self.engine._predict_array(audio)
+        streamed = [note for notes in self.engine.transcribe_streaming(audio) for note in notes]
+
+        def summary(notes):
+            return sorted(
+                (round(start, 3), round(end, 3), pitch) for start, end, pitch, *_ in notes
+            )
+
+        self.assertGreater(len(whole), 15)
+        self.assertTrue(any(start < 4 < end for start, end, *_ in whole))
+        self.assertEqual(summary(streamed), summary(whole))
+
+    def test_parse_notes_sorts_stably_and_clamps_velocity(self):
+        """Test note event conversion: stable start-time order, truncated and clamped velocity."""
+        from src.music_transcription_engine import Note
+
+        events = [
+            (1.0, 1.5, 64, 0.5, []),
+            (0.5, 0.75, 60, 1.5, []),
+            (1.0, 2.0, 69, -0.2, []),
+            (0.5, 1.0, 57, 0.999, [1, 2]),
+        ]
+
+        notes = self.engine._parse_notes(events)
+
+        self.assertEqual(
+            notes,
+            [
+                Note(60, 0.5, 0.75, 127, 440.0 * 2 ** (-9 / 12)),
+                Note(57, 0.5, 1.0, 126, 220.0),
+                Note(64, 1.0, 1.5, 63, 440.0 * 2 ** (-5 / 12)),
+                Note(69, 1.0, 2.0, 0, 440.0),
+            ],
+        )
+        self.assertTrue(all(type(note.pitch) is int for note in notes))
+        self.assertTrue(all(type(note.velocity) is int for note in notes))
+        self.assertEqual(self.engine._parse_notes([]), [])
+
+    def test_batch_skips_only_files_that_fail_to_decode(self):
+        """Test that a bad file in a batch skips only that file."""
+        temp_dir = Path(tempfile.mkdtemp())
+        paths = [temp_dir / name for name in ("a.wav", "bad.wav", "c.wav")]
+        for path in paths:
+            path.write_bytes(b"audio")
+
+        def load(path, sr, mono):
+            if path.endswith("bad.wav"):
+                raise RuntimeError("corrupt file")
+            return np.zeros(sr, dtype=np.float32), sr
+
+        try:
+            with (
+                patch("librosa.load", side_effect=load),
+                patch.object(self.engine, "transcribe", side_effect=lambda path, **_: path),
+            ):
+                results = self.engine.transcribe_batch(paths + [temp_dir / "missing.wav"])
+        finally:
+            import shutil
+
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+        self.assertEqual(results, [paths[0], paths[2]])
+
+
+class TestAudioAnalyzer(unittest.TestCase):
+    """Test cases for AudioAnalyzer."""
+
+    def setUp(self):
+        """Set up an analyzer and a short synthetic signal."""
+        from src.audio_analyzer import AudioAnalyzer
+
+        self.analyzer = AudioAnalyzer(num_workers=1)
+        self.sr = self.analyzer.sample_rate
+        # 38 frames: not a multiple of the block size used below
+        t = np.arange(37 * self.analyzer.hop_length + 123) / self.sr
+        noise = np.random.default_rng(0).standard_normal(len(t))
+        self.y = (0.5 * np.sin(2 * np.pi * 440 * t) + 0.1 * noise).astype(np.float32)
+
+        # analyze() memoizes results on the class; start and end each test empty
+        self.temp_dir = Path(tempfile.mkdtemp())
+        AudioAnalyzer._analysis_cache.clear()
+
+    def _write_audio(self, name, seconds=1.0):
+        """Write a mono WAV of the synthetic signal (tiled to length) to the temp dir."""
+        import soundfile
+
+        path = self.temp_dir / name
+        soundfile.write(path, np.resize(self.y, int(seconds * self.sr)), self.sr)
+        return path
+
+    def _analyze_counting_loads(self, *calls):
+        """Run (analyzer, path) analyses and return the results and the number of decodes."""
+        from src.audio_analyzer import AudioAnalyzer
+
+        with patch.object(
+            AudioAnalyzer, "_load", autospec=True, side_effect=AudioAnalyzer._load
+        ) as load:
+            results = [analyzer.analyze(path) for analyzer, path in calls]
+        return results, load.call_count
+
+    def test_analysis_cache_hit_returns_equal_copy(self):
+        """Test that re-analyzing an unchanged file returns a copy of the memoized result."""
+        path = self._write_audio("a.wav")
+
+        (first, second, third), loads = self._analyze_counting_loads(
+            (self.analyzer, path), (self.analyzer, path), (self.analyzer, path)
+        )
+
+        self.assertEqual(loads, 1)
+        self.assertIsNot(second, first)
+        self.assertIsNot(third, second)
+        self.assertEqual(second.tempo, first.tempo)
+        self.assertEqual(second.key, first.key)
+        np.testing.assert_array_equal(second.onsets, first.onsets)
+        self.assertEqual(second.metadata, first.metadata)
+        self.assertIsNot(second.metadata, first.metadata)
+
+    def test_analysis_cache_misses_on_changed_file(self):
+        """Test that a new mtime or size invalidates the memoized analysis."""
+        path = self._write_audio("a.wav")
+        _, loads = self._analyze_counting_loads((self.analyzer, path))
+
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        _, touched_loads = self._analyze_counting_loads((self.analyzer, path))
+
+        mtime_ns = os.stat(path).st_mtime_ns
+        self._write_audio("a.wav", seconds=1.5)
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+        _, resized_loads = self._analyze_counting_loads((self.analyzer, path))
+
+        self.assertEqual((loads, touched_loads, resized_loads), (1, 1, 1))
+
+    def test_analysis_cache_misses_on_different_settings(self):
+        """Test that analyzers with other onset or chroma settings do not share results."""
+        from src.audio_analyzer import AudioAnalyzer
+
+        path = self._write_audio("a.wav")
+        other_backend = next(
+            backend
+            for backend in Config.AVAILABLE_ONSET_BACKENDS
+            if backend != self.analyzer.onset_backend
+        )
+        other_chroma = next(
+            chroma for chroma in Config.AVAILABLE_KEY_CHROMAS if chroma != self.analyzer.key_chroma
+        )
+
+        _, loads = self._analyze_counting_loads(
+            (self.analyzer, path),
+            (AudioAnalyzer(onset_backend=other_backend, num_workers=1), path),
+            (AudioAnalyzer(key_chroma=other_chroma, num_workers=1), path),
+        )
+
+        self.assertEqual(loads, 3)
+
+    def test_analysis_cache_evicts_least_recently_used(self):
+        """Test that the memo holds at most ANALYSIS_CACHE_SIZE results."""
+        from src.audio_analyzer import AudioAnalyzer
+
+        first, second = self._write_audio("a.wav"), self._write_audio("b.wav")
+
+        with patch.object(AudioAnalyzer, "ANALYSIS_CACHE_SIZE", 1):
+            _, loads = self._analyze_counting_loads(
+                (self.analyzer, first), (self.analyzer, second), (self.analyzer, first)
+            )
+
+        self.assertEqual(loads, 3)
+        self.assertEqual(len(AudioAnalyzer._analysis_cache), 1)
+
+    def test_blocked_spectral_features_match_librosa(self):
+        """Test that the blocked STFT features match librosa's one-pass features."""
+        import librosa
+
+        self.analyzer.STFT_BLOCK_FRAMES = 16
+        n_fft, hop = self.analyzer.N_FFT, self.analyzer.hop_length
+
+        mel, centroid, rms, chroma = self.analyzer._spectral_features(self.y, self.sr, chroma=True)
+
+        expected_mel = librosa.power_to_db(
+            librosa.feature.melspectrogram(y=self.y, sr=self.sr, n_fft=n_fft, hop_length=hop)
+        )
+        expected_centroid = librosa.feature.spectral_centroid(
+            y=self.y, sr=self.sr, n_fft=n_fft, hop_length=hop
+        )
+        expected_rms = librosa.feature.rms(y=self.y, frame_length=n_fft, hop_length=hop)
+
+        self.assertEqual(mel.shape, expected_mel.shape)
+        np.testing.assert_allclose(mel, expected_mel, atol=1e-4)
+        self.assertAlmostEqual(centroid, float(np.mean(expected_centroid)), places=3)
+        self.assertAlmostEqual(rms, float(np.mean(expected_rms)), places=6)
+        np.testing.assert_allclose(chroma, self.analyzer._stft_chroma(sr=self.sr, y=self.y))
+
+    def test_detect_key_matches_rolled_profile_correlation(self):
+        """Test that the key profile matrix picks the key a per-key correlation loop picks."""
+        analyzer = self.analyzer
+        rng = np.random.default_rng(1)
+
+        for _ in range(50):
+            chroma_mean = rng.random(12)
+            correlations = {}
+            for i, name in enumerate(analyzer.KEY_NAMES):
+                for mode, profile in (
+                    ("major", analyzer.MAJOR_PROFILE),
+                    ("minor", analyzer.MINOR_PROFILE),
+                ):
+                    matrix = np.corrcoef(chroma_mean, np.roll(profile, i))
+                    correlations[f"{name} {mode}"] = matrix[0, 1]
+            expected = max(correlations, key=correlations.get)
+
+            self.assertEqual(analyzer._detect_key(None, self.sr, chroma_mean[:, None]), expected)
+
+    @unittest.skipUnless(importlib.util.find_spec("numba"), "numba is not installed")
+    def test_numba_onset_strength_matches_librosa(self):
+        """Test that the compiled spectral flux envelope matches librosa's, offset included."""
+        import librosa
+
+        mel = self.analyzer._spectral_features(self.y, self.sr)[0]
+
+        envelope = self.analyzer._onset_strength(mel)
+
+        expected = librosa.onset.onset_strength(
+            S=mel, sr=self.sr, hop_length=self.analyzer.hop_length
+        )
+        self.assertEqual(envelope.shape, expected.shape)
+        np.testing.assert_allclose(envelope, expected, rtol=1e-5, atol=1e-5)
+
+    def test_detect_key_flat_chroma_is_unknown(self):
+        """Test that a flat chroma vector (e.g. silence) has no key."""
+        self.assertEqual(self.analyzer._detect_key(None, self.sr, np.ones((12, 4))), "Unknown")
+
+    def tearDown(self):
+        """Clean up temporary files and memoized analyses."""
+        import shutil
+
+        from src.audio_analyzer import AudioAnalyzer
+
+        AudioAnalyzer._analysis_cache.clear()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+
 class TestIntegration(unittest.TestCase):
     """Integration tests (require actual audio files)."""
 